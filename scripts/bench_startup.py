@@ -0,0 +1,235 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Measure pytui startup time.
+
+Records:
+* import_ui - time to import the entry point and the UI module in a fresh interpreter
+* config_from_file - time to load an existing config file
+* first_populated_paint - time from creating ManagerApp until both tables have rows
+
+Discovery uses the example data in tests/example_data/pythonfinder unless --live is given.
+Results can be saved as the baselines used by the pytest benchmarks or compared against them.
+
+--discovery times the real local venv, global venv and runtime discovery sources
+run one after another and concurrently through the discovery pipeline.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+
+from contextlib import ExitStack
+from pathlib import Path
+from unittest.mock import patch
+
+base_dir = Path(__file__).parents[1]
+data_folder = base_dir / "tests" / "example_data" / "pythonfinder"
+baseline_file = base_dir / "tests" / "benchmark_baselines.json"
+
+# Timing helpers are shared with the pytest benchmarks
+sys.path.insert(0, str(base_dir / "tests"))
+from benchmark_helpers import time_import, time_to_populated_tables  # noqa: E402
+
+
+def bench_config(repeat: int) -> float:
+    from ducktools.pytui.config import Config
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_file = str(Path(tmpdir) / "config.json")
+        Config(config_file=config_file).write_config()
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            Config.from_file(config_file)
+            timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def example_patches(stack: ExitStack) -> None:
+    from ducktools.pythonfinder import PythonInstall
+    from ducktools.pythonfinder.venv import PythonVEnv
+    from ducktools.pytui.config import Config
+
+    config = Config(config_file=str(Path(tempfile.gettempdir()) / "pytui_bench_config.json"))
+
+    runtimes = [
+        PythonInstall.from_json(**inst)
+        for inst in json.loads((data_folder / "runtimes_data.json").read_text())
+    ]
+
+    def load_venvs(filename):
+        return [
+            PythonVEnv(
+                folder=v["folder"],
+                executable=v["executable"],
+                version=tuple(v["version"]),
+                parent_path=v["parent_path"],
+                _parent_executable=v["_parent_executable"],
+            )
+            for v in json.loads((data_folder / filename).read_text())
+        ]
+
+    local_venvs = load_venvs("local_venvs.json")
+    global_venvs = load_venvs("global_venvs.json")
+
+    def get_venvs(base_dir=None, recursive=False, search_parent_folders=False, limits=None):
+        if base_dir == config.global_venv_folder:
+            return global_venvs
+        return local_venvs
+
+    stack.enter_context(patch.object(Config, "from_file", return_value=config))
+    stack.enter_context(patch.object(Config, "write_config"))
+    stack.enter_context(patch("ducktools.pytui.ui.list_installs_deduped", return_value=runtimes))
+    stack.enter_context(patch("ducktools.pytui.ui.iter_venvs", side_effect=get_venvs))
+    stack.enter_context(patch("ducktools.pytui.ui.get_managers", return_value=[]))
+
+
+def bench_first_paint(repeat: int, live: bool) -> float:
+    with ExitStack() as stack:
+        if not live:
+            example_patches(stack)
+        timings = [asyncio.run(time_to_populated_tables()) for _ in range(repeat)]
+    return min(timings)
+
+
+def bench_discovery() -> None:
+    import functools
+    import os
+
+    from ducktools.pytui.config import Config
+    from ducktools.pytui.discovery import DiscoveryTimings, run_sources, scan_venvs
+    from ducktools.pytui.util import list_installs_deduped
+
+    config = Config.from_file()
+    sources = {
+        "local venvs": functools.partial(
+            scan_venvs,
+            base_dir=os.getcwd(),
+            recursive="recursive" in config.venv_search_mode,
+            search_parent_folders="parents" in config.venv_search_mode,
+        ),
+        "global venvs": functools.partial(
+            scan_venvs,
+            base_dir=config.global_venv_folder,
+            recursive=True,
+            search_parent_folders=False,
+        ),
+        "runtimes": list_installs_deduped,
+    }
+
+    sequential = 0.0
+    for name, func in sources.items():
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        sequential += elapsed
+        print(f"sequential {name:<14}{elapsed * 1000:10.2f} ms")
+    print(f"sequential {'total':<14}{sequential * 1000:10.2f} ms")
+
+    async def run_concurrent():
+        timings = DiscoveryTimings()
+        async for _ in run_sources(sources, timings=timings):
+            pass
+        return timings
+
+    timings = asyncio.run(run_concurrent())
+    for name, (start, end) in timings.sources.items():
+        print(f"concurrent {name:<14}{(end - start) * 1000:10.2f} ms")
+    print(f"concurrent {'wall clock':<14}{timings.wall_clock * 1000:10.2f} ms")
+
+
+def compare(results: dict[str, float], baselines: dict[str, float], tolerance: float) -> bool:
+    success = True
+    for name, elapsed in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            print(f"{name}: no baseline stored")
+            continue
+
+        ratio = elapsed / baseline if baseline else float("inf")
+        # Match the absolute slack allowed by the pytest benchmarks
+        if elapsed > baseline * tolerance + 0.002:
+            success = False
+            print(f"{name}: SLOWER {elapsed:.6f}s vs baseline {baseline:.6f}s ({ratio:.2f}x)")
+        else:
+            print(f"{name}: ok {elapsed:.6f}s vs baseline {baseline:.6f}s ({ratio:.2f}x)")
+    return success
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark ducktools-pytui startup")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per benchmark, the fastest is kept")
+    parser.add_argument("--live", action="store_true", help="Use real discovery instead of the example data")
+    parser.add_argument("--baseline", type=Path, default=baseline_file, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="Exit with an error if slower than the baseline")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Allowed slowdown factor for --compare")
+    parser.add_argument(
+        "--discovery",
+        action="store_true",
+        help="Time the live discovery sources sequentially and concurrently instead",
+    )
+    return parser
+
+
+def main() -> int:
+    args = get_parser().parse_args()
+
+    if args.discovery:
+        bench_discovery()
+        return 0
+
+    results = {
+        "import_ui": time_import(args.repeat),
+        "config_from_file": bench_config(args.repeat),
+        "first_populated_paint": bench_first_paint(args.repeat, live=args.live),
+    }
+
+    for name, elapsed in results.items():
+        print(f"{name:<24}{elapsed * 1000:10.2f} ms")
+
+    try:
+        baselines = json.loads(args.baseline.read_text())
+    except FileNotFoundError:
+        baselines = {}
+
+    if args.save_baseline:
+        if args.live:
+            print("Not saving baselines measured with --live")
+            return 1
+        baselines.update({k: round(v, 6) for k, v in results.items()})
+        args.baseline.write_text(json.dumps(baselines, indent=4, sort_keys=True) + "\n")
+        print(f"Baselines saved to {args.baseline}")
+
+    if args.compare and not compare(results, baselines, args.tolerance):
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
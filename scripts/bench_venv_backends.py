@@ -0,0 +1,152 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Compare the time taken to create venvs with each available venv backend.
+
+Each backend creates venvs in a temporary folder for the selected runtime
+with and without pip. The fastest run of each combination is reported.
+Each combination is also timed cloning from a template venv built by
+that backend, the template build itself is not included.
+
+uv keeps a cache of seed packages, so the first uv run with pip may need
+to download them. Use --repeat > 1 so the cached timing is also recorded.
+"""
+import argparse
+import os.path
+import shutil
+import sys
+import tempfile
+import time
+
+from ducktools.pythonfinder import PythonInstall
+
+from ducktools.pytui.util import list_installs_deduped
+from ducktools.pytui.venv_backends import VEnvBackend
+from ducktools.pytui.venv_backends.templates import create_from_template, templates_supported
+
+
+def get_runtime(executable: str | None) -> PythonInstall:
+    if executable is None:
+        executable = os.path.realpath(sys.executable)
+
+    for install in list_installs_deduped():
+        if os.path.samefile(install.executable, executable):
+            return install
+
+    raise RuntimeError(f"Could not find a runtime for {executable!r}")
+
+
+def bench_backend(
+    backend: VEnvBackend,
+    runtime: PythonInstall,
+    include_pip: bool,
+    latest_pip: bool,
+    repeat: int,
+) -> float:
+    timings = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for i in range(repeat):
+            venv_path = os.path.join(tmpdir, f"venv_{i}")
+            start = time.perf_counter()
+            backend.create(runtime, venv_path, include_pip, latest_pip)
+            timings.append(time.perf_counter() - start)
+            shutil.rmtree(venv_path)
+    return min(timings)
+
+
+def bench_template(
+    backend: VEnvBackend,
+    runtime: PythonInstall,
+    include_pip: bool,
+    latest_pip: bool,
+    repeat: int,
+) -> float:
+    timings = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        template_folder = os.path.join(tmpdir, "templates")
+        # Build the template before timing
+        create_from_template(
+            backend, runtime, os.path.join(tmpdir, "warmup"), include_pip, latest_pip, template_folder
+        )
+        for i in range(repeat):
+            venv_path = os.path.join(tmpdir, f"venv_{i}")
+            start = time.perf_counter()
+            create_from_template(
+                backend, runtime, venv_path, include_pip, latest_pip, template_folder
+            )
+            timings.append(time.perf_counter() - start)
+            shutil.rmtree(venv_path)
+    return min(timings)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark ducktools-pytui venv backends")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark, the fastest is kept")
+    parser.add_argument(
+        "--python",
+        action="store",
+        default=None,
+        help="Path to the runtime to base the venvs on (default: this interpreter's base runtime)",
+    )
+    return parser
+
+
+def main() -> int:
+    args = get_parser().parse_args()
+
+    executable = args.python
+    if executable is None and sys.prefix != sys.base_prefix:
+        # Use the runtime this venv is based on
+        executable = getattr(sys, "_base_executable", None)
+
+    runtime = get_runtime(executable)
+    print(f"Runtime: {runtime.implementation} {runtime.version_str} ({runtime.executable})")
+
+    options = {
+        "no pip": (False, True),
+        "latest pip": (True, True),
+        "bundled pip": (True, False),
+    }
+
+    for name, backend_type in VEnvBackend.registry.items():
+        backend = backend_type.get()
+        if backend is None:
+            print(f"{name:<8}not available")
+            continue
+
+        for label, (include_pip, latest_pip) in options.items():
+            if not backend.supports(runtime, include_pip, latest_pip):
+                print(f"{name:<8}{label:<22}{'unsupported':>12}")
+                continue
+            elapsed = bench_backend(backend, runtime, include_pip, latest_pip, args.repeat)
+            print(f"{name:<8}{label:<22}{elapsed * 1000:10.2f} ms")
+
+            if templates_supported(runtime):
+                elapsed = bench_template(backend, runtime, include_pip, latest_pip, args.repeat)
+                print(f"{name:<8}{label + ' (clone)':<22}{elapsed * 1000:10.2f} ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
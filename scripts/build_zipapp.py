@@ -22,6 +22,7 @@
 # SOFTWARE.
 
 # Here we can use pathlib as it's a build script
+import argparse
 import sys
 
 import shutil
@@ -36,10 +37,65 @@ project_build_path = project_path / "build" / "project_build"
 build_path = project_path / "build" / "application"
 build_bin = build_path / "bin"
 dist_path = project_path / "dist" / "pytui.pyz"
-main_func = "ducktools.pytui.__main__:main"
+
+# Used instead of zipapp's generated __main__ so the archive can optionally
+# extract itself to a cache folder before running
+bootstrap_template = """\
+# Generated by scripts/build_zipapp.py
+import sys
+from ducktools.pytui._zipapp import run
+
+sys.exit(run(extract_default={extract}))
+"""
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Build the pytui zipapp")
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help=(
+            "Include .pyc files next to the sources so zipimport doesn't compile on every launch. "
+            "These are only used by the Python version that compiled them."
+        ),
+    )
+    parser.add_argument(
+        "--compile-python",
+        default=sys.executable,
+        help="Python executable used to compile the .pyc files (default: the current Python)",
+    )
+    parser.add_argument(
+        "--extract",
+        action="store_true",
+        help=(
+            "Make the archive extract itself to a cache folder on first launch and run from there. "
+            "PYTUI_ZIPAPP_EXTRACT=0/1 overrides this when running."
+        ),
+    )
+    return parser
+
+
+def compile_build(python: str) -> None:
+    # -b writes legacy .pyc files next to the source, the only location zipimport checks
+    # unchecked-hash avoids zipimport comparing against the zip entry timestamps
+    # Legacy .pyc names carry no optimization tag, so these must be unoptimized.
+    # Optimized bytecode here would be loaded by regular interpreters without
+    # docstrings or asserts, both from the zip and once extracted to __pycache__.
+    subprocess.run(
+        [
+            python, "-m", "compileall",
+            "-q", "-b",
+            "-o", "0",
+            "--invalidation-mode", "unchecked-hash",
+            str(build_path),
+        ],
+        check=True,
+    )
 
 
 def main():
+    args = get_parser().parse_args()
+
     # Prepare install and build paths
     shutil.rmtree(build_path, ignore_errors=True)
     shutil.rmtree(project_build_path, ignore_errors=True)
@@ -82,11 +138,15 @@ def main():
     shutil.rmtree(build_bin)
     shutil.rmtree(project_build_path)
 
+    (build_path / "__main__.py").write_text(bootstrap_template.format(extract=args.extract))
+
+    if args.compile:
+        compile_build(args.compile_python)
+
     zipapp.create_archive(
         build_path,
         dist_path,
         interpreter="/usr/bin/env python3",
-        main=main_func,
     )
 
 
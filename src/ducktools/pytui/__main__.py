@@ -80,12 +80,83 @@ def get_parser() -> _laz.argparse.ArgumentParser:
         help="Set the search mode to be used",
     )
 
+    config_parser.add_argument(
+        "--set-search-max-depth",
+        action="store",
+        type=int,
+        metavar="DEPTH",
+        help="Set the maximum folder depth for recursive venv searches (0 for no limit)",
+    )
+
+    config_parser.add_argument(
+        "--set-search-time-limit",
+        action="store",
+        type=float,
+        metavar="SECONDS",
+        help="Set the time after which venv searches stop early (0 for no limit)",
+    )
+
+    config_parser.add_argument(
+        "--set-search-exclude",
+        action="store",
+        nargs="*",
+        metavar="GLOB",
+        help="Set the folder name globs recursive venv searches don't descend into (none to clear)",
+    )
+
+    config_parser.add_argument(
+        "--set-venv-backend",
+        action="store",
+        choices=_laz_internal.Config.VENV_BACKENDS,
+        help="Set the tool used to create venvs, 'auto' uses uv if it is available",
+    )
+
+    config_parser.add_argument(
+        "--set-venv-pool-size",
+        action="store",
+        type=int,
+        metavar="COUNT",
+        help="Set the number of ready-made global venvs to keep per runtime (0 to disable and clear the pool)",
+    )
+
     config_parser.add_argument(
         "--set-global-venv-dir",
         action="store",
         help="Set the global venv folder",
     )
 
+    gitignore_group = config_parser.add_mutually_exclusive_group()
+    gitignore_group.add_argument(
+        "--search-gitignore",
+        dest="venv_search_gitignore",
+        action="store_true",
+        default=None,
+        help="Skip folders ignored by .gitignore files in recursive venv searches"
+    )
+    gitignore_group.add_argument(
+        "--no-search-gitignore",
+        dest="venv_search_gitignore",
+        action="store_false",
+        default=None,
+        help="Ignore .gitignore files in recursive venv searches"
+    )
+
+    watch_group = config_parser.add_mutually_exclusive_group()
+    watch_group.add_argument(
+        "--watch-venvs",
+        dest="watch_venvs",
+        action="store_true",
+        default=None,
+        help="Update the venv list when venvs are created or deleted outside of pytui"
+    )
+    watch_group.add_argument(
+        "--no-watch-venvs",
+        dest="watch_venvs",
+        action="store_false",
+        default=None,
+        help="Only update the venv list on startup and when refreshed"
+    )
+
     include_pip_group = config_parser.add_mutually_exclusive_group()
     include_pip_group.add_argument(
         "--include-pip",
@@ -118,13 +189,46 @@ def get_parser() -> _laz.argparse.ArgumentParser:
         help="Use the version of pip bundled with the runtime when creating a venv"
     )
 
+    templates_group = config_parser.add_mutually_exclusive_group()
+    templates_group.add_argument(
+        "--use-templates",
+        dest="venv_templates",
+        action="store_true",
+        default=None,
+        help="Clone new venvs from a cached template venv where possible"
+    )
+    templates_group.add_argument(
+        "--no-templates",
+        dest="venv_templates",
+        action="store_false",
+        default=None,
+        help="Always create new venvs from scratch"
+    )
+
+    create_parser = subparsers.add_parser(
+        "create",
+        help="Subcommand for creating several venvs from a manifest file",
+    )
+    create_parser.add_argument(
+        "--manifest",
+        action="store",
+        required=True,
+        metavar="MANIFEST_PATH",
+        help="TOML file with a [[venv]] table for each venv to create",
+    )
+    create_parser.add_argument(
+        "-j", "--jobs",
+        action="store",
+        type=int,
+        default=None,
+        metavar="COUNT",
+        help="Maximum number of venvs to create at once (default: up to 4)",
+    )
+
     return parser
 
 
 def main() -> int:
-    if not sys.stdout.isatty():
-        raise RuntimeError("No TTY detected, exiting")
-
     if sys.version_info < (3, 10):
         v = sys.version_info
         print(
@@ -138,6 +242,10 @@ def main() -> int:
         parser = get_parser()
         args = parser.parse_args()
 
+        if args.subcommand == "create":
+            from .manifest import run_manifest
+            return run_manifest(args.manifest, max_workers=args.jobs)
+
         if args.subcommand == "config":
             from .config import Config
             config = Config.from_file()
@@ -156,6 +264,64 @@ def main() -> int:
                 config.venv_search_mode = search_mode
                 print(f"venv search mode set to '{search_mode}'")
 
+            if (max_depth := args.set_search_max_depth) is not None:
+                update_config = True
+                if max_depth > 0:
+                    config.venv_search_max_depth = max_depth
+                    print(f"venv search max depth set to {max_depth}")
+                else:
+                    config.venv_search_max_depth = None
+                    print("venv search max depth removed")
+
+            if (time_limit := args.set_search_time_limit) is not None:
+                update_config = True
+                if time_limit > 0:
+                    config.venv_search_time_limit = time_limit
+                    print(f"venv search time limit set to {time_limit}s")
+                else:
+                    config.venv_search_time_limit = None
+                    print("venv search time limit removed")
+
+            if (exclude := args.set_search_exclude) is not None:
+                update_config = True
+                config.venv_search_exclude = exclude
+                if exclude:
+                    print(f"venv search exclude globs set to {', '.join(exclude)}")
+                else:
+                    print("venv search exclude globs removed")
+
+            if (use_gitignore := args.venv_search_gitignore) is not None:
+                update_config = True
+                config.venv_search_gitignore = use_gitignore
+                if use_gitignore:
+                    print("venv searches will skip folders ignored by .gitignore files")
+                else:
+                    print("venv searches will not read .gitignore files")
+
+            if (watch_venvs := args.watch_venvs) is not None:
+                update_config = True
+                config.watch_venvs = watch_venvs
+                if watch_venvs:
+                    print("Searched folders will be watched for venv changes")
+                else:
+                    print("Searched folders will not be watched for venv changes")
+
+            if (venv_backend := args.set_venv_backend) is not None:
+                update_config = True
+                config.venv_backend = venv_backend
+                print(f"venv backend set to '{venv_backend}'")
+
+            if (pool_size := args.set_venv_pool_size) is not None:
+                update_config = True
+                if pool_size > 0:
+                    config.venv_pool_size = pool_size
+                    print(f"venv pool size set to {pool_size}")
+                else:
+                    from .venv_backends.pool import clear_pools
+                    config.venv_pool_size = 0
+                    clear_pools()
+                    print("venv pool disabled and cleared")
+
             if (venv_path := args.set_global_venv_dir) is not None:
                 update_config = True
                 venv_path = os.path.expanduser(venv_path)
@@ -178,6 +344,14 @@ def main() -> int:
                 else:
                     print("New venvs with pip will use the bundled pip")
 
+            if (venv_templates := args.venv_templates) is not None:
+                update_config = True
+                config.venv_templates = venv_templates
+                if venv_templates:
+                    print("New venvs will be cloned from template venvs where possible")
+                else:
+                    print("New venvs will always be created from scratch")
+
             if update_config:
                 config.write_config()
             else:
@@ -192,6 +366,9 @@ def main() -> int:
                 print("\nFor editing options, check '--help'")
 
     else:
+        if not sys.stdout.isatty():
+            raise RuntimeError("No TTY detected, exiting")
+
         if sys.platform == "win32":
             _check_windows_dir()
 
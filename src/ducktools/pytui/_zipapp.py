@@ -0,0 +1,205 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Support for running the zipapp build extracted to a cache folder
+# Only the standard library and this package should be used before extraction
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import os
+import os.path
+import shutil
+import sys
+import time
+import zipfile
+import zipimport
+
+from ._version import __version__
+from .platform_paths import ZIPAPP_FOLDER
+
+
+EXTRACT_ENV_VAR = "PYTUI_ZIPAPP_EXTRACT"
+COMPLETE_MARKER = ".pytui_extracted"
+STALE_EXTRACT_SECONDS = 30 * 24 * 60 * 60
+
+
+def get_archive_path() -> str | None:
+    """
+    :return: Path to the zipapp archive if running from one, otherwise None
+    """
+    loader = globals().get("__loader__")
+    if isinstance(loader, zipimport.zipimporter):
+        return loader.archive
+    return None
+
+
+def extract_enabled(default: bool = False) -> bool:
+    """
+    Check the environment to see if the archive should be extracted before running
+
+    :param default: Value to use if the environment variable is not set
+    :return: True if the archive should be extracted
+    """
+    value = os.environ.get(EXTRACT_ENV_VAR, "").strip().lower()
+    if value in {"1", "true", "yes", "on"}:
+        return True
+    elif value in {"0", "false", "no", "off"}:
+        return False
+    return default
+
+
+def get_extract_folder(archive_path: str, base_folder: str = ZIPAPP_FOLDER) -> str:
+    """
+    Get the versioned folder the archive will be extracted into.
+
+    Rebuilding or replacing the archive changes the size/mtime and so the folder.
+    """
+    stat = os.stat(archive_path)
+    key = (
+        f"{__version__}-{sys.implementation.cache_tag}"
+        f"-{stat.st_size:x}-{stat.st_mtime_ns:x}"
+    )
+    return os.path.join(base_folder, key)
+
+
+def _extract_member(archive: zipfile.ZipFile, info: zipfile.ZipInfo, dest: str, names: set[str]) -> None:
+    name = info.filename
+
+    # Legacy .pyc files next to their source are only used by zipimport
+    # If they match this interpreter, place them in __pycache__ so the
+    # extracted copy doesn't need to compile anything
+    if name.endswith(".pyc") and name[:-1] in names:
+        data = archive.read(info)
+        if data[:4] == importlib.util.MAGIC_NUMBER:
+            source_path = os.path.join(dest, *name[:-1].split("/"))
+            cache_path = importlib.util.cache_from_source(source_path)
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "wb") as f:
+                f.write(data)
+        return
+
+    archive.extract(info, dest)
+
+
+def extract_archive(archive_path: str, dest: str) -> str:
+    """
+    Extract the archive to dest if it has not already been extracted.
+
+    Extraction happens in a temporary folder which is renamed into place,
+    so an interrupted extraction is never used.
+
+    :param archive_path: Path to the zipapp
+    :param dest: Destination folder
+    :return: The destination folder
+    """
+    if os.path.exists(os.path.join(dest, COMPLETE_MARKER)):
+        return dest
+
+    base_folder = os.path.dirname(dest)
+    os.makedirs(base_folder, exist_ok=True)
+    tmp_dest = f"{dest}.tmp{os.getpid()}"
+
+    try:
+        with zipfile.ZipFile(archive_path) as archive:
+            names = set(archive.namelist())
+            for info in archive.infolist():
+                _extract_member(archive, info, tmp_dest, names)
+
+        with open(os.path.join(tmp_dest, COMPLETE_MARKER), "w") as f:
+            f.write(archive_path)
+
+        try:
+            os.replace(tmp_dest, dest)
+        except OSError:
+            # Another process finished extracting first
+            if not os.path.exists(os.path.join(dest, COMPLETE_MARKER)):
+                raise
+    finally:
+        shutil.rmtree(tmp_dest, ignore_errors=True)
+
+    return dest
+
+
+def remove_stale_extractions(current: str, max_age: float = STALE_EXTRACT_SECONDS) -> None:
+    """
+    Remove extracted archives that haven't been used recently
+    """
+    base_folder = os.path.dirname(current)
+    now = time.time()
+
+    # Update the marker so the folder in use is never considered stale
+    os.utime(os.path.join(current, COMPLETE_MARKER))
+
+    with os.scandir(base_folder) as entries:
+        for entry in entries:
+            if entry.path == current or not entry.is_dir():
+                continue
+            try:
+                last_used = os.stat(os.path.join(entry.path, COMPLETE_MARKER)).st_mtime
+            except FileNotFoundError:
+                last_used = entry.stat().st_mtime
+            if now - last_used > max_age:
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def _switch_to_folder(archive_path: str, folder: str) -> None:
+    # Replace the archive on sys.path with the extracted folder
+    # and drop the modules that have already been imported from the archive
+    sys.path[:] = [folder if p == archive_path else p for p in sys.path]
+    for name in list(sys.modules):
+        if name == "ducktools" or name.startswith("ducktools."):
+            del sys.modules[name]
+    importlib.invalidate_caches()
+
+
+def run(extract_default: bool = False) -> int:
+    """
+    Entry point used by the zipapp __main__.py
+
+    :param extract_default: Extract the archive if PYTUI_ZIPAPP_EXTRACT is not set
+    :return: exit code from ducktools.pytui.__main__.main
+    """
+    archive_path = get_archive_path()
+
+    if archive_path and extract_enabled(extract_default):
+        if sys.platform == "win32":
+            # This check needs to run while still inside the archive
+            from .__main__ import _check_windows_dir
+            _check_windows_dir()
+
+        try:
+            folder = extract_archive(archive_path, get_extract_folder(archive_path))
+        except OSError:
+            # Fall back to running from the archive
+            folder = None
+
+        if folder:
+            _switch_to_folder(archive_path, folder)
+            try:
+                remove_stale_extractions(folder)
+            except OSError:
+                pass
+
+    from ducktools.pytui.__main__ import main
+    return main()
@@ -25,7 +25,6 @@ from __future__ import annotations
 import os
 import os.path
 import shutil
-import subprocess
 
 from ducktools.pythonfinder import PythonInstall
 from ducktools.pythonfinder.venv import PythonVEnv
@@ -33,6 +32,9 @@ from ducktools.pythonfinder.venv import PythonVEnv
 from ._version import __version__
 from .shells import Shell
 from .util import run
+from .venv_backends import get_backend
+from .venv_backends.pool import pool_supported, start_refill, take_venv
+from .venv_backends.templates import create_from_template, templates_supported
 
 
 WIN_HISTORY_FIXED = False
@@ -59,33 +61,51 @@ def create_venv(
     python_runtime: PythonInstall,
     venv_path: str = ".venv",
     include_pip: bool = True,
-    latest_pip: bool = True
+    latest_pip: bool = True,
+    backend: str = "venv",
+    use_template: bool = False,
+    pool_size: int = 0,
 ) -> PythonVEnv:
-    # Unlike the regular venv command defaults this will create an environment
-    # and download the *newest* pip (assuming the parent venv includes pip)
-
+    """
+    Create a new venv based on a python runtime
+
+    :param python_runtime: Python install the venv is based on
+    :param venv_path: Path to the new venv folder
+    :param include_pip: Include pip in the venv
+    :param latest_pip: Upgrade pip to the latest version
+    :param backend: Name of the creation backend - "venv", "uv" or "auto"
+    :param use_template: Clone the venv from a cached template venv where supported
+    :param pool_size: Take the venv from a pool of ready venvs and refill the pool
+                      to this size in the background, 0 to not use the pool
+    :return: PythonVEnv for the new environment
+    """
     if os.path.exists(venv_path):
         raise FileExistsError(f"VEnv '{venv_path}' already exists.")
 
-    python_exe = python_runtime.executable
+    venv_backend = get_backend(backend, python_runtime, include_pip, latest_pip)
 
-    # Also always include the pip bundled with graalpy and don't update
-    is_graalpy = python_runtime.implementation == "graalpy"
+    use_pool = pool_size > 0 and pool_supported(python_runtime)
+    new_venv = None
 
-    venv_cmd = [python_exe, "-m", "venv", venv_path]
-    if not is_graalpy:
-        if not include_pip:
-            venv_cmd.append("--without-pip")
-        elif latest_pip and python_runtime.version >= (3, 9):
-            venv_cmd.append("--upgrade-deps")
+    if use_pool:
+        new_venv = take_venv(
+            venv_backend, python_runtime, venv_path, include_pip, latest_pip
+        )
 
-    # These tasks run in the background so don't need to block ctrl+c
-    # Capture output to not mess with the textual display
-    subprocess.run(venv_cmd, capture_output=True, check=True)
+    if new_venv is None:
+        if use_template and templates_supported(python_runtime):
+            new_venv = create_from_template(
+                venv_backend, python_runtime, venv_path, include_pip, latest_pip
+            )
+        else:
+            new_venv = venv_backend.create(python_runtime, venv_path, include_pip, latest_pip)
 
-    config_path = os.path.join(os.path.realpath(venv_path), "pyvenv.cfg")
+    if use_pool:
+        start_refill(
+            venv_backend, python_runtime, include_pip, latest_pip, pool_size, use_template
+        )
 
-    return PythonVEnv.from_cfg(config_path)
+    return new_venv
 
 
 def delete_venv(venv: PythonVEnv) -> None:
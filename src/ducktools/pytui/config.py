@@ -41,11 +41,28 @@ class Config(Prefab, kw_only=True):
     VENV_SEARCH_MODES: ClassVar[list[str]] = [
         "cwd", "parents", "recursive", "recursive_parents"
     ]
+    VENV_BACKENDS: ClassVar[list[str]] = ["venv", "uv", "auto"]
+    # Folders that are not descended into by recursive searches
+    DEFAULT_VENV_SEARCH_EXCLUDE: ClassVar[list[str]] = [
+        ".git", ".hg", ".svn", ".tox", ".nox", "node_modules", "__pycache__",
+        ".mypy_cache", ".pytest_cache", ".ruff_cache", "build", "dist", "*.egg-info",
+    ]
 
     config_file: str = attribute(default=CONFIG_FILE, serialize=False)
     venv_search_mode: str = "parents"
+    venv_search_max_depth: int | None = None
+    venv_search_time_limit: float | None = 30.0
+    venv_search_exclude: list[str] = attribute(
+        default_factory=lambda: list(Config.DEFAULT_VENV_SEARCH_EXCLUDE)
+    )
+    venv_search_gitignore: bool = False
+    watch_venvs: bool = False
+    download_cache_ttl: float | None = 24 * 60 * 60
     include_pip: bool = True
     latest_pip: bool = True
+    venv_backend: str = "venv"
+    venv_templates: bool = False
+    venv_pool_size: int = 0
     global_venv_folder: str = GLOBAL_VENV_FOLDER
     shell_path: str | None = None
     theme: str = "textual-dark"
@@ -90,24 +107,69 @@ class Config(Prefab, kw_only=True):
                     raw_input = {}
 
             venv_search_mode = raw_input.get("venv_search_mode", "parents")
+            venv_search_max_depth = raw_input.get("venv_search_max_depth", None)
+            venv_search_time_limit = raw_input.get("venv_search_time_limit", 30.0)
+            venv_search_exclude = raw_input.get("venv_search_exclude", cls.DEFAULT_VENV_SEARCH_EXCLUDE)
+            venv_search_gitignore = raw_input.get("venv_search_gitignore", False)
+            watch_venvs = raw_input.get("watch_venvs", False)
+            download_cache_ttl = raw_input.get("download_cache_ttl", 24 * 60 * 60)
             include_pip = raw_input.get("include_pip", True)
             latest_pip = raw_input.get("latest_pip", True)
+            venv_backend = raw_input.get("venv_backend", "venv")
+            venv_templates = raw_input.get("venv_templates", False)
+            venv_pool_size = raw_input.get("venv_pool_size", 0)
             global_venv_folder = raw_input.get("global_venv_folder", GLOBAL_VENV_FOLDER)
             shell_path = raw_input.get("shell_path", None)
             theme = raw_input.get("theme", "textual-dark")
 
             if venv_search_mode not in cls.VENV_SEARCH_MODES:
                 venv_search_mode = "parents"
+            if venv_search_max_depth is not None and (
+                type(venv_search_max_depth) is not int or venv_search_max_depth < 1
+            ):
+                venv_search_max_depth = None
+            if venv_search_time_limit is not None and (
+                type(venv_search_time_limit) not in {int, float} or venv_search_time_limit <= 0
+            ):
+                venv_search_time_limit = 30.0
+            if not (
+                isinstance(venv_search_exclude, list)
+                and all(isinstance(item, str) for item in venv_search_exclude)
+            ):
+                venv_search_exclude = cls.DEFAULT_VENV_SEARCH_EXCLUDE
+            if not isinstance(venv_search_gitignore, bool):
+                venv_search_gitignore = False
+            if not isinstance(watch_venvs, bool):
+                watch_venvs = False
+            if download_cache_ttl is not None and (
+                type(download_cache_ttl) not in {int, float} or download_cache_ttl < 0
+            ):
+                download_cache_ttl = 24 * 60 * 60
             if not isinstance(include_pip, bool):
                 include_pip = True
             if not isinstance(latest_pip, bool):
                 latest_pip = True
+            if venv_backend not in cls.VENV_BACKENDS:
+                venv_backend = "venv"
+            if not isinstance(venv_templates, bool):
+                venv_templates = False
+            if type(venv_pool_size) is not int or venv_pool_size < 0:
+                venv_pool_size = 0
 
             config = cls(
                 config_file=config_file,
                 venv_search_mode=venv_search_mode,
+                venv_search_max_depth=venv_search_max_depth,
+                venv_search_time_limit=venv_search_time_limit,
+                venv_search_exclude=list(venv_search_exclude),
+                venv_search_gitignore=venv_search_gitignore,
+                watch_venvs=watch_venvs,
+                download_cache_ttl=download_cache_ttl,
                 include_pip=include_pip,
                 latest_pip=latest_pip,
+                venv_backend=venv_backend,
+                venv_templates=venv_templates,
+                venv_pool_size=venv_pool_size,
                 global_venv_folder=global_venv_folder,
                 shell_path=shell_path,
                 theme=theme,
@@ -0,0 +1,46 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+from .runtime_cache import (
+    get_runtime_cache_key as get_runtime_cache_key,
+    load_cached_installs as load_cached_installs,
+    save_cached_installs as save_cached_installs,
+)
+from .venv_index import (
+    ScanLimits as ScanLimits,
+    VEnvIndex as VEnvIndex,
+    iter_venvs as iter_venvs,
+    load_cached_venvs as load_cached_venvs,
+    scan_venvs as scan_venvs,
+)
+from .pipeline import (
+    DiscoveryTimings as DiscoveryTimings,
+    run_discovery as run_discovery,
+    run_sources as run_sources,
+    stream_discovery as stream_discovery,
+)
+from .watcher import (
+    VEnvWatcher as VEnvWatcher,
+    watched_parent_folders as watched_parent_folders,
+)
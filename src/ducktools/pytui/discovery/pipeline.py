@@ -0,0 +1,196 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Run the independent discovery sources (local venvs, global venvs, runtimes)
+concurrently on a small dedicated thread pool, yielding results as each completes.
+
+Sources that produce results incrementally can instead be streamed in batches
+with `stream_discovery`.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from ducktools.classbuilder.prefab import Prefab, attribute
+
+
+T = TypeVar("T")
+
+# One worker per discovery source with one spare for cache loading
+DISCOVERY_WORKERS = 4
+
+# Time to collect streamed results before passing them on as a batch
+STREAM_BATCH_INTERVAL = 0.05
+
+
+@functools.lru_cache(maxsize=None)
+def get_discovery_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool used for discovery, kept separate from the event loop's default
+    executor so slow discovery can't hold up other background tasks.
+    """
+    return ThreadPoolExecutor(
+        max_workers=DISCOVERY_WORKERS,
+        thread_name_prefix="pytui-discovery",
+    )
+
+
+class DiscoveryTimings(Prefab):
+    """
+    Record start and end times of discovery sources
+    """
+    sources: dict[str, tuple[float, float]] = attribute(default_factory=dict)
+
+    def record(self, name: str, start: float, end: float) -> None:
+        self.sources[name] = (start, end)
+
+    @property
+    def wall_clock(self) -> float:
+        if not self.sources:
+            return 0.0
+        starts, ends = zip(*self.sources.values())
+        return max(ends) - min(starts)
+
+    def summary(self) -> str:
+        parts = [f"{name}: {end - start:.3f}s" for name, (start, end) in self.sources.items()]
+        parts.append(f"wall clock: {self.wall_clock:.3f}s")
+        return ", ".join(parts)
+
+
+async def run_discovery(
+    func: Callable[..., T],
+    *args,
+    name: str | None = None,
+    timings: DiscoveryTimings | None = None,
+    **kwargs,
+) -> T:
+    """
+    Run a blocking discovery function on the discovery executor
+
+    :param func: Function to run
+    :param name: Name to record the timing under
+    :param timings: DiscoveryTimings to record the timing in
+    :return: Result of func
+    """
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    result = await loop.run_in_executor(
+        get_discovery_executor(),
+        functools.partial(func, *args, **kwargs),
+    )
+    if timings is not None and name is not None:
+        timings.record(name, start, time.perf_counter())
+    return result
+
+
+async def run_sources(
+    sources: Mapping[str, Callable[[], Any]],
+    timings: DiscoveryTimings | None = None,
+) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Run discovery sources concurrently, yielding (name, result) as each completes.
+
+    :param sources: Mapping of source name to a function taking no arguments
+    :param timings: DiscoveryTimings to record source timings in
+    """
+    async def run_named(name, func):
+        return name, await run_discovery(func, name=name, timings=timings)
+
+    tasks = [asyncio.ensure_future(run_named(name, func)) for name, func in sources.items()]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def stream_discovery(
+    func: Callable[..., Iterable[T]],
+    *args,
+    name: str | None = None,
+    timings: DiscoveryTimings | None = None,
+    batch_interval: float = STREAM_BATCH_INTERVAL,
+    **kwargs,
+) -> AsyncIterator[list[T]]:
+    """
+    Iterate over a blocking generator on the discovery executor, yielding
+    lists of results collected over each batch interval.
+
+    The first batch is yielded one interval after the first result arrives,
+    instead of waiting for the whole search to complete.
+
+    :param func: Function returning an iterable of results
+    :param name: Name to record the timing under
+    :param timings: DiscoveryTimings to record the timing in
+    :param batch_interval: Seconds to collect results before yielding a batch
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    finished = object()
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for item in func(*args, **kwargs):
+                if stop.is_set():
+                    break
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+        finally:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, finished)
+            except RuntimeError:
+                # The event loop has already closed
+                pass
+
+    start = time.perf_counter()
+    producer = loop.run_in_executor(get_discovery_executor(), produce)
+    try:
+        done = False
+        while not done:
+            batch = [await queue.get()]
+            if batch[0] is not finished:
+                await asyncio.sleep(batch_interval)
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+
+            if batch[-1] is finished:
+                done = True
+                batch.pop()
+
+            if batch:
+                yield batch
+
+        # Raise any exception from the generator
+        await producer
+        if timings is not None and name is not None:
+            timings.record(name, start, time.perf_counter())
+    finally:
+        stop.set()
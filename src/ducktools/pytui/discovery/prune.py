@@ -0,0 +1,143 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Rules for skipping folders that can't contain venvs during recursive searches.
+
+Folder names are matched against the configured exclude globs and optionally
+against the patterns in any .gitignore files found along the way.
+"""
+from __future__ import annotations
+
+import fnmatch
+import os
+import os.path
+import re
+
+GITIGNORE_NAME = ".gitignore"
+
+# (folder the pattern is relative to or None to match the folder name, compiled pattern)
+IgnoreRule = tuple[str | None, re.Pattern[str]]
+
+
+def _normcase(pattern: str) -> str:
+    # Case insensitive on Windows while keeping "/" as the separator
+    return os.path.normcase(pattern).replace(os.sep, "/")
+
+
+def translate_gitignore(pattern: str) -> str:
+    """
+    Convert a gitignore glob into a regex matching "/" separated relative paths
+
+    Unlike fnmatch, "*", "?" and character classes never match a "/",
+    while "**" matches across folders when it makes up a whole path segment.
+    """
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/"):
+            if i + 2 == n:
+                parts.append(".*")
+                i += 2
+                continue
+            if pattern[i + 2] == "/":
+                parts.append("(?:.*/)?")
+                i += 3
+                continue
+        if c == "*":
+            parts.append("[^/]*")
+        elif c == "?":
+            parts.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2 if pattern.startswith("[!", i) else i + 1)
+            if end == -1:
+                parts.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                body = body.replace("\\", "\\\\")
+                parts.append(f"(?!/)[{body}]")
+                i = end
+        else:
+            parts.append(re.escape(c))
+        i += 1
+    return "(?s:" + "".join(parts) + r")\Z"
+
+
+def compile_globs(globs: list[str]) -> re.Pattern | None:
+    """
+    Combine glob patterns into a single regex matching folder names
+    """
+    if not globs:
+        return None
+    return re.compile("|".join(fnmatch.translate(_normcase(g)) for g in globs))
+
+
+def read_gitignore(folder: str) -> tuple[IgnoreRule, ...]:
+    """
+    Get the folder rules from the .gitignore file in `folder`.
+
+    This is a subset of the gitignore rules, negated patterns are skipped
+    so a folder that is re-included may still be ignored and escaped
+    characters are not supported.
+    """
+    try:
+        with open(os.path.join(folder, GITIGNORE_NAME), encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return ()
+
+    rules: list[IgnoreRule] = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith(("#", "!")):
+            continue
+
+        pattern = _normcase(line.rstrip("/"))
+        if not pattern:
+            continue
+
+        if "/" in pattern:
+            # Patterns with a separator are relative to the .gitignore location
+            rules.append((folder, re.compile(translate_gitignore(pattern.lstrip("/")))))
+        else:
+            rules.append((None, re.compile(translate_gitignore(pattern))))
+
+    return tuple(rules)
+
+
+def is_ignored(name: str, path: str, rules: tuple[IgnoreRule, ...]) -> bool:
+    """
+    Check if a folder is ignored by any of the .gitignore rules
+    """
+    name = _normcase(name)
+    for base, pattern in rules:
+        if base is None:
+            if pattern.match(name):
+                return True
+        else:
+            relative = _normcase(os.path.relpath(path, base))
+            if pattern.match(relative):
+                return True
+    return False
@@ -0,0 +1,142 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+On-disk cache of the deduplicated runtime list.
+
+The cache is only used if the key still matches, the key covers the
+values that change which runtimes pythonfinder can discover:
+PATH, the uv runtime folder and the mtimes of the folders that are scanned.
+"""
+from __future__ import annotations
+
+import json
+import os
+import os.path
+import sys
+
+from ducktools.classbuilder.prefab import as_dict
+from ducktools.pythonfinder import PythonInstall
+from ducktools.pythonfinder.shared import get_uv_python_path
+
+from ..platform_paths import CACHE_FOLDER
+
+if sys.platform == "win32":
+    from ducktools.pythonfinder.win32.pyenv_search import get_pyenv_root
+else:
+    from ducktools.pythonfinder.linux.pyenv_search import get_pyenv_root
+
+
+RUNTIME_CACHE_VERSION = 1
+RUNTIME_CACHE_PATH = os.path.join(CACHE_FOLDER, f"runtimes_v{RUNTIME_CACHE_VERSION}.json")
+
+
+def _get_mtime(folder: str) -> int | None:
+    try:
+        return os.stat(folder).st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_runtime_cache_key() -> dict:
+    """
+    Get the key the cached runtime list must match to be used
+
+    :return: dict of PATH, the uv runtime folder and mtimes of scanned folders
+    """
+    env_path = os.environ.get("PATH", "")
+    uv_python_dir = get_uv_python_path()
+
+    folders = [f for f in env_path.split(os.pathsep) if f]
+    if uv_python_dir:
+        folders.append(uv_python_dir)
+    if pyenv_root := get_pyenv_root():
+        folders.append(os.path.join(pyenv_root, "versions"))
+
+    return {
+        "path": env_path,
+        "uv_python_dir": uv_python_dir,
+        "folder_mtimes": {f: _get_mtime(f) for f in folders},
+    }
+
+
+def load_cached_installs(
+    cache_key: dict,
+    cache_path: str | None = None,
+) -> list[PythonInstall] | None:
+    """
+    Load the cached runtime list if the cache key matches
+
+    :param cache_key: Key from get_runtime_cache_key
+    :param cache_path: Path to the cache file
+    :return: List of PythonInstall instances or None if the cache is missing or stale
+    """
+    cache_path = RUNTIME_CACHE_PATH if cache_path is None else cache_path
+
+    try:
+        with open(cache_path) as f:
+            raw_cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if raw_cache.get("key") != cache_key:
+        return None
+
+    try:
+        installs = []
+        for entry in raw_cache["installs"]:
+            install = PythonInstall.from_json(**entry["install"])
+            install.shadowed = entry["shadowed"]
+            installs.append(install)
+    except (KeyError, TypeError):
+        return None
+
+    return installs
+
+
+def save_cached_installs(
+    installs: list[PythonInstall],
+    cache_key: dict,
+    cache_path: str | None = None,
+) -> None:
+    """
+    Store the runtime list along with the key it was discovered under
+
+    :param installs: List of PythonInstall instances
+    :param cache_key: Key from get_runtime_cache_key, obtained *before* discovery
+    :param cache_path: Path to the cache file
+    """
+    cache_path = RUNTIME_CACHE_PATH if cache_path is None else cache_path
+
+    raw_cache = {
+        "key": cache_key,
+        "installs": [
+            {"install": as_dict(inst), "shadowed": inst.shadowed}
+            for inst in installs
+        ],
+    }
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(raw_cache, f)
+    os.replace(tmp_path, cache_path)
@@ -0,0 +1,469 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Persistent index of discovered virtual environments.
+
+Each (base directory, search mode) has its own index file recording every folder
+visited with its mtime, subfolders and whether it contains a pyvenv.cfg, along
+with the parsed details of each pyvenv.cfg and its mtime.
+
+Adding or removing an entry changes the mtime of the containing folder, so folders
+with an unchanged mtime only need a single stat instead of a directory listing
+and unchanged pyvenv.cfg files are not parsed again.
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import os.path
+import queue
+import threading
+import time
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from ducktools.classbuilder.prefab import Prefab, as_dict, attribute
+from ducktools.pythonfinder.venv import PythonVEnv, InvalidVEnvError, VENV_CONFIG_NAME
+
+from ..platform_paths import CACHE_FOLDER
+from .prune import GITIGNORE_NAME, IgnoreRule, compile_globs, is_ignored, read_gitignore
+
+
+VENV_INDEX_VERSION = 2
+VENV_INDEX_FOLDER = os.path.join(CACHE_FOLDER, f"venv_index_v{VENV_INDEX_VERSION}")
+
+# Folder listing is IO bound so use more threads than cores
+WALKER_WORKERS = 8
+# Seconds between cancellation checks while waiting on the walker pool
+WALKER_POLL_INTERVAL = 0.1
+
+# Folder entries:
+# [mtime_ns, subfolders | None, symlinked subfolders | None, has pyvenv.cfg, has .gitignore]
+# Subfolders are None for folders that have only been checked for a pyvenv.cfg.
+FolderEntry = list
+# VEnv entries: [mtime_ns, serialized PythonVEnv | None for invalid configs]
+VEnvEntry = list
+
+
+def venv_to_dict(venv: PythonVEnv) -> dict:
+    return as_dict(venv)
+
+
+def venv_from_dict(data: dict) -> PythonVEnv:
+    return PythonVEnv(**{**data, "version": tuple(data["version"])})
+
+
+def get_index_path(
+    base_dir: str,
+    recursive: bool,
+    search_parent_folders: bool,
+    index_folder: str | None = None,
+) -> str:
+    index_folder = VENV_INDEX_FOLDER if index_folder is None else index_folder
+    mode = f"{int(recursive)}{int(search_parent_folders)}"
+    digest = hashlib.sha256(base_dir.encode("utf-8", "surrogateescape")).hexdigest()[:24]
+    return os.path.join(index_folder, f"{digest}_{mode}.json")
+
+
+@functools.lru_cache(maxsize=None)
+def get_walker_executor(workers: int = WALKER_WORKERS) -> ThreadPoolExecutor:
+    """
+    Get the thread pool recursive searches list folders on.
+
+    This is separate from the discovery executor, as the searches themselves
+    run on that pool and wait on the walker.
+    """
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pytui-walker")
+
+
+def _parent_folders(base_dir: str) -> Iterator[str]:
+    folder, parent = base_dir, os.path.dirname(base_dir)
+    while parent != folder:
+        yield parent
+        folder, parent = parent, os.path.dirname(parent)
+
+
+class ScanLimits(Prefab, kw_only=True):
+    """
+    Limits on a venv search, shared with the threads running the search.
+
+    :param max_depth: Maximum number of folder levels to descend in recursive searches
+    :param time_limit: Seconds after which a search stops early
+    :param exclude: Glob patterns for folder names that are not descended into
+    :param use_gitignore: Also skip folders ignored by .gitignore files
+    :param workers: Threads used to list folders in recursive searches, 1 to search serially
+    :param cancel_event: Set to stop a running search early
+    :param incomplete: Set by the search if it stopped early
+    """
+    max_depth: int | None = None
+    time_limit: float | None = None
+    exclude: list[str] = attribute(default_factory=list)
+    use_gitignore: bool = False
+    workers: int = WALKER_WORKERS
+    cancel_event: threading.Event = attribute(default_factory=threading.Event)
+    incomplete: bool = False
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+
+
+class VEnvIndex(Prefab, kw_only=True):
+    base_dir: str
+    recursive: bool = False
+    search_parent_folders: bool = False
+    index_path: str = attribute(default="", serialize=False)
+    folders: dict[str, FolderEntry] = attribute(default_factory=dict)
+    venvs: dict[str, VEnvEntry] = attribute(default_factory=dict)
+
+    @classmethod
+    def from_file(
+        cls,
+        base_dir: str,
+        recursive: bool = False,
+        search_parent_folders: bool = False,
+        index_folder: str | None = None,
+    ) -> VEnvIndex:
+        """
+        Load the index for a base folder and search mode, or create an empty index.
+        """
+        base_dir = os.path.abspath(base_dir)
+        index_path = get_index_path(base_dir, recursive, search_parent_folders, index_folder)
+
+        index = cls(
+            base_dir=base_dir,
+            recursive=recursive,
+            search_parent_folders=search_parent_folders,
+            index_path=index_path,
+        )
+
+        try:
+            with open(index_path) as f:
+                raw_index = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return index
+
+        # Guard against hash collisions and unexpected data
+        if (
+            isinstance(raw_index, dict)
+            and raw_index.get("base_dir") == base_dir
+            and isinstance(raw_index.get("folders"), dict)
+            and isinstance(raw_index.get("venvs"), dict)
+        ):
+            index.folders = raw_index["folders"]
+            index.venvs = raw_index["venvs"]
+
+        return index
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(as_dict(self), f)
+        os.replace(tmp_path, self.index_path)
+
+    def cached_venvs(self) -> list[PythonVEnv]:
+        """
+        Get the venvs found by the last scan without touching the file system.
+        """
+        return [venv_from_dict(data) for _, data in self.venvs.values() if data]
+
+    def scan(self, limits: ScanLimits | None = None) -> Iterator[PythonVEnv]:
+        """
+        Search for venvs, reusing index entries that are still valid and updating the index.
+
+        Without limits this matches the search performed by
+        ducktools.pythonfinder's get_python_venvs, except that the
+        contents of venvs are not searched.
+
+        :param limits: Depth, time and cancellation limits for the search
+        """
+        return _IndexScan(self, limits).run()
+
+
+class _IndexScan:
+    # Holds the state of a single scan, the index is replaced on completion
+    def __init__(self, index: VEnvIndex, limits: ScanLimits | None = None):
+        self.index = index
+        self.limits = ScanLimits() if limits is None else limits
+        self.exclude = compile_globs(self.limits.exclude)
+        self.new_folders: dict[str, FolderEntry] = {}
+        self.new_venvs: dict[str, VEnvEntry] = {}
+        self.stopped = False
+
+        if self.limits.time_limit is None:
+            self.deadline = None
+        else:
+            self.deadline = time.monotonic() + self.limits.time_limit
+
+    def should_stop(self) -> bool:
+        if self.limits.cancel_event.is_set() or (
+            self.deadline is not None and time.monotonic() > self.deadline
+        ):
+            self.limits.incomplete = True
+            self.stopped = True
+        return self.stopped
+
+    def folder_entry(self, path: str, need_listing: bool) -> FolderEntry | None:
+        # Folders are often checked again when they are descended into
+        entry = self.new_folders.get(path)
+        if entry and (entry[1] is not None or not need_listing):
+            return entry
+
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        old_entry = self.index.folders.get(path)
+        if old_entry and old_entry[0] == mtime and (old_entry[1] is not None or not need_listing):
+            entry = old_entry
+        elif need_listing:
+            dirs, links, has_cfg, has_gitignore = [], [], False, False
+            try:
+                with os.scandir(path) as it:
+                    for dir_entry in it:
+                        # DirEntry caches the file type from the listing where available
+                        try:
+                            if dir_entry.is_dir():
+                                if dir_entry.is_symlink():
+                                    links.append(dir_entry.name)
+                                else:
+                                    dirs.append(dir_entry.name)
+                            elif dir_entry.name == VENV_CONFIG_NAME:
+                                has_cfg = True
+                            elif dir_entry.name == GITIGNORE_NAME:
+                                has_gitignore = True
+                        except OSError:
+                            continue
+            except OSError:
+                return None
+            entry = [mtime, dirs, links, has_cfg, has_gitignore]
+        else:
+            entry = [mtime, None, None, os.path.isfile(os.path.join(path, VENV_CONFIG_NAME)), False]
+
+        self.new_folders[path] = entry
+        return entry
+
+    def venv_entry(self, folder: str) -> PythonVEnv | None:
+        cfg_path = os.path.join(folder, VENV_CONFIG_NAME)
+        try:
+            mtime = os.stat(cfg_path).st_mtime_ns
+        except OSError:
+            return None
+
+        old_entry = self.index.venvs.get(cfg_path)
+        if old_entry and old_entry[0] == mtime:
+            entry = old_entry
+            venv = venv_from_dict(entry[1]) if entry[1] else None
+        else:
+            try:
+                venv = PythonVEnv.from_cfg(cfg_path)
+            except (InvalidVEnvError, OSError, UnicodeDecodeError):
+                venv = None
+            entry = [mtime, venv_to_dict(venv) if venv else None]
+
+        self.new_venvs[cfg_path] = entry
+        return venv
+
+    def child_jobs(
+        self,
+        folder: str,
+        entry: FolderEntry,
+        depth: int,
+        recursive: bool,
+        rules: tuple[IgnoreRule, ...],
+    ) -> list[tuple]:
+        # Get the (folder, depth, recursive, listing, rules) jobs for the children of a listed folder
+        _, dirs, links, _, has_gitignore = entry
+        max_depth = self.limits.max_depth
+
+        if recursive and has_gitignore and self.limits.use_gitignore:
+            rules = rules + read_gitignore(folder)
+
+        descend = recursive and (max_depth is None or depth < max_depth)
+
+        jobs = []
+        for name in dirs:
+            child = os.path.join(folder, name)
+            # Pruned folders are still checked for a pyvenv.cfg, but never listed
+            listing = descend and not (
+                (self.exclude is not None and self.exclude.match(os.path.normcase(name)))
+                or (rules and is_ignored(name, child, rules))
+            )
+            jobs.append((child, depth, recursive, listing, rules))
+
+        # Symlinked folders are checked but never followed
+        jobs.extend((os.path.join(folder, name), depth, recursive, False, rules) for name in links)
+        return jobs
+
+    def visit(
+        self,
+        folder: str,
+        depth: int,
+        recursive: bool,
+        listing: bool,
+        rules: tuple[IgnoreRule, ...],
+    ) -> tuple[PythonVEnv | None, list[tuple]]:
+        # Check a folder for a venv, returning the jobs for its children if it is to be descended
+        if self.stopped:
+            return None, []
+
+        entry = self.folder_entry(folder, need_listing=listing)
+        if entry is None:
+            return None, []
+
+        if entry[3]:
+            # The contents of a venv are never searched
+            return self.venv_entry(folder), []
+
+        if not listing:
+            return None, []
+
+        return None, self.child_jobs(folder, entry, depth + 1, recursive, rules)
+
+    def search_children(self, path: str, recursive: bool) -> Iterator[PythonVEnv]:
+        # Check the children of `path` for venvs, descending into them if recursive
+        entry = self.folder_entry(path, need_listing=True)
+        if entry is None:
+            return
+
+        jobs = self.child_jobs(path, entry, 1, recursive, ())
+
+        if recursive and self.limits.workers > 1:
+            yield from self._search_parallel(jobs)
+        else:
+            while jobs:
+                if self.should_stop():
+                    return
+                venv, new_jobs = self.visit(*jobs.pop())
+                if venv:
+                    yield venv
+                jobs.extend(new_jobs)
+
+    def _search_parallel(self, jobs: list[tuple]) -> Iterator[PythonVEnv]:
+        # Fan each folder out to the walker pool, yielding venvs as they are found
+        executor = get_walker_executor(self.limits.workers)
+        results: queue.SimpleQueue = queue.SimpleQueue()
+        outstanding = 0
+
+        def submit(job):
+            nonlocal outstanding
+            outstanding += 1
+            executor.submit(self.visit, *job).add_done_callback(results.put)
+
+        try:
+            for job in jobs:
+                submit(job)
+
+            while outstanding:
+                if self.should_stop():
+                    return
+                try:
+                    # Wake up regularly so a folder blocked on slow IO doesn't block cancellation
+                    future = results.get(timeout=WALKER_POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+                outstanding -= 1
+                venv, new_jobs = future.result()
+                if venv:
+                    yield venv
+                for job in new_jobs:
+                    submit(job)
+        finally:
+            if outstanding:
+                # Abandoned early, queued jobs return immediately once stopped
+                self.stopped = True
+
+    def run(self) -> Iterator[PythonVEnv]:
+        index = self.index
+        yield from self.search_children(index.base_dir, recursive=index.recursive)
+
+        if index.search_parent_folders:
+            for parent in _parent_folders(index.base_dir):
+                yield from self.search_children(parent, recursive=False)
+
+        if self.limits.incomplete:
+            # Keep the entries this scan didn't reach for the next scan
+            index.folders.update(self.new_folders)
+            index.venvs.update(self.new_venvs)
+        else:
+            # Only entries seen in this scan are kept
+            index.folders = self.new_folders
+            index.venvs = self.new_venvs
+
+
+def load_cached_venvs(
+    base_dir: str,
+    recursive: bool = False,
+    search_parent_folders: bool = False,
+) -> list[PythonVEnv]:
+    """
+    Get the venvs recorded by the last scan of base_dir in this mode without scanning.
+    """
+    return VEnvIndex.from_file(base_dir, recursive, search_parent_folders).cached_venvs()
+
+
+def iter_venvs(
+    base_dir: str,
+    recursive: bool = False,
+    search_parent_folders: bool = False,
+    limits: ScanLimits | None = None,
+) -> Iterator[PythonVEnv]:
+    """
+    Search base_dir for venvs using the persistent index, yielding each venv as it is found.
+
+    The index is only updated if the generator is exhausted.
+
+    :param base_dir: Base directory to search venvs
+    :param recursive: Also check subfolders of the base directory
+    :param search_parent_folders: Also search parent folders
+    :param limits: Depth, time and cancellation limits for the search
+    :yield: Discovered venvs
+    """
+    index = VEnvIndex.from_file(base_dir, recursive, search_parent_folders)
+    yield from index.scan(limits)
+    try:
+        index.save()
+    except OSError:
+        pass
+
+
+def scan_venvs(
+    base_dir: str,
+    recursive: bool = False,
+    search_parent_folders: bool = False,
+    limits: ScanLimits | None = None,
+) -> list[PythonVEnv]:
+    """
+    Search base_dir for venvs using and updating the persistent index.
+
+    :param base_dir: Base directory to search venvs
+    :param recursive: Also check subfolders of the base directory
+    :param search_parent_folders: Also search parent folders
+    :param limits: Depth, time and cancellation limits for the search
+    :return: List of discovered venvs
+    """
+    return list(iter_venvs(base_dir, recursive, search_parent_folders, limits))
@@ -0,0 +1,349 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Watch folders for venvs being created or deleted outside of pytui.
+
+Each watched folder and its immediate subfolders are monitored, so venvs
+directly inside a watched folder are picked up as they are created or removed.
+inotify is used on Linux, other platforms poll folder mtimes.
+
+Folders with many subfolders only have their existing venvs and any new
+subfolders watched, to keep the number of watches bounded.
+"""
+from __future__ import annotations
+
+import os
+import os.path
+import select
+import struct
+import sys
+import threading
+
+from collections.abc import Callable
+
+from ducktools.pythonfinder.venv import PythonVEnv, InvalidVEnvError, VENV_CONFIG_NAME
+
+
+POLL_INTERVAL = 2.0
+# Above this many subfolders, existing subfolders that aren't venvs are not watched
+MAX_WATCHED_SUBFOLDERS = 256
+# Wait for inotify events to settle before checking, venv creation writes several entries
+SETTLE_DELAY = 0.25
+
+# Called with the venv folder and the new venv, or None if the venv was removed
+ChangeCallback = Callable[[str, "PythonVEnv | None"], None]
+
+
+def _read_venv(folder: str) -> PythonVEnv | None:
+    try:
+        return PythonVEnv.from_cfg(os.path.join(folder, VENV_CONFIG_NAME))
+    except (InvalidVEnvError, OSError, UnicodeDecodeError):
+        return None
+
+
+def _list_subfolders(folder: str) -> set[str]:
+    try:
+        with os.scandir(folder) as it:
+            return {
+                entry.path for entry in it
+                if entry.is_dir(follow_symlinks=False)
+            }
+    except OSError:
+        return set()
+
+
+def watched_parent_folders(base_dir: str) -> list[str]:
+    """
+    Get the parent folders of base_dir worth watching when parent folders are searched
+
+    The filesystem root and the folders above the home folder (such as /home)
+    are skipped, these hold system or other users' folders rather than venvs.
+
+    :param base_dir: Folder the venv search starts from
+    :return: Parent folders from nearest to furthest
+    """
+    home = os.path.abspath(os.path.expanduser("~"))
+    skipped = set()
+    folder, parent = home, os.path.dirname(home)
+    while parent != folder:
+        skipped.add(parent)
+        folder, parent = parent, os.path.dirname(parent)
+
+    parents = []
+    folder, parent = os.path.abspath(base_dir), os.path.dirname(os.path.abspath(base_dir))
+    while parent != folder:
+        # The root is its own parent
+        if parent not in skipped and os.path.dirname(parent) != parent:
+            parents.append(parent)
+        folder, parent = parent, os.path.dirname(parent)
+    return parents
+
+
+class _PollingBackend:
+    def __init__(self, interval: float = POLL_INTERVAL):
+        self.interval = interval
+        self.mtimes: dict[str, int | None] = {}
+        self.stop_event = threading.Event()
+
+    @staticmethod
+    def _mtime(path: str) -> int | None:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def add_watch(self, path: str) -> None:
+        self.mtimes[path] = self._mtime(path)
+
+    def remove_watch(self, path: str) -> None:
+        self.mtimes.pop(path, None)
+
+    def wait(self) -> set[str] | None:
+        # Return the folders that have changed, or None if stopped
+        if self.stop_event.wait(self.interval):
+            return None
+
+        changed = set()
+        for path, mtime in self.mtimes.items():
+            new_mtime = self._mtime(path)
+            if new_mtime != mtime:
+                self.mtimes[path] = new_mtime
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        self.stop_event.set()
+
+
+class _InotifyBackend:
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (
+        IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+        | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+    )
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add = libc.inotify_add_watch
+        self._add.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm = libc.inotify_rm_watch
+        self._rm.argtypes = [ctypes.c_int, ctypes.c_int]
+        self._get_errno = ctypes.get_errno
+
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(self._get_errno(), "inotify_init1 failed")
+
+        self.wake_read, self.wake_write = os.pipe()
+        self.watches: dict[int, str] = {}
+        self.paths: dict[str, int] = {}
+
+    def add_watch(self, path: str) -> None:
+        wd = self._add(self.fd, os.fsencode(path), self.WATCH_MASK)
+        if wd >= 0:
+            self.watches[wd] = path
+            self.paths[path] = wd
+
+    def remove_watch(self, path: str) -> None:
+        wd = self.paths.pop(path, None)
+        if wd is not None:
+            self.watches.pop(wd, None)
+            self._rm(self.fd, wd)
+
+    def _read_changes(self) -> set[str]:
+        changed: set[str] = set()
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size + length
+
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were lost, check everything
+                changed.update(self.paths)
+            elif (path := self.watches.get(wd)) is not None:
+                changed.add(path)
+                if mask & self.IN_IGNORED:
+                    # The kernel has removed the watch
+                    self.watches.pop(wd, None)
+                    self.paths.pop(path, None)
+        return changed
+
+    def wait(self) -> set[str] | None:
+        # Return the folders that have changed, or None if stopped
+        readable, _, _ = select.select([self.fd, self.wake_read], [], [])
+        if self.wake_read in readable:
+            return None
+
+        changed = self._read_changes()
+        # Collect the rest of a burst of events before checking
+        while readable := select.select([self.fd, self.wake_read], [], [], SETTLE_DELAY)[0]:
+            if self.wake_read in readable:
+                return None
+            changed |= self._read_changes()
+        return changed
+
+    def close(self) -> None:
+        os.write(self.wake_write, b"x")
+
+
+class VEnvWatcher:
+    """
+    Watch folders for venvs being added, changed or removed
+
+    :param folders: Folders that may directly contain venvs
+    :param on_change: Called from the watcher thread with the venv folder
+                      and the new venv or None if it was removed
+    :param use_polling: Poll folders instead of using inotify
+    :param poll_interval: Seconds between checks when polling
+    :param max_subfolders: Folders with more subfolders than this only watch
+                           their venvs and new subfolders
+    """
+    def __init__(
+        self,
+        folders: list[str],
+        on_change: ChangeCallback,
+        use_polling: bool = False,
+        poll_interval: float = POLL_INTERVAL,
+        max_subfolders: int = MAX_WATCHED_SUBFOLDERS,
+    ):
+        self.folders = [os.path.abspath(f) for f in folders]
+        self.on_change = on_change
+        self.use_polling = use_polling or sys.platform != "linux"
+        self.poll_interval = poll_interval
+        self.max_subfolders = max_subfolders
+
+        self._backend: _InotifyBackend | _PollingBackend | None = None
+        self._thread: threading.Thread | None = None
+
+        # Subfolders of each watched folder and the venvs in them
+        self._subfolders: dict[str, set[str]] = {}
+        self._venvs: dict[str, PythonVEnv] = {}
+
+    def _make_backend(self):
+        if not self.use_polling:
+            try:
+                return _InotifyBackend()
+            except (OSError, AttributeError):
+                # No inotify available (no libc symbol or out of instances)
+                pass
+        return _PollingBackend(self.poll_interval)
+
+    def start(self) -> None:
+        self._backend = self._make_backend()
+        for folder in self.folders:
+            self._backend.add_watch(folder)
+            subfolders = _list_subfolders(folder)
+            self._subfolders[folder] = subfolders
+            watch_all = len(subfolders) <= self.max_subfolders
+            for subfolder in subfolders:
+                venv = _read_venv(subfolder)
+                if venv:
+                    self._venvs[subfolder] = venv
+                if venv or watch_all:
+                    self._backend.add_watch(subfolder)
+
+        self._thread = threading.Thread(target=self._run, name="pytui-venv-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stop watching, the watcher thread closes the backend when it exits
+
+        :param wait: Wait for the watcher thread to finish
+        """
+        if self._backend is not None:
+            self._backend.close()
+        if self._thread is not None:
+            if wait:
+                self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        backend = self._backend
+        if backend is None:
+            return
+        try:
+            while (changed := backend.wait()) is not None:
+                for path in sorted(changed):
+                    if path in self._subfolders:
+                        self._folder_changed(path)
+                    else:
+                        self._check_venv(path)
+        finally:
+            if isinstance(backend, _InotifyBackend):
+                os.close(backend.fd)
+                os.close(backend.wake_read)
+                os.close(backend.wake_write)
+
+    def _folder_changed(self, folder: str) -> None:
+        # Subfolders of a watched folder have been added or removed
+        backend = self._backend
+        if backend is None:
+            return
+
+        old_subfolders = self._subfolders[folder]
+        new_subfolders = _list_subfolders(folder)
+        self._subfolders[folder] = new_subfolders
+
+        for subfolder in old_subfolders - new_subfolders:
+            backend.remove_watch(subfolder)
+            if self._venvs.pop(subfolder, None) is not None:
+                self.on_change(subfolder, None)
+
+        for subfolder in new_subfolders - old_subfolders:
+            backend.add_watch(subfolder)
+            self._check_venv(subfolder)
+
+    def _check_venv(self, folder: str) -> None:
+        # The contents of a possible venv folder have changed
+        venv = _read_venv(folder)
+        old_venv = self._venvs.get(folder)
+        if venv == old_venv:
+            return
+
+        if venv is None:
+            del self._venvs[folder]
+        else:
+            self._venvs[folder] = venv
+        self.on_change(folder, venv)
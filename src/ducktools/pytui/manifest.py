@@ -0,0 +1,383 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Create several venvs in parallel from a TOML manifest.
+
+Example manifest::
+
+    [[venv]]
+    name = "tools"
+    runtime = "3.13"
+    global = true
+
+    [[venv]]
+    name = "project/.venv"
+    runtime = "pypy3.10"
+    requirements = "project/requirements.txt"
+
+`runtime` is a version prefix with an optional implementation name and a
+trailing `t` for free-threaded builds, or the path to a Python executable.
+Local venv and requirements paths are relative to the manifest file.
+
+This is used by the `create` subcommand so it must not import textual.
+"""
+from __future__ import annotations
+
+import os
+import os.path
+import re
+import subprocess
+import sys
+import time
+import tomllib
+from concurrent.futures import ProcessPoolExecutor
+
+from ducktools.classbuilder.prefab import Prefab
+from ducktools.pythonfinder import PythonInstall
+
+from .commands import create_venv
+from .config import Config
+from .venv_backends import get_backend
+from .venv_backends.templates import get_template_key, prepare_template, templates_supported
+
+
+RUNTIME_SPEC_RE = re.compile(
+    r"(?P<implementation>[a-z]+)?(?P<version>\d+(?:\.\d+){0,2})(?P<freethreaded>t)?"
+)
+DEFAULT_MAX_WORKERS = 4
+
+
+class ManifestError(ValueError):
+    pass
+
+
+class ManifestEntry(Prefab, kw_only=True):
+    name: str
+    runtime: str
+    global_venv: bool = False
+    requirements: str | None = None
+
+
+class ManifestResult(Prefab, kw_only=True):
+    name: str
+    venv_path: str
+    elapsed: float = 0.0
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+def load_manifest(manifest_path: str) -> list[ManifestEntry]:
+    """
+    Read and validate the venv entries in a manifest file
+
+    :param manifest_path: Path to the TOML manifest
+    :return: List of manifest entries in file order
+    """
+    try:
+        with open(manifest_path, "rb") as f:
+            raw_manifest = tomllib.load(f)
+    except tomllib.TOMLDecodeError as e:
+        raise ManifestError(f"Could not parse manifest {manifest_path!r}: {e}")
+
+    raw_entries = raw_manifest.get("venv")
+    if not isinstance(raw_entries, list) or not raw_entries:
+        raise ManifestError(f"Manifest {manifest_path!r} has no [[venv]] entries")
+
+    entries = []
+    for i, raw_entry in enumerate(raw_entries, start=1):
+        if not isinstance(raw_entry, dict):
+            raise ManifestError(f"venv entry {i} must be a table")
+
+        unknown_keys = raw_entry.keys() - {"name", "runtime", "global", "requirements"}
+        if unknown_keys:
+            raise ManifestError(f"venv entry {i} has unknown keys: {', '.join(sorted(unknown_keys))}")
+
+        name = raw_entry.get("name")
+        runtime = raw_entry.get("runtime")
+        global_venv = raw_entry.get("global", False)
+        requirements = raw_entry.get("requirements")
+
+        if not (isinstance(name, str) and name):
+            raise ManifestError(f"venv entry {i} needs a 'name'")
+        if not (isinstance(runtime, str) and runtime):
+            raise ManifestError(f"venv entry {name!r} needs a 'runtime'")
+        if not isinstance(global_venv, bool):
+            raise ManifestError(f"'global' for venv entry {name!r} must be true or false")
+        if requirements is not None and not isinstance(requirements, str):
+            raise ManifestError(f"'requirements' for venv entry {name!r} must be a path")
+        if global_venv and os.path.basename(name) != name:
+            raise ManifestError(f"Global venv name {name!r} can't contain a path")
+
+        entries.append(
+            ManifestEntry(
+                name=name,
+                runtime=runtime,
+                global_venv=global_venv,
+                requirements=requirements,
+            )
+        )
+
+    return entries
+
+
+def find_runtime(spec: str, installs: list[PythonInstall]) -> PythonInstall | None:
+    """
+    Find the first install matching a runtime spec
+
+    :param spec: Version spec such as "3.12", "pypy3.10" or "3.13t", or a path to an executable
+    :param installs: Installs in priority order
+    :return: Matching install or None
+    """
+    if os.path.sep in spec or (os.path.altsep and os.path.altsep in spec):
+        real_path = os.path.realpath(os.path.expanduser(spec))
+        for install in installs:
+            if os.path.realpath(install.executable) == real_path:
+                return install
+        return None
+
+    match = RUNTIME_SPEC_RE.fullmatch(spec.lower())
+    if match is None:
+        raise ManifestError(f"Invalid runtime spec {spec!r}")
+
+    implementation = match["implementation"]
+    version = tuple(int(part) for part in match["version"].split("."))
+    freethreaded = match["freethreaded"] is not None
+
+    for install in installs:
+        install_implementation = install.implementation.lower()
+        # Same restrictions as creating a venv in the UI
+        if install_implementation == "micropython" or install.version < (3, 4):
+            continue
+        if implementation and install_implementation != implementation:
+            continue
+        if install.version[:len(version)] != version:
+            continue
+        if bool(install.metadata.get("freethreaded")) != freethreaded:
+            continue
+        return install
+
+    return None
+
+
+def create_entry(
+    name: str,
+    runtime: PythonInstall,
+    venv_path: str,
+    requirements_path: str | None,
+    config: Config,
+) -> ManifestResult:
+    """
+    Create one venv and install its requirements, run in a worker process
+
+    :return: Result with the time taken and any error
+    """
+    start = time.perf_counter()
+    error = None
+    try:
+        venv = create_venv(
+            runtime,
+            venv_path,
+            include_pip=config.include_pip,
+            latest_pip=config.latest_pip,
+            backend=config.venv_backend,
+            use_template=config.venv_templates,
+        )
+        if requirements_path:
+            subprocess.run(
+                [venv.executable, "-m", "pip", "install", "-r", requirements_path],
+                capture_output=True,
+                check=True,
+            )
+    except subprocess.CalledProcessError as e:
+        # The last line of pip or venv's output is usually the useful part
+        output = (e.stderr or e.stdout or b"").decode(errors="replace").strip()
+        error = output.splitlines()[-1] if output else str(e)
+    except Exception as e:
+        # Any other failure only affects this entry
+        error = str(e) or type(e).__name__
+
+    return ManifestResult(
+        name=name,
+        venv_path=venv_path,
+        elapsed=time.perf_counter() - start,
+        error=error,
+    )
+
+
+def prepare_templates(runtimes: list[PythonInstall], config: Config) -> None:
+    """
+    Build or validate the template for each distinct set of venv options once
+
+    This runs before the workers start, so they clone the same template
+    instead of each building their own. Failures are left to the workers,
+    which fall back to creating their venv directly.
+
+    :param runtimes: Runtimes of the venvs about to be created
+    :param config: Config with the venv creation options
+    """
+    prepared = set()
+    for runtime in runtimes:
+        if not templates_supported(runtime):
+            continue
+
+        backend = get_backend(config.venv_backend, runtime, config.include_pip, config.latest_pip)
+        key = get_template_key(backend, runtime, config.include_pip, config.latest_pip)
+        if key in prepared:
+            continue
+        prepared.add(key)
+
+        try:
+            prepare_template(backend, runtime, config.include_pip, config.latest_pip)
+        except (OSError, subprocess.CalledProcessError):
+            pass
+
+
+def create_from_manifest(
+    entries: list[ManifestEntry],
+    installs: list[PythonInstall],
+    config: Config,
+    base_dir: str,
+    max_workers: int | None = None,
+) -> list[ManifestResult]:
+    """
+    Create the venvs for manifest entries in parallel worker processes
+
+    :param entries: Manifest entries
+    :param installs: Installs used to resolve runtime specs, in priority order
+    :param config: Config with the venv creation options
+    :param base_dir: Folder that local venv and requirements paths are relative to
+    :param max_workers: Maximum number of worker processes
+    :return: Results in the same order as the entries
+    """
+    results: dict[int, ManifestResult] = {}
+    jobs = {}
+    # Resolved venv path -> index of the first entry using it
+    venv_owners: dict[str, int] = {}
+
+    for i, entry in enumerate(entries):
+        if entry.global_venv:
+            venv_path = os.path.join(config.global_venv_folder, entry.name)
+        else:
+            venv_path = os.path.join(base_dir, entry.name)
+
+        requirements_path = None
+        if entry.requirements:
+            requirements_path = os.path.join(base_dir, os.path.expanduser(entry.requirements))
+
+        resolved_path = os.path.normcase(os.path.realpath(venv_path))
+        owner = venv_owners.setdefault(resolved_path, i)
+
+        runtime = find_runtime(entry.runtime, installs)
+        if owner != i:
+            results[i] = ManifestResult(
+                name=entry.name,
+                venv_path=venv_path,
+                error=f"Same venv path as entry {entries[owner].name!r}",
+            )
+        elif runtime is None:
+            results[i] = ManifestResult(
+                name=entry.name,
+                venv_path=venv_path,
+                error=f"No runtime found matching {entry.runtime!r}",
+            )
+        elif requirements_path and not os.path.isfile(requirements_path):
+            results[i] = ManifestResult(
+                name=entry.name,
+                venv_path=venv_path,
+                error=f"Requirements file {requirements_path!r} not found",
+            )
+        else:
+            jobs[i] = (entry.name, runtime, venv_path, requirements_path, config)
+
+    if jobs:
+        if config.venv_templates:
+            prepare_templates([job[1] for job in jobs.values()], config)
+
+        if max_workers is None:
+            max_workers = min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+        max_workers = max(1, min(max_workers, len(jobs)))
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {i: executor.submit(create_entry, *job) for i, job in jobs.items()}
+            for i, future in futures.items():
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    # Failures outside of create_entry, such as arguments that can't be pickled
+                    name, _, venv_path, *_ = jobs[i]
+                    results[i] = ManifestResult(
+                        name=name,
+                        venv_path=venv_path,
+                        error=str(e) or type(e).__name__,
+                    )
+
+    return [results[i] for i in range(len(entries))]
+
+
+def format_summary(results: list[ManifestResult], elapsed: float) -> str:
+    name_width = max(len(result.name) for result in results)
+    created = sum(result.success for result in results)
+
+    lines = [f"Created {created} of {len(results)} venvs in {elapsed:.2f}s"]
+    for result in results:
+        status = "OK" if result.success else "FAILED"
+        detail = result.venv_path if result.success else f"{result.venv_path}: {result.error}"
+        lines.append(
+            f"  {status:<8}{result.elapsed:7.2f}s  {result.name:<{name_width}}  {detail}"
+        )
+    return "\n".join(lines)
+
+
+def run_manifest(manifest_path: str, max_workers: int | None = None) -> int:
+    """
+    Create all venvs in a manifest file and print a summary
+
+    :param manifest_path: Path to the TOML manifest
+    :param max_workers: Maximum number of worker processes
+    :return: Exit code, 1 if any venv could not be created
+    """
+    from .util import list_installs_deduped
+
+    start = time.perf_counter()
+    try:
+        entries = load_manifest(manifest_path)
+    except (OSError, ManifestError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    config = Config.from_file()
+    installs = list_installs_deduped()
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+
+    try:
+        results = create_from_manifest(entries, installs, config, base_dir, max_workers)
+    except ManifestError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(format_summary(results, time.perf_counter() - start))
+
+    return 0 if all(result.success for result in results) else 1
@@ -33,6 +33,8 @@ __all__ = [
     "PYTUI_FOLDER",
     "GLOBAL_VENV_FOLDER",
     "CONFIG_FILE",
+    "CACHE_FOLDER",
+    "ZIPAPP_FOLDER",
 ]
 
 
@@ -77,3 +79,5 @@ else:
 
 CONFIG_FILE = os.path.join(CONFIG_FOLDER, "config.json")
 SHELL_SCRIPT_FOLDER = os.path.join(PYTUI_FOLDER, "shell_scripts")
+ZIPAPP_FOLDER = os.path.join(PYTUI_FOLDER, "zipapp")
+CACHE_FOLDER = os.path.join(PYTUI_FOLDER, "cache")
@@ -22,12 +22,29 @@
 # SOFTWARE.
 from __future__ import annotations
 
+import queue
+import subprocess
 import sys
+import time
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from typing import TypeVar
 
 from ducktools.pythonfinder import PythonInstall
 
-from .base import PythonListing, RuntimeManager
+from .base import (
+    LISTING_FACETS as LISTING_FACETS,
+    ListingIndex as ListingIndex,
+    PythonListing,
+    RuntimeManager,
+)
+from .streaming import (
+    InstallResult as InstallResult,
+    stream_batch_install as stream_batch_install,
+    stream_install as stream_install,
+)
 
 # Windows python installer should come before UV if available
 if sys.platform == "win32":
@@ -37,6 +54,21 @@ else:
     from . import uv as uv
 
 
+T = TypeVar("T")
+
+# Enough for every manager to be queried by a few screens at once
+QUERY_WORKERS = 8
+
+# Called with the manager and the exception raised while querying it
+ErrorCallback = Callable[[RuntimeManager, Exception], None]
+
+
+class ManagerTimeoutError(TimeoutError):
+    """
+    Raised when a runtime manager doesn't respond within its query timeout
+    """
+
+
 @lru_cache(maxsize=None)
 def get_managers() -> list[RuntimeManager]:
     managers = []
@@ -47,20 +79,145 @@ def get_managers() -> list[RuntimeManager]:
     return managers
 
 
-def fetch_downloads() -> list[PythonListing]:
+@lru_cache(maxsize=None)
+def get_query_executor(workers: int = QUERY_WORKERS) -> ThreadPoolExecutor:
+    """
+    Get the thread pool runtime managers are queried on.
+
+    Manager commands are killed once they pass the manager's query_timeout,
+    so a hung manager only holds a worker until then.
+    """
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pytui-manager-query")
+
+
+def query_managers(
+    func: Callable[[RuntimeManager], T],
+    on_error: ErrorCallback | None = None,
+) -> list[T]:
+    """
+    Call func with each manager concurrently, each limited by the manager's query_timeout.
+
+    Managers that fail or time out are skipped and reported to on_error, if on_error
+    is None the first error is raised after the other managers have completed.
+
+    :param func: Function to call with each manager
+    :param on_error: Called with the manager and exception for failed managers
+    :return: Results from the successful managers in manager order
+    """
+    managers = get_managers()
+    executor = get_query_executor()
+    outcomes: queue.SimpleQueue = queue.SimpleQueue()
+
+    def run(idx, manager):
+        try:
+            outcomes.put((idx, func(manager), None))
+        except subprocess.TimeoutExpired:
+            # The manager command has already been killed
+            outcomes.put((idx, None, ManagerTimeoutError(
+                f"{manager.organisation} manager did not respond "
+                f"within {manager.query_timeout}s"
+            )))
+        except Exception as e:
+            outcomes.put((idx, None, e))
+
+    start = time.monotonic()
+    deadlines = {}
+    for idx, manager in enumerate(managers):
+        deadlines[idx] = start + manager.query_timeout
+        executor.submit(run, idx, manager)
+
+    results: dict[int, T] = {}
+    errors: dict[int, Exception] = {}
+    while deadlines:
+        remaining = min(deadlines.values()) - time.monotonic()
+        try:
+            idx, result, error = outcomes.get(timeout=max(remaining, 0))
+        except queue.Empty:
+            now = time.monotonic()
+            for idx, deadline in list(deadlines.items()):
+                if deadline <= now:
+                    del deadlines[idx]
+                    errors[idx] = ManagerTimeoutError(
+                        f"{managers[idx].organisation} manager did not respond "
+                        f"within {managers[idx].query_timeout}s"
+                    )
+            continue
+
+        if deadlines.pop(idx, None) is None:
+            # Already timed out
+            continue
+        if error is None:
+            results[idx] = result
+        else:
+            errors[idx] = error
+
+    for idx in sorted(errors):
+        if on_error is None:
+            raise errors[idx]
+        on_error(managers[idx], errors[idx])
+
+    return [results[idx] for idx in sorted(results)]
+
+
+def fetch_downloads(
+    refresh: bool = False,
+    cache_ttl: float | None = None,
+    on_error: ErrorCallback | None = None,
+    all_versions: bool = False,
+) -> list[PythonListing]:
+    """
+    Get the downloads available from all managers, querying the managers concurrently
+
+    :param refresh: Ignore cached download lists
+    :param cache_ttl: Maximum age in seconds of download lists cached on disk,
+                      None to not use the disk cache
+    :param on_error: Called with the manager and exception for managers that fail
+                     or time out, if None the error is raised
+    :param all_versions: Include every available version, not just the latest of each release
+    """
     downloads = []
-    for m in get_managers():
-        downloads.extend(m.fetch_downloads())
+    for manager_downloads in query_managers(
+        lambda m: m.fetch_downloads(all_versions=all_versions, refresh=refresh, cache_ttl=cache_ttl),
+        on_error=on_error,
+    ):
+        downloads.extend(manager_downloads)
 
     return downloads
 
 
-def find_matching_listing(install: PythonInstall) -> PythonListing | None:
-    for manager in get_managers():
-        listing = manager.find_matching_listing(install)
-        if listing:
-            break
-    else:
-        listing = None
+def find_matching_listings(
+    installs: list[PythonInstall],
+    on_error: ErrorCallback | None = None,
+) -> list[PythonListing | None]:
+    """
+    Find the manager listings for several installed runtimes, querying each manager once
+
+    :param installs: Discovered Python installs
+    :param on_error: Called with the manager and exception for managers that fail
+                     or time out, if None the error is raised
+    :return: The matching listing or None for each install, in the same order
+    """
+    manager_matches = query_managers(
+        lambda m: [m.find_matching_listing(install) for install in installs],
+        on_error=on_error,
+    )
+    listings: list[PythonListing | None] = [None] * len(installs)
+    for matches in manager_matches:
+        for i, listing in enumerate(matches):
+            if listings[i] is None:
+                listings[i] = listing
+    return listings
+
+
+def find_matching_listing(
+    install: PythonInstall,
+    on_error: ErrorCallback | None = None,
+) -> PythonListing | None:
+    """
+    Find the manager listing for an installed runtime, querying the managers concurrently
 
-    return listing
+    :param install: Discovered Python install
+    :param on_error: Called with the manager and exception for managers that fail
+                     or time out, if None the error is raised
+    """
+    return find_matching_listings([install], on_error=on_error)[0]
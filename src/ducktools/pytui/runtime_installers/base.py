@@ -26,33 +26,47 @@ import functools
 import operator
 import os.path
 import subprocess
+import threading
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
-from typing import ClassVar, Final, Generic, TypeAlias, TypeVar
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, ClassVar, Final, Generic, TypeAlias, TypeVar
 
 from ducktools.pythonfinder.shared import PythonInstall, version_str_to_tuple
-from ducktools.classbuilder.prefab import prefab, attribute
+from ducktools.classbuilder.prefab import Prefab, SlotFields, prefab, attribute
 
 
 _version_tuple_type: TypeAlias = tuple[int, int, int, str, int]  # type statement needs 3.12+
+# (implementation, version_tuple, variant, arch)
+_spec_key_type: TypeAlias = tuple[str, _version_tuple_type, str, str]
 
 
 @prefab(kw_only=True)
 class PythonListing(ABC):
-    manager: RuntimeManager
+    # Slotted as managers can list thousands of downloads
+    # attribute(type=...) only takes real classes, the full types are declared below
+    __slots__ = SlotFields(
+        manager=attribute(),
+        key=attribute(type=str),
+        version=attribute(type=str),
+        implementation=attribute(type=str),
+        variant=attribute(type=str),
+        arch=attribute(type=str),
+        path=attribute(),
+        url=attribute(),
+        _version_tuple=attribute(default=None, private=True),
+    )
 
-    key: str
-    version: str
-    implementation: str
-    variant: str
-    arch: str
-    path: str | None
-    url: str | None
-
-    # `attribute` is a field specifier as defined in dataclass_transform
-    # Not sure why it's not being picked up
-    _version_tuple: _version_tuple_type | None = attribute(default=None, private=True)
+    if TYPE_CHECKING:
+        manager: RuntimeManager
+        key: str
+        version: str
+        implementation: str
+        variant: str
+        arch: str
+        path: str | None
+        url: str | None
+        _version_tuple: _version_tuple_type | None = None
 
     @property
     def version_tuple(self) -> _version_tuple_type:
@@ -64,6 +78,19 @@ class PythonListing(ABC):
     def full_key(self) -> str:
         return f"{type(self).__name__} / {self.key}"
 
+    @property
+    def spec_key(self) -> _spec_key_type:
+        return self.implementation, self.version_tuple, self.variant, self.arch
+
+    @property
+    def install_dir(self) -> str | None:
+        """
+        Resolved path of the folder containing the runtime executable, if installed
+        """
+        if self.path is None:
+            return None
+        return os.path.realpath(os.path.dirname(self.path))
+
     @property
     def will_overwrite(self) -> bool:
         return False
@@ -74,25 +101,185 @@ class PythonListing(ABC):
         ...
 
     @abstractmethod
-    def install(self) -> subprocess.CompletedProcess | None:
+    def install_command(self) -> list[str] | None:
+        """
+        Get the command that installs this runtime, or None if it is already installed
+
+        :raises FileNotFoundError: If the manager executable can not be found
+        """
         ...
 
+    def install(self) -> subprocess.CompletedProcess | None:
+        cmd = self.install_command()
+        if cmd is None:
+            # Can't install already installed Python
+            return None
+
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+        )
+        self.manager.invalidate_installed()
+        return result
+
     @abstractmethod
-    def uninstall(self) -> subprocess.CompletedProcess | None:
+    def uninstall_command(self) -> list[str] | None:
+        """
+        Get the command that uninstalls this runtime, or None if it is not installed
+
+        :raises FileNotFoundError: If the manager executable can not be found
+        """
         ...
 
+    def uninstall(self) -> subprocess.CompletedProcess | None:
+        cmd = self.uninstall_command()
+        if cmd is None:
+            # Can't uninstall non-installed Python
+            return None
+
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+        )
+        self.manager.invalidate_installed()
+        return result
+
 
 Listing = TypeVar("Listing", bound=PythonListing)
 
 
+# Listing attributes that can be used to filter a ListingIndex
+LISTING_FACETS = ("implementation", "variant", "arch")
+
+
+class ListingIndex(Prefab):
+    """
+    Lookup tables for a list of listings, build a new index whenever the list is refreshed
+    """
+    listings: Sequence[PythonListing] = attribute(default_factory=list)
+
+    by_key: dict[str, PythonListing] = attribute(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    by_install_dir: dict[str, PythonListing] = attribute(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    by_spec: dict[_spec_key_type, list[PythonListing]] = attribute(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # facet name -> facet value -> listings
+    by_facet: dict[str, dict[str, list[PythonListing]]] = attribute(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __prefab_post_init__(self) -> None:
+        facets: dict[str, dict[str, list[PythonListing]]] = {facet: {} for facet in LISTING_FACETS}
+        self.by_facet = facets
+        for listing in self.listings:
+            self.by_key[listing.full_key] = listing
+            self.by_spec.setdefault(listing.spec_key, []).append(listing)
+            for facet, values in facets.items():
+                values.setdefault(getattr(listing, facet), []).append(listing)
+            install_dir = listing.install_dir
+            if install_dir is not None:
+                self.by_install_dir[install_dir] = listing
+
+    def __len__(self) -> int:
+        return len(self.listings)
+
+    def __iter__(self):
+        return iter(self.listings)
+
+    def get(self, full_key: str) -> PythonListing | None:
+        return self.by_key.get(full_key)
+
+    def find_install(self, install: PythonInstall) -> PythonListing | None:
+        """
+        Find the listing for a discovered install by its install folder
+
+        Executable names may not match, one may find python.exe, the other pypy.exe
+        so the parent folder is used.
+        """
+        install_dir = os.path.realpath(os.path.dirname(install.executable))
+        return self.by_install_dir.get(install_dir)
+
+    def facet_values(self, facet: str) -> list[str]:
+        """
+        Get the sorted values of a facet present in the listings
+        """
+        return sorted(self.by_facet[facet])
+
+    def filter(
+        self,
+        version_prefix: str = "",
+        implementation: str | None = None,
+        variant: str | None = None,
+        arch: str | None = None,
+    ) -> list[PythonListing]:
+        """
+        Get the listings matching all of the given filters, in listing order
+
+        :param version_prefix: Start of the version string, eg: "3.12"
+        :param implementation: Required implementation or None for any
+        :param variant: Required variant or None for any
+        :param arch: Required architecture or None for any
+        """
+        required = {
+            facet: value
+            for facet, value in zip(LISTING_FACETS, (implementation, variant, arch))
+            if value is not None
+        }
+
+        # Start from the smallest set of listings with a required facet value
+        candidates = self.listings
+        for facet, value in required.items():
+            facet_listings = self.by_facet[facet].get(value, [])
+            if len(facet_listings) < len(candidates):
+                candidates = facet_listings
+
+        return [
+            listing for listing in candidates
+            if listing.version.startswith(version_prefix)
+            and all(getattr(listing, facet) == value for facet, value in required.items())
+        ]
+
+    def find_spec(
+        self,
+        implementation: str,
+        version_tuple: _version_tuple_type,
+        variant: str,
+        arch: str,
+    ) -> list[PythonListing]:
+        """
+        Get all listings matching the implementation, version, variant and architecture
+        """
+        return self.by_spec.get((implementation, version_tuple, variant, arch), [])
+
+
 class RuntimeManager(Generic[Listing], ABC):
     available_managers: Final[list[type[RuntimeManager]]] = []
 
     organisation: ClassVar[str]
 
+    # Seconds to wait for the manager when querying managers together
+    query_timeout: ClassVar[float] = 30.0
+
     def __init_subclass__(cls) -> None:
         RuntimeManager.available_managers.append(cls)
 
+    def __init__(self) -> None:
+        # Download listings are kept for the lifetime of the manager unless refreshed
+        self._download_cache: dict = {}
+        # Held while the download list is fetched, so background prefetches and
+        # the install screen don't query the manager at the same time
+        self._download_lock = threading.Lock()
+        # (runtime folder mtime, installed listings) from the last query
+        self._installed_snapshot: tuple[int | None, list[Listing]] | None = None
+        # Index of the installed listings, rebuilt when the installed list changes
+        self._installed_index: ListingIndex | None = None
+
     @staticmethod
     def sort_listings(listings: Iterable[Listing]) -> list[Listing]:
         new_listings = sorted(listings, key=operator.attrgetter("variant", "arch", "key"))
@@ -108,37 +295,171 @@ class RuntimeManager(Generic[Listing], ABC):
         """
         ...
 
+    @functools.cached_property
+    def runtime_folder(self) -> str | None:
+        """
+        Get the folder the manager installs runtimes into, or None if it is not known
+
+        Adding or removing a runtime changes its mtime, invalidating the installed snapshot
+        """
+        return None
+
     @abstractmethod
-    def fetch_installed(self) -> list[Listing]:
+    def _query_installed(self) -> list[Listing]:
         """
-        Get a list of installed runtimes managed by the manager
+        Query the manager for the list of installed runtimes
         """
         ...
 
+    def _run_query(self, cmd: list[str]) -> subprocess.CompletedProcess:
+        """
+        Run a command that queries the manager, killing it if it takes longer than query_timeout
+
+        :raises subprocess.CalledProcessError: If the command fails
+        :raises subprocess.TimeoutExpired: If the command doesn't finish in time
+        """
+        return subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=self.query_timeout,
+        )
+
+    def _get_runtime_folder_mtime(self) -> int | None:
+        if self.runtime_folder is None:
+            return None
+        try:
+            return os.stat(self.runtime_folder).st_mtime_ns
+        except OSError:
+            return None
+
+    def fetch_installed(self, refresh: bool = False) -> list[Listing]:
+        """
+        Get a list of installed runtimes managed by the manager
+
+        The list is kept until invalidated by an install or uninstall,
+        or until the mtime of the runtime folder changes.
+
+        :param refresh: Query the manager even if the previous list is still valid
+        """
+        mtime = self._get_runtime_folder_mtime()
+        snapshot = self._installed_snapshot
+        if not refresh and snapshot is not None and snapshot[0] == mtime:
+            return snapshot[1]
+
+        installed = self._query_installed()
+        self._installed_snapshot = (mtime, installed)
+        return installed
+
+    def invalidate_installed(self) -> None:
+        """
+        Discard the installed runtime list, call after installing or uninstalling runtimes
+        """
+        self._installed_snapshot = None
+        self._installed_index = None
+
+    def installed_index(self, refresh: bool = False) -> ListingIndex:
+        """
+        Get an index of the installed runtimes, shared until the installed list changes
+
+        :param refresh: Query the manager even if the previous list is still valid
+        """
+        installed = self.fetch_installed(refresh=refresh)
+        index = self._installed_index
+        if index is None or index.listings is not installed:
+            index = self._installed_index = ListingIndex(installed)
+        return index
+
     @abstractmethod
-    def _get_download_cache(self) -> list[Listing]:
+    def _get_download_cache(
+        self,
+        all_versions: bool = False,
+        refresh: bool = False,
+        cache_ttl: float | None = None,
+    ) -> list[Listing]:
         """
-        List all available downloads (cached method)
+        List all available downloads (cached method, unless refresh is True)
+
+        Implementations hold _download_lock while fetching.
+
+        :param all_versions: Include every available version, for managers that support it
+        :param refresh: Ignore any cached download list
+        :param cache_ttl: Maximum age in seconds of download lists cached on disk
+                          by managers that support it, None to not use the disk cache
         """
 
     @abstractmethod
-    def fetch_downloads(self) -> list[Listing]:
+    def fetch_downloads(
+        self,
+        all_versions: bool = False,
+        refresh: bool = False,
+        cache_ttl: float | None = None,
+    ) -> list[Listing]:
         """
         List available downloads, exclude already downloaded (not cached)
+
+        :param all_versions: Include every available version, not just the latest
+                             of each release, for managers that support it
+        :param refresh: Ignore any cached download list
+        :param cache_ttl: Maximum age in seconds of download lists cached on disk
+                          by managers that support it, None to not use the disk cache
         """
 
+    def batch_install_command(self, listings: list[Listing]) -> list[str] | None:
+        """
+        Get a single command that installs all of the listings
+
+        Returns None if the manager can't install several runtimes in one command,
+        in which case each listing is installed with its own install_command.
+
+        :raises FileNotFoundError: If the manager executable can not be found
+        """
+        return None
+
+    def batch_uninstall_command(self, listings: list[Listing]) -> list[str] | None:
+        """
+        Get a single command that uninstalls all of the listings
+
+        Returns None if the manager can't uninstall several runtimes in one command,
+        in which case each listing is uninstalled with its own uninstall_command.
+
+        :raises FileNotFoundError: If the manager executable can not be found
+        """
+        return None
+
+    def uninstall_listings(
+        self,
+        listings: list[Listing],
+    ) -> list[tuple[list[Listing], subprocess.CompletedProcess]]:
+        """
+        Uninstall several runtimes, with one command if the manager supports it
+
+        :param listings: Installed runtimes from this manager
+        :return: (listings, result) for each command that was run
+        :raises FileNotFoundError: If the manager executable can not be found
+        """
+        batch_cmd = self.batch_uninstall_command(listings) if len(listings) > 1 else None
+        if batch_cmd is not None:
+            jobs = [(batch_cmd, listings)]
+        else:
+            jobs = [
+                (cmd, [listing])
+                for listing in listings
+                if (cmd := listing.uninstall_command()) is not None
+            ]
+
+        results = []
+        try:
+            for cmd, job_listings in jobs:
+                result = subprocess.run(cmd, capture_output=True, text=True)
+                results.append((job_listings, result))
+        finally:
+            self.invalidate_installed()
+        return results
+
     def find_matching_listing(self, install: PythonInstall) -> Listing | None:
         if install.managed_by is None or not install.managed_by.startswith(self.organisation):
             return None
 
-        # Executable names may not match, one may find python.exe, the other pypy.exe
-        # Use the parent folder.
-        installed_dict = {
-            os.path.dirname(os.path.abspath(py.path)): py
-            for py in self.fetch_installed()
-            if py.path is not None
-        }
-
-        install_path = os.path.realpath(os.path.dirname(install.executable))
-
-        return installed_dict.get(install_path, None)
+        return self.installed_index().find_install(install)  # type: ignore[return-value]
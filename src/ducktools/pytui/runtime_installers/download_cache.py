@@ -0,0 +1,115 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+On-disk cache of the raw download listings reported by runtime managers.
+
+Listings are stored with the path of the manager executable and its reported version,
+and are used while both match and the entry is younger than the TTL.
+"""
+from __future__ import annotations
+
+import json
+import os
+import os.path
+import time
+
+from ..platform_paths import CACHE_FOLDER
+
+
+DOWNLOAD_CACHE_VERSION = 1
+DOWNLOAD_CACHE_FOLDER = os.path.join(CACHE_FOLDER, f"downloads_v{DOWNLOAD_CACHE_VERSION}")
+
+
+def get_cache_key(executable: str, version: str) -> list[str]:
+    return [os.path.realpath(executable), version]
+
+
+def get_cache_path(name: str, cache_folder: str | None = None) -> str:
+    cache_folder = DOWNLOAD_CACHE_FOLDER if cache_folder is None else cache_folder
+    return os.path.join(cache_folder, f"{name}.json")
+
+
+def load_download_cache(
+    name: str,
+    executable: str,
+    version: str,
+    ttl: float,
+    cache_folder: str | None = None,
+) -> list[dict] | None:
+    """
+    Load cached download entries if they are still valid
+
+    :param name: Name of the cache file, one per manager and listing mode
+    :param executable: Path to the manager executable
+    :param version: Version reported by the manager executable
+    :param ttl: Maximum age of the entries in seconds
+    :param cache_folder: Folder holding the cache files
+    :return: Raw listing entries or None if missing or stale
+    """
+    try:
+        with open(get_cache_path(name, cache_folder)) as f:
+            raw_cache = json.load(f)
+    except (OSError, ValueError):
+        # ValueError covers JSONDecodeError and files that aren't valid text
+        return None
+
+    try:
+        age = time.time() - raw_cache["timestamp"]
+        if not (0 <= age < ttl) or raw_cache["key"] != get_cache_key(executable, version):
+            return None
+        entries = raw_cache["entries"]
+    except (KeyError, TypeError):
+        return None
+
+    return entries if isinstance(entries, list) else None
+
+
+def save_download_cache(
+    name: str,
+    executable: str,
+    version: str,
+    entries: list[dict],
+    cache_folder: str | None = None,
+) -> None:
+    """
+    Store raw download entries for the manager executable
+
+    :param name: Name of the cache file, one per manager and listing mode
+    :param executable: Path to the manager executable
+    :param version: Version reported by the manager executable
+    :param entries: Raw listing entries as reported by the manager
+    :param cache_folder: Folder holding the cache files
+    """
+    cache_path = get_cache_path(name, cache_folder)
+
+    raw_cache = {
+        "key": get_cache_key(executable, version),
+        "timestamp": time.time(),
+        "entries": entries,
+    }
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(raw_cache, f)
+    os.replace(tmp_path, cache_path)
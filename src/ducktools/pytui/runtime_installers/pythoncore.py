@@ -30,11 +30,10 @@ import os.path
 import platform
 import re
 import shutil
-import subprocess
 
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from ducktools.classbuilder.prefab import prefab
+from ducktools.classbuilder.prefab import SlotFields, attribute, prefab
 
 from .base import RuntimeManager, PythonListing
 
@@ -44,12 +43,19 @@ freethreaded_re = re.compile(r"^\d+.\d+t.*$")
 
 @prefab(kw_only=True)
 class PythonCoreListing(PythonListing):
-    manager: PythonCoreManager
-
-    name: str
-    tag: str
-    company: str
-    install_for: list[str]
+    __slots__ = SlotFields(
+        name=attribute(type=str),
+        tag=attribute(type=str),
+        company=attribute(type=str),
+        install_for=attribute(type=list),
+    )
+
+    if TYPE_CHECKING:
+        manager: PythonCoreManager
+        name: str
+        tag: str
+        company: str
+        install_for: list[str]
 
     @classmethod
     def from_dict(cls, manager: PythonCoreManager, entry: dict[str, Any]) -> PythonCoreListing:
@@ -99,7 +105,7 @@ class PythonCoreListing(PythonListing):
                 return True
         return False
 
-    def install(self) -> subprocess.CompletedProcess | None:
+    def install_command(self) -> list[str] | None:
         if self.manager.executable is None:
             raise FileNotFoundError("Could not find the 'pymanager' executable on PATH")
 
@@ -112,17 +118,11 @@ class PythonCoreListing(PythonListing):
         else:
             tag = self.tag
 
-        cmd = [
+        return [
             self.manager.executable, "install", tag, "-y",
         ]
 
-        result = subprocess.run(
-            cmd, capture_output=True, text=True
-        )
-        return result
-
-
-    def uninstall(self) -> subprocess.CompletedProcess | None:
+    def uninstall_command(self) -> list[str] | None:
         if self.manager.executable is None:
             raise FileNotFoundError("Could not find the 'pymanager' executable on PATH")
 
@@ -135,13 +135,9 @@ class PythonCoreListing(PythonListing):
         else:
             tag = self.tag
 
-        cmd = [
+        return [
             self.manager.executable, "uninstall", tag, "-y",
         ]
-        result = subprocess.run(
-            cmd, capture_output=True, text=True
-        )
-        return result
 
 
 class PythonCoreManager(RuntimeManager[PythonCoreListing]):
@@ -151,16 +147,23 @@ class PythonCoreManager(RuntimeManager[PythonCoreListing]):
     def executable(self) -> str | None:
         return shutil.which("pymanager")
 
-    def fetch_installed(self) -> list[PythonCoreListing]:
+    @functools.cached_property
+    def runtime_folder(self) -> str | None:
+        # PyManager's default install_dir, a custom install_dir in its config isn't detected
+        # and only installs and uninstalls made through pytui invalidate the installed list
+        local_appdata = os.environ.get("LOCALAPPDATA")
+        if not local_appdata:
+            return None
+        return os.path.join(local_appdata, "Python")
+
+    def _query_installed(self) -> list[PythonCoreListing]:
         if self.executable is None:
             raise FileNotFoundError("Could not find the 'pymanager' executable on PATH")
         
         cmd = [
             self.executable, "list", "--only-managed", "--format=json",
         ]
-        installed_list_cmd = subprocess.run(
-            cmd, capture_output=True, text=True, check=True,
-        )
+        installed_list_cmd = self._run_query(cmd)
         json_data = json.loads(installed_list_cmd.stdout)
         installed_pys = [
             PythonCoreListing.from_dict(manager=self, entry=v)
@@ -168,40 +171,64 @@ class PythonCoreManager(RuntimeManager[PythonCoreListing]):
         ]
         return installed_pys
 
-    @functools.lru_cache(maxsize=None)
-    def _get_download_cache(self) -> list[PythonCoreListing]:
+    def _get_download_cache(
+        self,
+        all_versions=False,
+        refresh=False,
+        cache_ttl: float | None = None,
+    ) -> list[PythonCoreListing]:
         """
         Get the raw unfiltered download list.
         This is cached to avoid repeated calls to PyManager for downloads.
         This data should only change on new Python releases.
 
+        PyManager always lists every version and the list is only cached in memory,
+        all_versions and cache_ttl are unused.
+
+        :param all_versions: Unused
+        :param refresh: Ignore the cached list and query PyManager again
+        :param cache_ttl: Unused
         :return: List of PythonCoreListings for all downloads
         """
         if self.executable is None:
             raise FileNotFoundError("Could not find the 'pymanager' executable on PATH")
-        
-        cmd = [
-            self.executable, "list", "--online", "--format=json",
-        ]
-        download_list_cmd = subprocess.run(
-            cmd, capture_output=True, text=True, check=True,
-        )
-        json_data = json.loads(download_list_cmd.stdout)
 
-        downloads = [
-            PythonCoreListing.from_dict(manager=self, entry=v)
-            for v in json_data.get("versions", [])
-        ]
+        with self._download_lock:
+            if not refresh and (downloads := self._download_cache.get("online")) is not None:
+                return downloads
+
+            cmd = [
+                self.executable, "list", "--online", "--format=json",
+            ]
+            download_list_cmd = self._run_query(cmd)
+            json_data = json.loads(download_list_cmd.stdout)
+
+            downloads = [
+                PythonCoreListing.from_dict(manager=self, entry=v)
+                for v in json_data.get("versions", [])
+            ]
+            self._download_cache["online"] = downloads
 
         return downloads
 
-    def fetch_downloads(self) -> list[PythonCoreListing]:
+    def fetch_downloads(
+        self,
+        all_versions=False,
+        refresh=False,
+        cache_ttl: float | None = None,
+    ) -> list[PythonCoreListing]:
         """
         Get the filtered list of downloads, with installed versions removed.
 
+        The PyManager download list is only cached in memory, cache_ttl is unused.
+        PyManager always lists every version, all_versions is unused.
+
+        :param all_versions: Unused
+        :param refresh: Query PyManager for the download list again
+        :param cache_ttl: Unused
         :return: filtered download list
         """
-        downloads = self._get_download_cache()
+        downloads = self._get_download_cache(refresh=refresh)
 
         installed_versions = {(v.key, v.version) for v in self.fetch_installed()}
 
@@ -0,0 +1,261 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Run runtime installs as async subprocesses, streaming their output
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import subprocess
+
+from collections.abc import Callable
+
+from ducktools.classbuilder.prefab import Prefab, attribute
+
+from .base import PythonListing, RuntimeManager
+
+
+# Seconds to wait for a cancelled install to exit before killing it
+TERMINATE_TIMEOUT = 5.0
+
+
+class InstallResult(Prefab, kw_only=True):
+    listing: PythonListing
+    returncode: int | None
+    output: list[str] = attribute(default_factory=list)
+    cancelled: bool = False
+    installed: bool = False
+
+    @property
+    def success(self) -> bool:
+        return self.returncode == 0 and not self.cancelled
+
+
+async def terminate_process(
+    proc: asyncio.subprocess.Process,
+    timeout: float = TERMINATE_TIMEOUT,
+) -> int:
+    """
+    Ask a process to exit, killing it if it hasn't exited within timeout seconds
+
+    :return: The process return code
+    """
+    if proc.returncode is not None:
+        return proc.returncode
+    try:
+        proc.terminate()
+        return await asyncio.wait_for(proc.wait(), timeout)
+    except ProcessLookupError:
+        # Exited in the meantime
+        return await proc.wait()
+    except asyncio.TimeoutError:
+        proc.kill()
+        return await proc.wait()
+
+
+async def stream_command(
+    cmd: list[str],
+    on_output: Callable[[str], None] | None = None,
+    cancel_event: asyncio.Event | None = None,
+) -> tuple[int, list[str], bool]:
+    """
+    Run a command, passing each line of combined stdout/stderr output to on_output
+
+    If cancel_event is set before the command finishes, the process is terminated.
+
+    :param cmd: Command to run
+    :param on_output: Called with each line of output as it is produced
+    :param cancel_event: Event to set to cancel the command
+    :return: (returncode, output lines, cancelled)
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    output: list[str] = []
+
+    async def read_output():
+        assert proc.stdout is not None
+        async for raw_line in proc.stdout:
+            line = raw_line.decode(errors="replace").rstrip()
+            output.append(line)
+            if on_output:
+                on_output(line)
+        return await proc.wait()
+
+    read_task = asyncio.ensure_future(read_output())
+    cancel_task = asyncio.ensure_future(
+        asyncio.Event().wait() if cancel_event is None else cancel_event.wait()
+    )
+    try:
+        await asyncio.wait({read_task, cancel_task}, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        read_task.cancel()
+        await terminate_process(proc)
+        raise
+    finally:
+        cancel_task.cancel()
+
+    if read_task.done():
+        return read_task.result(), output, False
+
+    # Let the reader collect any output written while terminating
+    returncode = await terminate_process(proc)
+    try:
+        await asyncio.wait_for(read_task, TERMINATE_TIMEOUT)
+    except asyncio.TimeoutError:
+        pass
+    return returncode, output, True
+
+
+async def _run_install_command(
+    manager: RuntimeManager,
+    cmd: list[str],
+    listings: list[PythonListing],
+    on_output: Callable[[str], None] | None,
+    cancel_event: asyncio.Event | None,
+) -> list[InstallResult]:
+    # Run one install command for the listings and check which ended up installed
+    try:
+        returncode, output, cancelled = await stream_command(
+            cmd,
+            on_output=on_output,
+            cancel_event=cancel_event,
+        )
+    finally:
+        manager.invalidate_installed()
+
+    loop = asyncio.get_running_loop()
+    installed = await loop.run_in_executor(
+        None,
+        functools.partial(manager.installed_index, refresh=True),
+    )
+
+    return [
+        InstallResult(
+            listing=listing,
+            returncode=returncode,
+            output=output,
+            cancelled=cancelled,
+            installed=listing.full_key in installed.by_key,
+        )
+        for listing in listings
+    ]
+
+
+async def stream_install(
+    listing: PythonListing,
+    on_output: Callable[[str], None] | None = None,
+    cancel_event: asyncio.Event | None = None,
+) -> InstallResult | None:
+    """
+    Install a runtime, streaming the manager output
+
+    After the install finishes or is cancelled the manager is queried to
+    check if the runtime is installed, so partial installs can be reported.
+
+    :param listing: Runtime to install
+    :param on_output: Called with each line of output from the manager
+    :param cancel_event: Event to set to cancel the install
+    :return: The install result or None if the runtime was already installed
+    :raises FileNotFoundError: If the manager executable can not be found
+    """
+    cmd = listing.install_command()
+    if cmd is None:
+        return None
+
+    results = await _run_install_command(
+        listing.manager,
+        cmd,
+        [listing],
+        on_output,
+        cancel_event,
+    )
+    return results[0]
+
+
+async def stream_batch_install(
+    listings: list[PythonListing],
+    on_output: Callable[[str], None] | None = None,
+    cancel_event: asyncio.Event | None = None,
+) -> list[InstallResult]:
+    """
+    Install several runtimes, streaming the manager output
+
+    Each manager installs its runtimes with one batched command if it supports it,
+    otherwise one at a time. Different managers run concurrently.
+
+    :param listings: Runtimes to install
+    :param on_output: Called with each line of output from the managers
+    :param cancel_event: Event to set to cancel the remaining installs
+    :return: Results for the listings that weren't already installed, in listing order
+    :raises FileNotFoundError: If a manager executable can not be found
+    """
+    groups: dict[RuntimeManager, list[PythonListing]] = {}
+    for listing in listings:
+        groups.setdefault(listing.manager, []).append(listing)
+
+    # Get every command first so a missing manager fails before anything is run
+    jobs: dict[RuntimeManager, list[tuple[list[str], list[PythonListing]]]] = {}
+    for manager, group in groups.items():
+        batch_cmd = manager.batch_install_command(group) if len(group) > 1 else None
+        if batch_cmd is not None:
+            jobs[manager] = [(batch_cmd, [listing for listing in group if not listing.path])]
+        else:
+            jobs[manager] = [
+                (cmd, [listing])
+                for listing in group
+                if (cmd := listing.install_command()) is not None
+            ]
+
+    async def run_jobs(manager, manager_jobs):
+        results = []
+        for cmd, job_listings in manager_jobs:
+            if cancel_event is not None and cancel_event.is_set():
+                results.extend(
+                    InstallResult(listing=listing, returncode=None, cancelled=True)
+                    for listing in job_listings
+                )
+                continue
+            results.extend(
+                await _run_install_command(manager, cmd, job_listings, on_output, cancel_event)
+            )
+        return results
+
+    manager_results = await asyncio.gather(
+        *(run_jobs(manager, manager_jobs) for manager, manager_jobs in jobs.items())
+    )
+
+    results_by_key = {
+        result.listing.full_key: result
+        for results in manager_results
+        for result in results
+    }
+    return [
+        results_by_key[listing.full_key]
+        for listing in listings
+        if listing.full_key in results_by_key
+    ]
@@ -27,24 +27,41 @@ import json
 import os.path
 import shutil
 import subprocess
-from pathlib import Path
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 
-from ducktools.classbuilder.prefab import get_attributes, prefab
+from ducktools.classbuilder.prefab import SlotFields, attribute, get_attributes, prefab
 
 from .base import RuntimeManager, PythonListing
+from .download_cache import load_download_cache, save_download_cache
+
+
+@functools.cache
+def _entry_fields(cls: type[PythonListing]) -> frozenset[str]:
+    # Fields that can be filled directly from a 'uv python list' entry
+    return frozenset(
+        name for name, attrib in get_attributes(cls).items()
+        if attrib.init and name != "manager"
+    )
 
 
 @prefab(kw_only=True)
 class UVPythonListing(PythonListing):
-    manager: UVManager
-
     # These extra parts are UV Specific
-    version_parts: dict
-    symlink: str | None
-    os: str
-    libc: str | None  # Apparently this is the string "none" instead of an actual None.
+    __slots__ = SlotFields(
+        version_parts=attribute(type=dict),
+        symlink=attribute(),
+        os=attribute(type=str),
+        # Apparently this is the string "none" instead of an actual None.
+        libc=attribute(),
+    )
+
+    if TYPE_CHECKING:
+        manager: UVManager
+        version_parts: dict
+        symlink: str | None
+        os: str
+        libc: str | None
 
     def __prefab_post_init__(self, key: str, path: str | None) -> None:
         if path is None:
@@ -53,28 +70,34 @@ class UVPythonListing(PythonListing):
         else:
             # Resolve path always, sometimes UV gives a relative path to cwd.
             # Sometimes the path is also a symlink
-            self.path = os.path.realpath(os.path.abspath(path))
+            self.path = os.path.realpath(path)
+            self.key = key
 
             # UV bug - key and path can mismatch if someone typoed the metadata
-            base_path = self.manager.runtime_folder
+            base_path = self.manager.resolved_runtime_folder
             if base_path:
-                base_path = os.path.realpath(base_path)  # resolve base path symlink too
-                key_path = str(Path(self.path).relative_to(base_path).parts[0])
-                self.key = key if key == key_path else key_path
+                prefix = os.path.normcase(os.path.join(base_path, ""))
+                if os.path.normcase(self.path).startswith(prefix):
+                    self.key = self.path[len(prefix):].split(os.sep, 1)[0]
 
     @classmethod
     def from_dict(cls, manager: UVManager, entry: dict[str, Any]) -> UVPythonListing:
         # designed to not fail if extra keys are added
-        attrib_names = set(get_attributes(cls))
-
-        kwargs = entry.copy()
-        for key in entry.keys():
-            if key not in attrib_names:
-                del kwargs[key]
+        fields = _entry_fields(cls)
+        return cls(manager=manager, **{k: v for k, v in entry.items() if k in fields})
 
-        return cls(manager=manager, **kwargs)
+    @classmethod
+    def from_entries(cls, manager: UVManager, entries: list[dict[str, Any]]) -> list[UVPythonListing]:
+        """
+        Create listings for all entries from the output of 'uv python list'
+        """
+        fields = _entry_fields(cls)
+        return [
+            cls(manager=manager, **{k: v for k, v in entry.items() if k in fields})
+            for entry in entries
+        ]
 
-    def install(self) -> subprocess.CompletedProcess | None:
+    def install_command(self) -> list[str] | None:
         if self.manager.executable is None:
             raise FileNotFoundError("Could not find the 'uv' executable on PATH")
 
@@ -82,20 +105,14 @@ class UVPythonListing(PythonListing):
             # Can't install already installed Python
             return None
 
-        cmd = [
+        return [
             self.manager.executable, "python", "install",
             self.key,
             "--color", "never",
             "--no-progress",
         ]
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-        )
-        return result
 
-    def uninstall(self) -> subprocess.CompletedProcess | None:
+    def uninstall_command(self) -> list[str] | None:
         if self.manager.executable is None:
             raise FileNotFoundError("Could not find the 'uv' executable on PATH")
 
@@ -103,18 +120,12 @@ class UVPythonListing(PythonListing):
             # Can't uninstall non-installed Python
             return None
 
-        cmd = [
+        return [
             self.manager.executable, "python", "uninstall",
             self.key,
             "--color", "never",
             "--no-progress",
         ]
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-        )
-        return result
 
 
 class UVManager(RuntimeManager[UVPythonListing]):
@@ -124,6 +135,25 @@ class UVManager(RuntimeManager[UVPythonListing]):
     def executable(self) -> str | None:
         return shutil.which("uv")
 
+    @functools.cached_property
+    def version(self) -> str | None:
+        """
+        Get the version string reported by `uv --version`, used to key the download cache
+        """
+        if self.executable is None:
+            return None
+        try:
+            cmd = subprocess.run(
+                [self.executable, "--version"],
+                check=True,
+                capture_output=True,
+                text=True,
+                timeout=self.query_timeout,
+            )
+        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            return None
+        return cmd.stdout.strip()
+
     @functools.cached_property
     def runtime_folder(self) -> str | None:
         try:
@@ -132,80 +162,152 @@ class UVManager(RuntimeManager[UVPythonListing]):
                 check=True,
                 capture_output=True,
                 text=True,
+                timeout=self.query_timeout,
             )
-        except (FileNotFoundError, subprocess.CalledProcessError):
+        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
             py_dir = None
         else:
             py_dir = cmd.stdout.strip()
         return py_dir
 
-    def fetch_installed(self) -> list[UVPythonListing]:
+    @functools.cached_property
+    def resolved_runtime_folder(self) -> str | None:
+        """
+        runtime_folder with any symlinks resolved, to match resolved listing paths
+        """
+        return os.path.realpath(self.runtime_folder) if self.runtime_folder else None
+
+    def _query_installed(self) -> list[UVPythonListing]:
         """
         Fetch Python installs managed by UV
         """
         if self.executable is None:
             raise FileNotFoundError("Could not find the 'uv' executable on PATH")
 
-        installed_list_cmd = subprocess.run(
+        installed_list_cmd = self._run_query(
             [
                 self.executable, "python", "list",
                 "--output-format", "json",
                 "--only-installed",
                 "--python-preference", "only-managed",
                 "--all-versions",
-            ],
-            capture_output=True,
-            text=True,
-            check=True,
+            ]
         )
         json_data = json.loads(installed_list_cmd.stdout)
-        installed_pys = [
-            UVPythonListing.from_dict(manager=self, entry=v) for v in json_data
-        ]
+        installed_pys = UVPythonListing.from_entries(manager=self, entries=json_data)
 
         return installed_pys
 
-    @functools.lru_cache(maxsize=None)
-    def _get_download_cache(self, all_versions=False) -> list[UVPythonListing]:
+    def _get_download_cache(
+        self,
+        all_versions=False,
+        refresh=False,
+        cache_ttl: float | None = None,
+    ) -> list[UVPythonListing]:
         if self.executable is None:
             raise FileNotFoundError("Could not find the 'uv' executable on PATH")
 
-        cmd = [
-            self.executable, "python", "list",
-            "--output-format", "json",
-            "--only-downloads",
+        with self._download_lock:
+            if not refresh and (downloads := self._download_cache.get(all_versions)) is not None:
+                return downloads
+
+            cache_name = "uv_all_versions" if all_versions else "uv"
+            # The disk cache needs a TTL and the uv version to key the listing on
+            version = self.version if cache_ttl else None
+
+            downloads = None
+            if cache_ttl and version is not None and not refresh:
+                cached_list = load_download_cache(
+                    cache_name, self.executable, version, cache_ttl
+                )
+                if cached_list is not None:
+                    try:
+                        downloads = UVPythonListing.from_entries(manager=self, entries=cached_list)
+                    except (AttributeError, TypeError, ValueError):
+                        # Corrupted entries are treated as a cache miss
+                        downloads = None
+
+            if downloads is None:
+                cmd = [
+                    self.executable, "python", "list",
+                    "--output-format", "json",
+                    "--only-downloads",
+                ]
+                if all_versions:
+                    cmd.append("--all-versions")
+
+                download_list_cmd = self._run_query(cmd)
+                full_download_list = json.loads(download_list_cmd.stdout)
+                downloads = UVPythonListing.from_entries(manager=self, entries=full_download_list)
+
+                if cache_ttl and version is not None:
+                    try:
+                        save_download_cache(cache_name, self.executable, version, full_download_list)
+                    except OSError:
+                        pass
+
+            self._download_cache[all_versions] = downloads
+            return downloads
+
+    def batch_install_command(self, listings: list[UVPythonListing]) -> list[str] | None:
+        if self.executable is None:
+            raise FileNotFoundError("Could not find the 'uv' executable on PATH")
+
+        keys = [listing.key for listing in listings if not listing.path]
+        if not keys:
+            return None
+
+        return [
+            self.executable, "python", "install",
+            *keys,
+            "--color", "never",
+            "--no-progress",
         ]
-        if all_versions:
-            cmd.append("--all-versions")
-
-        download_list_cmd = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        full_download_list = json.loads(download_list_cmd.stdout)
 
-        downloads = [
-            UVPythonListing.from_dict(manager=self, entry=v)
-            for v in full_download_list
+    def batch_uninstall_command(self, listings: list[UVPythonListing]) -> list[str] | None:
+        if self.executable is None:
+            raise FileNotFoundError("Could not find the 'uv' executable on PATH")
+
+        keys = [
+            listing.key for listing in listings
+            if listing.path and os.path.exists(listing.path)
         ]
-        return downloads
+        if not keys:
+            return None
 
-    def fetch_downloads(self, all_versions=False) -> list[UVPythonListing]:
+        return [
+            self.executable, "python", "uninstall",
+            *keys,
+            "--color", "never",
+            "--no-progress",
+        ]
+
+    def fetch_downloads(
+        self,
+        all_versions=False,
+        refresh=False,
+        cache_ttl: float | None = None,
+    ) -> list[UVPythonListing]:
         """
         Get available UV downloads and filter out any installs that are already present.
 
         :param all_versions: Include *ALL* possible installs
+        :param refresh: Ignore the in memory and on disk download caches
+        :param cache_ttl: Maximum age in seconds of the download list cached on disk,
+                          None to not use the disk cache
         :return: list of possible python installs
         """
-        downloads = self._get_download_cache(all_versions=all_versions)
+        downloads = self._get_download_cache(
+            all_versions=all_versions,
+            refresh=refresh,
+            cache_ttl=cache_ttl,
+        )
 
-        installed_keys = {v.key for v in self.fetch_installed()}
+        installed = self.installed_index()
 
         download_listings = self.sort_listings(
             v for v in downloads
-            if v.key not in installed_keys
+            if v.full_key not in installed.by_key
         )
 
         return download_listings
@@ -30,37 +30,62 @@ import asyncio
 import functools
 import subprocess
 import sysconfig
+import threading
 
 from typing import overload, TYPE_CHECKING
 
 from ducktools.pythonfinder import PythonInstall
-from ducktools.pythonfinder.venv import list_python_venvs, PythonVEnv, PythonPackage
+from ducktools.pythonfinder.venv import PythonVEnv, PythonPackage
 
 from textual import work, markup
 from textual.app import App
 from textual.binding import Binding
-from textual.containers import Vertical
+from textual.actions import SkipAction
+from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
 from textual.validation import Length
-from textual.widgets import Button, DataTable, Footer, Header, Input
+from textual.widget import Widget
+from textual.widgets import Button, Checkbox, DataTable, Footer, Header, Input, Log, Select
 from textual.widgets.data_table import CellDoesNotExist
 
 
 from ._version import __version__ as app_version
 from .commands import launch_repl, launch_shell, create_venv, delete_venv
 from .config import Config
+from .discovery import (
+    DiscoveryTimings,
+    ScanLimits,
+    VEnvWatcher,
+    watched_parent_folders,
+    run_discovery,
+    run_sources,
+    get_runtime_cache_key,
+    load_cached_installs,
+    save_cached_installs,
+    load_cached_venvs,
+    iter_venvs,
+    stream_discovery,
+)
 from .util import list_installs_deduped
 from .runtime_installers import (
+    LISTING_FACETS,
+    InstallResult,
+    ListingIndex,
     PythonListing,
+    RuntimeManager,
     fetch_downloads,
-    find_matching_listing,
+    find_matching_listings,
     get_managers,
+    stream_batch_install,
 )
 
 
 CWD = os.getcwd()
 HOME = os.environ.get("HOME")
 
+# Set to show discovery timings as a notification on launch
+DISCOVERY_TIMINGS_ENV_VAR = "PYTUI_DISCOVERY_TIMINGS"
+
 # This mapping handles nicer user facing names for "managed by"
 MANAGED_BY_MAPPING = {
     "Astral": "Astral uv",  # UV Python Installer
@@ -87,10 +112,44 @@ def substitute_home(p, homedir=HOME):
     return p
 
 
+def notify_manager_errors(node, errors: list[tuple[RuntimeManager, Exception]]) -> None:
+    """
+    Show a notification for each runtime manager that failed or timed out.
+
+    :param node: Screen or App to notify from
+    :param errors: (manager, exception) pairs collected from the runtime manager queries
+    """
+    for manager, e in errors:
+        node.notify(
+            f"{manager.organisation}: {markup.escape(str(e))}",
+            title="Runtime Manager Error",
+            severity="error",
+        )
+
+
+def mark_cell(value: str, marked: bool, mark: str = "*") -> str:
+    """
+    Get the text for the first cell of a row, showing the mark if it is marked for a batch action
+    """
+    return f"{mark} {value}" if marked else value
+
+
 class InstallableRuntimeTable(DataTable):
+    MARK = "*"
+
     def __init__(self, runtimes: list[PythonListing], *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.runtimes = runtimes
+        # full_key of runtimes marked for a batch install
+        self.marked: set[str] = set()
+        self._version_column = None
+
+    @property
+    def marked_runtimes(self) -> list[PythonListing]:
+        """
+        Shown runtimes marked for install, in table order
+        """
+        return [dl for dl in self.runtimes if dl.full_key in self.marked]
 
     def on_mount(self):
         self.setup_columns()
@@ -98,7 +157,9 @@ class InstallableRuntimeTable(DataTable):
 
     def setup_columns(self):
         self.cursor_type = "row"
-        self.add_columns("Version", "Manager", "Implementation", "Variant", "Architecture")
+        self._version_column, *_ = self.add_columns(
+            "Version", "Manager", "Implementation", "Variant", "Architecture"
+        )
 
     def list_downloads(self):
         for dl in self.runtimes:
@@ -108,7 +169,7 @@ class InstallableRuntimeTable(DataTable):
             )
 
             self.add_row(
-                dl.version,
+                mark_cell(dl.version, dl.full_key in self.marked, self.MARK),
                 manager,
                 dl.implementation,
                 dl.variant,
@@ -116,26 +177,83 @@ class InstallableRuntimeTable(DataTable):
                 key=dl.full_key,
             )
 
+    def toggle_mark(self):
+        """
+        Mark or unmark the runtime under the cursor and move to the next row
+        """
+        try:
+            row = self.coordinate_to_cell_key(self.cursor_coordinate)
+        except CellDoesNotExist:
+            return
+
+        key = row.row_key.value
+        if key in self.marked:
+            self.marked.discard(key)
+        else:
+            self.marked.add(key)
+
+        version = next(dl.version for dl in self.runtimes if dl.full_key == key)
+        self.update_cell(row.row_key, self._version_column, mark_cell(version, key in self.marked, self.MARK))
+
+        self.action_cursor_down()
+
 
-class RuntimeInstallScreen(ModalScreen[PythonListing | None]):
+class RuntimeInstallScreen(ModalScreen[list[PythonListing] | None]):
     BINDINGS = [
         Binding(key="enter", action="install", description="Install Runtime", priority=True, show=True),
+        Binding(key="space", action="toggle_mark", description="Mark for Install", show=True),
+        Binding(key="ctrl+f", action="focus_filter", description="Filter", show=True),
+        Binding(key="ctrl+t", action="toggle_all_versions", description="All Versions", show=True),
+        Binding(key="ctrl+r", action="refresh_downloads", description="Refresh Downloads", show=True),
         Binding(key="escape", action="cancel", description="Cancel", show=True),
     ]
 
-    def __init__(self, *args, **kwargs):
+    AUTO_FOCUS = "InstallableRuntimeTable"
+
+    # Most rows put in the table at once, the filters narrow down larger catalogues
+    MAX_ROWS = 500
+
+    def __init__(
+        self,
+        *args,
+        cache_ttl: float | None = None,
+        runtimes: list[PythonListing] | None = None,
+        **kwargs,
+    ):
+        """
+        :param cache_ttl: Maximum age in seconds of download lists cached on disk
+        :param runtimes: Previously fetched downloads to show while the list is loaded
+        """
         super().__init__(*args, **kwargs)
-        self.runtimes = fetch_downloads()
-        self.install_table = InstallableRuntimeTable(self.runtimes)
+        self.cache_ttl = cache_ttl
+        self.all_versions = False
+        self.runtimes = [] if runtimes is None else runtimes
+        self.runtime_index = ListingIndex(self.runtimes)
+        self.install_table = InstallableRuntimeTable(self.runtimes[:self.MAX_ROWS])
+        self._match_count = len(self.runtimes)
+
+        self.version_filter = Input(placeholder="Version prefix", id="version_filter")
+        self.facet_filters: dict[str, Select[str]] = {
+            facet: Select([], prompt=facet.title(), id=f"{facet}_filter")
+            for facet in LISTING_FACETS
+        }
+        self.all_versions_toggle = Checkbox("All versions", id="all_versions")
 
         self.install_button = Button("Install", variant="success", id="install")
         self.cancel_button = Button("Cancel", id="cancel")
 
     @property
-    def runtimes_by_key(self):
-        return {
-            v.full_key: v for v in self.runtimes
-        }
+    def filter_widgets(self) -> list[Widget]:
+        return [self.version_filter, *self.facet_filters.values(), self.all_versions_toggle]
+
+    def on_mount(self):
+        self.update_filter_options()
+        self.update_status()
+        self.load_downloads()
+
+    @property
+    def runtimes_by_key(self) -> dict[str, PythonListing]:
+        return self.runtime_index.by_key
 
     @property
     def selected_runtime(self) -> PythonListing | None:
@@ -146,31 +264,266 @@ class RuntimeInstallScreen(ModalScreen[PythonListing | None]):
         except CellDoesNotExist:
             return None
 
-        return self.runtimes_by_key.get(row.row_key.value)
+        key = row.row_key.value
+        if key is None:
+            return None
+        return self.runtime_index.get(key)
 
     def compose(self):
-        vert = Vertical(classes="boxed")
-        vert.border_title = "Installable Python Runtimes"
-        with vert:
+        self.box = Vertical(classes="boxed")
+        self.box.border_title = "Installable Python Runtimes"
+        with self.box:
+            with Horizontal(classes="filter_bar"):
+                yield from self.filter_widgets
             yield self.install_table
             yield Footer()
 
+    def update_status(self):
+        status = []
+        if marked := self.install_table.marked:
+            status.append(f"{len(marked)} marked")
+        shown = self.install_table.runtimes
+        if len(shown) < self._match_count:
+            status.append(f"showing {len(shown)} of {self._match_count}, filter to see more")
+        self.box.border_subtitle = ", ".join(status) or None
+
+    def update_filter_options(self):
+        """
+        Offer the values present in the current downloads in the filter dropdowns
+        """
+        for facet, select in self.facet_filters.items():
+            value = select.value
+            values = self.runtime_index.facet_values(facet)
+            with select.prevent(Select.Changed):
+                select.set_options((v, v) for v in values)
+                if value in values:
+                    select.value = value
+
+    def apply_filter(self):
+        """
+        Put only the downloads matching the filters into the table
+        """
+        facet_values = {
+            facet: None if select.value == Select.NULL else select.value
+            for facet, select in self.facet_filters.items()
+        }
+        matches = self.runtime_index.filter(
+            version_prefix=self.version_filter.value.strip(),
+            **facet_values,
+        )
+        self._match_count = len(matches)
+        shown = matches[:self.MAX_ROWS]
+
+        table = self.install_table
+        if [r.full_key for r in shown] != [r.full_key for r in table.runtimes]:
+            table.runtimes = shown
+            table.clear()
+            table.list_downloads()
+        self.update_status()
+
+    def on_input_changed(self, event: Input.Changed):
+        if event.input is self.version_filter:
+            self.apply_filter()
+
+    def on_input_submitted(self, event: Input.Submitted):
+        if event.input is self.version_filter:
+            self.set_focus(self.install_table)
+
+    def on_select_changed(self, event: Select.Changed):
+        self.apply_filter()
+
+    def on_checkbox_changed(self, event: Checkbox.Changed):
+        if event.checkbox is self.all_versions_toggle and event.value != self.all_versions:
+            self.all_versions = event.value
+            self.install_table.loading = True
+            self.load_downloads()
+
+    def action_focus_filter(self):
+        self.set_focus(self.version_filter)
+
+    def action_toggle_all_versions(self):
+        self.all_versions_toggle.toggle()
+
+    def action_toggle_mark(self):
+        self.install_table.toggle_mark()
+        self.update_status()
+
+    @property
+    def runtimes_to_install(self) -> list[PythonListing]:
+        """
+        The marked runtimes, or the selected runtime if none are marked
+        """
+        marked = self.install_table.marked
+        if marked:
+            # Include marked runtimes hidden by the current filter
+            return [r for r in self.runtimes if r.full_key in marked]
+        selected = self.selected_runtime
+        return [] if selected is None else [selected]
+
     def action_install(self):
-        if self.focused == self.install_table or self.focused == self.install_button:
-            self.dismiss(self.selected_runtime)
+        focused = self.focused
+        if focused == self.install_table or focused == self.install_button:
+            self.dismiss(self.runtimes_to_install or None)
+        elif focused is not None and any(
+            w in self.filter_widgets for w in focused.ancestors_with_self
+        ):
+            # Let the filter widgets handle enter themselves
+            raise SkipAction()
         else:
             self.dismiss(None)
 
     def action_cancel(self):
         self.dismiss(None)
 
+    def action_refresh_downloads(self):
+        """
+        Ignore the cached download lists and query the runtime managers again
+        """
+        self.load_downloads(refresh=True)
+
+    @work(exclusive=True)
+    async def load_downloads(self, refresh=False):
+        """
+        Fetch the available downloads without blocking the UI.
+
+        Any prefetched downloads stay visible until the new list arrives.
+        """
+        table = self.install_table
+        if refresh or not self.runtimes:
+            table.loading = True
+        errors = []
+        try:
+            loop = asyncio.get_running_loop()
+            runtimes = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    fetch_downloads,
+                    refresh=refresh,
+                    cache_ttl=self.cache_ttl,
+                    on_error=lambda manager, e: errors.append((manager, e)),
+                    all_versions=self.all_versions,
+                ),
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            self.notify(
+                f"Could not list downloads: {markup.escape(str(e))}",
+                title="Runtime Manager Error",
+                severity="error",
+            )
+        else:
+            self.runtimes = runtimes
+            self.runtime_index = index = await loop.run_in_executor(None, ListingIndex, runtimes)
+            # Forget marks for runtimes no longer listed
+            table.marked.intersection_update(index.by_key)
+            self.update_filter_options()
+            self.apply_filter()
+        finally:
+            table.loading = False
+            notify_manager_errors(self, errors)
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "install":
-            self.dismiss(self.selected_runtime)
+            self.dismiss(self.runtimes_to_install or None)
         else:
             self.dismiss(None)
 
 
+def install_summary(result: InstallResult) -> str:
+    key = result.listing.key
+    if result.success:
+        return f"{key} installed successfully"
+    elif result.cancelled:
+        if result.installed:
+            return f"Install cancelled, but {key} had already been installed"
+        return f"Install cancelled, {key} was not installed"
+    elif result.installed:
+        return f"{key} installed, but the manager exited with code {result.returncode}"
+    return f"Install of {key} failed with exit code {result.returncode}"
+
+
+class InstallProgressScreen(ModalScreen[list[InstallResult] | None]):
+    BINDINGS = [
+        Binding(key="escape", action="cancel", description="Cancel Install", show=True),
+        Binding(key="enter", action="close", description="Close", show=True),
+    ]
+
+    runtimes: list[PythonListing]
+    results: list[InstallResult] | None
+
+    def __init__(self, runtimes: list[PythonListing], *args, **kwargs):
+        """
+        :param runtimes: Runtimes to install
+        """
+        super().__init__(*args, **kwargs)
+        self.runtimes = runtimes
+        self.results = None
+        self.output_log = Log(classes="boxed_limitheight")
+        self._cancel_event = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.results is not None
+
+    def compose(self):
+        self.box = Vertical(classes="boxed")
+        if len(self.runtimes) == 1:
+            self.box.border_title = f"Installing {self.runtimes[0].key}"
+        else:
+            self.box.border_title = f"Installing {len(self.runtimes)} runtimes"
+        with self.box:
+            yield self.output_log
+            yield Footer()
+
+    def on_mount(self):
+        self.run_install()
+
+    def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
+        if action == "close":
+            return self.finished
+        return True
+
+    @work(exclusive=True)
+    async def run_install(self):
+        keys = ", ".join(runtime.key for runtime in self.runtimes)
+        self.output_log.write_line(f"Installing {keys}...")
+        try:
+            results = await stream_batch_install(
+                self.runtimes,
+                on_output=self.output_log.write_line,
+                cancel_event=self._cancel_event,
+            )
+        except OSError as e:
+            self.notify(
+                f"Install Failed: {markup.escape(str(e))}",
+                title="Manager Not Found" if isinstance(e, FileNotFoundError) else "Failed Install",
+                severity="error",
+            )
+            self.dismiss(None)
+            return
+
+        self.results = results
+        if all(result.success for result in results):
+            self.dismiss(results)
+            return
+
+        # Leave the output visible on failure so it can be read
+        for result in results:
+            self.output_log.write_line(install_summary(result))
+        self.box.border_subtitle = "Press enter to close"
+        self.refresh_bindings()
+
+    def action_cancel(self):
+        if self.finished:
+            self.dismiss(self.results)
+        elif not self._cancel_event.is_set():
+            self.output_log.write_line("Cancelling install...")
+            self._cancel_event.set()
+
+    def action_close(self):
+        if self.finished:
+            self.dismiss(self.results)
+
+
 class DependencyScreen(ModalScreen[list[PythonPackage]]):
     BINDINGS = [
         Binding(key="r", action="reload_dependencies", description="Reload Dependencies", show=True),
@@ -281,6 +634,7 @@ class VEnvTable(DataTable):
         Binding(key="ctrl+r", action="venv_scan", description="Recursively Scan for VEnvs", show=True),
         Binding(key="p", action="app.list_venv_packages", description="List Packages", show=True),
         Binding(key="delete", action="app.delete_venv", description="Delete VEnv", show=True),
+        Binding(key="escape", action="cancel_scan", description="Cancel Scan", show=True),
     ]
 
     def __init__(self, *args, config, **kwargs):
@@ -290,10 +644,20 @@ class VEnvTable(DataTable):
         self.config = config
 
         self._venv_catalogue = {}
+        self._venv_is_global = {}
+
+        # Set while a scan is running so it can be cancelled
+        self._scan_cancel_event: threading.Event | None = None
+        self._watcher: VEnvWatcher | None = None
 
     def on_mount(self):
         self.setup_columns()
-        self.call_after_refresh(self.load_venvs, clear_first=False)
+
+    def on_unmount(self):
+        if self._watcher is not None:
+            # Don't block the event loop waiting for the watcher thread
+            self._watcher.stop(wait=False)
+            self._watcher = None
 
     def setup_columns(self):
         self.cursor_type = "row"
@@ -311,6 +675,7 @@ class VEnvTable(DataTable):
 
     def add_venv(self, venv: PythonVEnv, sort=False, global_venv=False):
         self._venv_catalogue[venv.folder] = venv
+        self._venv_is_global[venv.folder] = global_venv
 
         if global_venv:
             self.add_row(
@@ -335,6 +700,92 @@ class VEnvTable(DataTable):
     def remove_venv(self, venv: PythonVEnv):
         self.remove_row(row_key=venv.folder)
         self._venv_catalogue.pop(venv.folder)
+        self._venv_is_global.pop(venv.folder, None)
+
+    def update_venvs(self, venvs: list[PythonVEnv], global_venv=False):
+        """
+        Add new venvs to the table and replace rows for venvs that have changed.
+
+        Rows are not sorted, call sort_by_path after applying all changes.
+        """
+        for venv in venvs:
+            if (old_venv := self._venv_catalogue.get(venv.folder)) is not None:
+                if self._venv_is_global[venv.folder] != global_venv:
+                    # Already listed from the other source
+                    continue
+                elif old_venv == venv:
+                    continue
+                self.remove_venv(old_venv)
+
+            self.add_venv(venv, global_venv=global_venv)
+
+    def remove_missing_venvs(self, folders: set[str], global_venv=False):
+        """
+        Remove the local or global venvs that are not in `folders`
+        """
+        for folder, is_global in list(self._venv_is_global.items()):
+            if is_global == global_venv and folder not in folders:
+                self.remove_venv(self._venv_catalogue[folder])
+
+    def apply_venvs(self, venvs: list[PythonVEnv], global_venv=False):
+        """
+        Update the local or global venvs in the table to match a new list,
+        only changing rows that differ.
+
+        Rows are not sorted, call sort_by_path after applying all changes.
+        """
+        self.remove_missing_venvs({v.folder for v in venvs}, global_venv=global_venv)
+        self.update_venvs(venvs, global_venv=global_venv)
+
+    @work
+    async def start_watching(self):
+        """
+        Watch the searched folders for venvs created or deleted outside of pytui.
+
+        Only venvs directly inside the working directory, the searched parent folders
+        and the global venv folder are updated. The filesystem root and the
+        folders above the home folder are not watched.
+        """
+        if self._watcher is not None:
+            return
+
+        folders = [CWD]
+        if "parents" in self.config.venv_search_mode:
+            folders.extend(watched_parent_folders(CWD))
+        if os.path.exists(self.config.global_venv_folder):
+            folders.append(self.config.global_venv_folder)
+
+        watcher = VEnvWatcher(folders, self._on_watched_change)
+        await run_discovery(watcher.start)
+        self._watcher = watcher
+
+    def _on_watched_change(self, folder: str, venv: PythonVEnv | None):
+        # Called from the watcher thread
+        try:
+            self.app.call_from_thread(self.apply_watched_change, folder, venv)
+        except RuntimeError:
+            # The app is shutting down
+            pass
+
+    def apply_watched_change(self, folder: str, venv: PythonVEnv | None):
+        """
+        Update a single venv row after a change seen by the watcher
+        """
+        old_venv = self._venv_catalogue.get(folder)
+        if old_venv == venv:
+            return
+        if old_venv is not None:
+            self.remove_venv(old_venv)
+        if venv is not None:
+            global_venv_folder = self.config.global_venv_folder
+            global_venv = os.path.commonpath([folder, global_venv_folder]) == global_venv_folder
+            self.add_venv(venv, sort=True, global_venv=global_venv)
+        self.refresh_bindings()
+
+    def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
+        if action == "cancel_scan":
+            return self._scan_cancel_event is not None
+        return True
 
     def action_venv_scan(self):
         """
@@ -342,13 +793,42 @@ class VEnvTable(DataTable):
         """
         self.load_venvs(full_search=True, clear_first=True)
 
-    @work
-    async def load_venvs(self, full_search=False, clear_first=True):
+    def action_cancel_scan(self):
+        """
+        Stop the running scan, keeping the venvs found so far
+        """
+        if self._scan_cancel_event is not None:
+            self._scan_cancel_event.set()
+
+    # Starting a new scan cancels any scan already running
+    @work(exclusive=True, group="venv_scan")
+    async def load_venvs(
+        self,
+        full_search=False,
+        clear_first=True,
+        timings: DiscoveryTimings | None = None,
+    ):
+        """
+        Load venvs into the table.
+
+        Venvs found by the previous scan are shown from the index immediately.
+        New venvs are added in batches while the scan runs, with the table sorted
+        and missing venvs removed once it completes.
+
+        If the scan is cancelled or runs out of time the venvs found so far are
+        kept and the results are marked as incomplete.
+        """
+        cancel_event = threading.Event()
+        self._scan_cancel_event = cancel_event
+        self.refresh_bindings()
+
+        incomplete = False
         self.loading = True
         try:
             if clear_first:
                 self.clear(columns=False)
                 self._venv_catalogue = {}
+                self._venv_is_global = {}
 
             if full_search:
                 recursive, search_parent_folders = True, True
@@ -357,60 +837,101 @@ class VEnvTable(DataTable):
                 search_parent_folders = "parents" in self.config.venv_search_mode
 
             global_venv_folder = self.config.global_venv_folder
+            global_exists = os.path.exists(global_venv_folder)
 
-            loop = asyncio.get_running_loop()
-            get_venvs = functools.partial(
-                list_python_venvs,
-                base_dir=CWD,
-                recursive=recursive,
-                search_parent_folders=search_parent_folders
-            )
+            def is_local(venv):
+                return os.path.commonpath([venv.folder, global_venv_folder]) != global_venv_folder
 
-            venvs = await loop.run_in_executor(
-                None,
-                get_venvs,
-            )
-
-            for venv in venvs:
-                if not os.path.commonpath([venv.folder, global_venv_folder]) == global_venv_folder:
-                    self.add_venv(venv, sort=False)
-
-            if os.path.exists(self.config.global_venv_folder):
-                get_global_venvs = functools.partial(
-                    list_python_venvs,
-                    base_dir=self.config.global_venv_folder,
-                    recursive=True,
-                    search_parent_folders=False,
+            cache_sources = {
+                "local venvs": functools.partial(
+                    load_cached_venvs,
+                    CWD,
+                    recursive=recursive,
+                    search_parent_folders=search_parent_folders,
                 )
-
-                global_venvs = await loop.run_in_executor(
-                    None,
-                    get_global_venvs
+            }
+            sources = {
+                "local venvs": functools.partial(
+                    iter_venvs,
+                    CWD,
+                    recursive=recursive,
+                    search_parent_folders=search_parent_folders,
+                )
+            }
+            if global_exists:
+                cache_sources["global venvs"] = functools.partial(
+                    load_cached_venvs, global_venv_folder, recursive=True
+                )
+                sources["global venvs"] = functools.partial(
+                    iter_venvs, global_venv_folder, recursive=True
                 )
+            else:
+                self.apply_venvs([], global_venv=True)
+
+            def filter_source(name, venvs):
+                if name == "global venvs":
+                    return venvs
+                return [v for v in venvs if is_local(v)]
+
+            cached = {name: venvs async for name, venvs in run_sources(cache_sources)}
+            if any(cached.values()):
+                for name, venvs in cached.items():
+                    self.apply_venvs(filter_source(name, venvs), global_venv=name == "global venvs")
+                self.sort_by_path()
+                self.border_subtitle = "Refreshing..."
+                self.loading = False
+
+            async def stream_source(name, func):
+                nonlocal incomplete
+                global_venv = name == "global venvs"
+                limits = ScanLimits(
+                    max_depth=self.config.venv_search_max_depth,
+                    time_limit=self.config.venv_search_time_limit,
+                    exclude=self.config.venv_search_exclude,
+                    use_gitignore=self.config.venv_search_gitignore,
+                    cancel_event=cancel_event,
+                )
+                found = set()
+                async for batch in stream_discovery(func, limits=limits, name=name, timings=timings):
+                    batch = filter_source(name, batch)
+                    found.update(v.folder for v in batch)
+                    self.update_venvs(batch, global_venv=global_venv)
+                    self.loading = False
+
+                if limits.incomplete:
+                    incomplete = True
+                else:
+                    self.remove_missing_venvs(found, global_venv=global_venv)
 
-                for venv in global_venvs:
-                    self.add_venv(venv, global_venv=True, sort=False)
+            # Local and global searches run concurrently, rows are added in batches as they are found
+            await asyncio.gather(*(stream_source(name, func) for name, func in sources.items()))
 
         finally:
-            self.sort_by_path()
+            # Stop the search threads if this worker was cancelled by a new scan
+            cancel_event.set()
+
+            # A scan cancelled by a newer one leaves the table state to that scan
+            if self._scan_cancel_event is cancel_event:
+                self._scan_cancel_event = None
+                self.sort_by_path()
+                self.border_subtitle = "Incomplete scan" if incomplete else None
+                self.loading = False
             self.refresh_bindings()
-            self.loading = False
 
 
 class RuntimeTable(DataTable):
+    # Install/Uninstall are only shown once a runtime manager has been detected
+    # See ManagerApp.check_action
     BINDINGS = [
         Binding(key="r", action="app.launch_runtime", description="Launch Runtime REPL", show=True),
         Binding(key="v", action="app.create_venv", description="Create VEnv", show=True),
         Binding(key="g", action="app.create_global_venv", description="Create Global VEnv", show=True),
+        Binding(key="i", action="app.install_runtime", description="Install New Runtime", show=True),
+        Binding(key="delete", action="app.uninstall_runtime", description="Uninstall Runtime", show=True),
+        Binding(key="space", action="toggle_mark", description="Mark for Uninstall", show=True),
     ]
 
-    if get_managers():
-        BINDINGS.extend(
-            [
-                Binding(key="i", action="app.install_runtime", description="Install New Runtime", show=True),
-                Binding(key="delete", action="app.uninstall_runtime", description="Uninstall Runtime", show=True),
-            ]
-        )
+    MARK = "*"
 
     def __init__(self, *args, config, **kwargs):
         super().__init__(*args, **kwargs)
@@ -418,50 +939,157 @@ class RuntimeTable(DataTable):
         self.config = config
         self.border_title = "Python Runtimes"
         self._runtime_catalogue = {}
+        self._runtime_rows = {}
+        self._column_keys = []
+        # Executables of runtimes marked for a batch uninstall
+        self.marked: set[str] = set()
 
     def on_mount(self):
         self.setup_columns()
-        self.call_after_refresh(self.load_runtimes, clear_first=False)
 
     def setup_columns(self):
         self.cursor_type = "row"
-        self.add_columns("Version", "Managed By", "Implementation", "Path")
+        self._column_keys = self.add_columns("Version", "Managed By", "Implementation", "Path")
 
     def runtime_from_key(self, key) -> PythonInstall:
         return self._runtime_catalogue[key]
 
+    @property
+    def marked_runtimes(self) -> list[PythonInstall]:
+        """
+        Runtimes marked for uninstall, in table order
+        """
+        return [inst for key, inst in self._runtime_catalogue.items() if key in self.marked]
+
+    def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
+        # Marking is only useful if runtimes can be uninstalled
+        if action == "toggle_mark":
+            return self.app.check_action("uninstall_runtime", parameters)
+        return True
+
+    def action_toggle_mark(self):
+        """
+        Mark or unmark the runtime under the cursor and move to the next row
+        """
+        try:
+            row = self.coordinate_to_cell_key(self.cursor_coordinate)
+        except CellDoesNotExist:
+            return
+
+        key = row.row_key.value
+        if key in self.marked:
+            self.marked.discard(key)
+        else:
+            self.marked.add(key)
+        self.update_cell(key, self._column_keys[0], self._version_cell(key))
+
+        self.action_cursor_down()
+
+    def clear_marks(self):
+        marked = self.marked & self._runtime_catalogue.keys()
+        self.marked.clear()
+        for key in marked:
+            self.update_cell(key, self._column_keys[0], self._version_cell(key))
+
+    def _version_cell(self, key) -> str:
+        return mark_cell(self._runtime_rows[key][0], key in self.marked, self.MARK)
+
+    @staticmethod
+    def _runtime_row(install: PythonInstall) -> tuple[str, str | None, str, str]:
+        if install.version_str == install.implementation_version_str:
+            version_str = install.version_str
+        else:
+            version_str = f"{install.version_str} / {install.implementation_version_str}"
+
+        managed_by = install.managed_by
+        if managed_by is not None:
+            managed_by = MANAGED_BY_MAPPING.get(managed_by, managed_by)
+
+        return (
+            version_str,
+            managed_by,
+            install.implementation,
+            substitute_home(install.executable),
+        )
+
+    def apply_runtimes(self, installs: list[PythonInstall]) -> None:
+        """
+        Update the table to match a list of runtimes, only changing rows that differ.
+
+        :param installs: Runtimes in the order they should be displayed
+        """
+        new_catalogue = {inst.executable: inst for inst in installs}
+
+        for key in self._runtime_catalogue.keys() - new_catalogue.keys():
+            self.remove_row(key)
+            self._runtime_rows.pop(key, None)
+            self.marked.discard(key)
+
+        added = False
+        for key, install in new_catalogue.items():
+            row = self._runtime_row(install)
+            old_row = self._runtime_rows.get(key)
+            self._runtime_rows[key] = row
+
+            if old_row is None:
+                self.add_row(self._version_cell(key), *row[1:], key=key)
+                added = True
+            elif old_row != row:
+                for column_key, old_value, value in zip(self._column_keys, old_row, row):
+                    if old_value != value:
+                        # The version cell also holds the mark
+                        if column_key == self._column_keys[0]:
+                            value = self._version_cell(key)
+                        self.update_cell(key, column_key, value)
+
+        self._runtime_catalogue = new_catalogue
+
+        if added:
+            # Keep the discovery order, new rows are added at the end
+            order = {row[3]: i for i, row in enumerate(self._runtime_rows[k] for k in new_catalogue)}
+            self.sort(self._column_keys[3], key=order.__getitem__)
+
     @work
-    async def load_runtimes(self, clear_first=True):
+    async def load_runtimes(
+        self,
+        clear_first=True,
+        use_cache=False,
+        timings: DiscoveryTimings | None = None,
+    ):
+        """
+        Load the discovered runtimes into the table.
+
+        If use_cache is True and the on-disk cache is still valid the cached runtimes
+        are shown immediately while discovery runs again in the background.
+        """
         self.loading = True
         try:
             if clear_first:
                 self.clear()
                 self._runtime_catalogue = {}
+                self._runtime_rows = {}
+                self.marked.clear()
 
-            loop = asyncio.get_running_loop()
-            deduped_installs = await loop.run_in_executor(None, list_installs_deduped)
-
-            for install in deduped_installs:
-                self._runtime_catalogue[install.executable] = install
+            # Get the key *before* discovery, so changes made during discovery
+            # invalidate the cache for the next launch
+            cache_key = await run_discovery(get_runtime_cache_key)
 
-                if install.version_str == install.implementation_version_str:
-                    version_str = install.version_str
-                else:
-                    version_str = f"{install.version_str} / {install.implementation_version_str}"
+            if use_cache:
+                cached_installs = await run_discovery(load_cached_installs, cache_key)
+                if cached_installs:
+                    self.apply_runtimes(cached_installs)
+                    self.border_subtitle = "Refreshing..."
+                    self.loading = False
 
-                managed_by = MANAGED_BY_MAPPING.get(
-                    install.managed_by,
-                    install.managed_by
-                )
+            deduped_installs = await run_discovery(list_installs_deduped, name="runtimes", timings=timings)
+            self.apply_runtimes(deduped_installs)
 
-                self.add_row(
-                    version_str,
-                    managed_by,
-                    install.implementation,
-                    substitute_home(install.executable),
-                    key=install.executable
-                )
+            try:
+                await run_discovery(save_cached_installs, deduped_installs, cache_key)
+            except OSError:
+                pass
         finally:
+            self.border_subtitle = None
             self.refresh_bindings()
             self.loading = False
 
@@ -495,12 +1123,29 @@ class ManagerApp(App):
         border: hidden;
         margin: 1;
     }
+    .filter_bar {
+        height: auto;
+    }
+    .filter_bar Input, .filter_bar Select {
+        width: 1fr;
+    }
+    .filter_bar Checkbox {
+        width: auto;
+    }
     """
 
+    # Actions that require a runtime manager (uv/pymanager) to be available
+    MANAGER_ACTIONS = {"install_runtime", "uninstall_runtime"}
+
+    # Seconds after the managers are found before fetching the download list
+    DOWNLOAD_PREFETCH_DELAY = 2.0
+
     config: Config
     _venv_table: VEnvTable
     _runtime_table: RuntimeTable
     _venv_dependency_cache: dict[str, list[PythonPackage]]
+    _runtime_managers: list[RuntimeManager] | None
+    _prefetched_downloads: list[PythonListing] | None
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -513,8 +1158,86 @@ class ManagerApp(App):
 
         self._venv_dependency_cache = {}
 
+        # None until the background detection has completed
+        self._runtime_managers = None
+        # Downloads fetched in the background for the install screen
+        self._prefetched_downloads = None
+
     def on_mount(self):
         self.title = f"Ducktools.PyTUI v{app_version}: Python Environment and Runtime Manager"
+        self.call_after_refresh(self.run_discovery)
+        self.detect_runtime_managers()
+
+    def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
+        if action in self.MANAGER_ACTIONS:
+            return bool(self._runtime_managers)
+        return True
+
+    @work
+    async def run_discovery(self):
+        """
+        Run the initial venv and runtime discovery concurrently and log how long
+        each source took compared to the total.
+        """
+        timings = DiscoveryTimings()
+        workers = [
+            self._venv_table.load_venvs(clear_first=False, timings=timings),
+            self._runtime_table.load_runtimes(clear_first=False, use_cache=True, timings=timings),
+        ]
+        await asyncio.gather(*(worker.wait() for worker in workers), return_exceptions=True)
+
+        self.log.info(f"Discovery timings - {timings.summary()}")
+        if os.environ.get(DISCOVERY_TIMINGS_ENV_VAR):
+            self.notify(timings.summary(), title="Discovery Timings", timeout=10)
+
+        if self.config.watch_venvs:
+            self._venv_table.start_watching()
+
+    @work
+    async def detect_runtime_managers(self):
+        """
+        Search PATH for runtime managers in the background so the first paint
+        doesn't wait on `shutil.which`, then show the install/uninstall bindings.
+        """
+        loop = asyncio.get_running_loop()
+        self._runtime_managers = await loop.run_in_executor(None, get_managers)
+        self.refresh_bindings()
+
+        if self._runtime_managers:
+            self.set_timer(self.DOWNLOAD_PREFETCH_DELAY, self.prefetch_downloads)
+
+    @work(exclusive=True, group="download_prefetch", exit_on_error=False)
+    async def prefetch_downloads(self):
+        """
+        Fetch the download list in the background once discovery has had time
+        to finish, so the install screen is populated when it is opened.
+        """
+        loop = asyncio.get_running_loop()
+        # Failing managers are reported when the install screen fetches again
+        try:
+            self._prefetched_downloads = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    fetch_downloads,
+                    cache_ttl=self.config.download_cache_ttl,
+                    on_error=self._on_prefetch_error,
+                ),
+            )
+        except Exception as e:
+            # A failed prefetch only means the install screen fetches the list itself
+            self.log.warning(f"Prefetching downloads failed: {e}")
+            self._prefetched_downloads = None
+
+    def _on_prefetch_error(self, manager: RuntimeManager, e: Exception):
+        # Called from the query thread
+        try:
+            self.call_from_thread(
+                self.log.warning,
+                f"Prefetching downloads from {manager.organisation} failed: {e}",
+            )
+        except RuntimeError:
+            # The app is shutting down
+            pass
 
     def compose(self):
         yield Header()
@@ -651,8 +1374,17 @@ class ManagerApp(App):
         try:
             new_venv = await loop.run_in_executor(
                 None,
-                create_venv,
-                runtime, venv_path, self.config.include_pip, self.config.latest_pip,
+                functools.partial(
+                    create_venv,
+                    runtime,
+                    venv_path,
+                    include_pip=self.config.include_pip,
+                    latest_pip=self.config.latest_pip,
+                    backend=self.config.venv_backend,
+                    use_template=self.config.venv_templates,
+                    # Only global venvs share a filesystem with the pool
+                    pool_size=self.config.venv_pool_size if global_venv else 0,
+                ),
             )
         except FileExistsError:
             self.notify(
@@ -662,6 +1394,12 @@ class ManagerApp(App):
             )
         except subprocess.CalledProcessError as e:
             self.notify(f"Failed to create venv {venv_path!r}. Process Error: {e}")
+        except OSError as e:
+            self.notify(
+                f"Failed to create venv {venv_path!r}: {markup.escape(str(e))}",
+                title="Error",
+                severity="error",
+            )
         else:
             self.notify(f"VEnv {venv_path!r} created", title="Success")
             self._venv_table.add_venv(new_venv, sort=True, global_venv=global_venv)
@@ -720,99 +1458,143 @@ class ManagerApp(App):
 
     @work
     async def action_install_runtime(self):
-        if not get_managers():
+        if not self._runtime_managers:
             return
 
-        runtime_screen = RuntimeInstallScreen()
-        runtime = await self.push_screen_wait(runtime_screen)
-
-        if runtime is not None:
-            if runtime.will_overwrite:
-                # Add a confirmation prompt here
-                pass
+        runtime_screen = RuntimeInstallScreen(
+            cache_ttl=self.config.download_cache_ttl,
+            runtimes=self._prefetched_downloads,
+        )
+        runtimes = await self.push_screen_wait(runtime_screen)
 
-            self._runtime_table.loading = True
-            loop = asyncio.get_running_loop()
+        if runtimes:
+            for runtime in runtimes:
+                if runtime.will_overwrite:
+                    # Add a confirmation prompt here
+                    pass
 
+            results = await self.push_screen_wait(InstallProgressScreen(runtimes))
             try:
-                result = await loop.run_in_executor(None, runtime.install)  # noqa
-                # self.notify(result.stderr)
-            except FileNotFoundError as e:
-                self.notify(
-                    f"Install Failed: {markup.escape(str(e))}",
-                    title="Manager Not Found",
-                    severity="error",
-                )
-            else:
-                if result.returncode == 0:
-                    self.notify(
-                        f"{runtime.key} installed successfully",
-                        title="New Install"
-                    )
+                if results is None:
+                    return
+
+                # Reload once for the whole batch, including runtimes that finished
+                # installing before the batch was cancelled or another job failed
+                if any(result.returncode == 0 or result.installed for result in results):
                     self._runtime_table.load_runtimes(clear_first=True)
-                else:
-                    for line in result.stderr.split("\n"):
-                        if line:
-                            self.notify(
-                                markup.escape(line.strip()),
-                                title="Failed Install",
-                                severity="error"
-                            )
+                    self.prefetch_downloads()
+
+                for result in results:
+                    if result.success:
+                        self.notify(install_summary(result), title="New Install")
+                    else:
+                        self.notify(
+                            markup.escape(install_summary(result)),
+                            title="Cancelled Install" if result.cancelled else "Failed Install",
+                            severity="warning" if result.cancelled else "error",
+                        )
             finally:
-                self._runtime_table.loading = False
                 self.set_focus(self._runtime_table)
                 self.refresh_bindings()
 
     @work
     async def action_uninstall_runtime(self):
-        if not get_managers():
+        if not self._runtime_managers:
             return
 
-        runtime = self.selected_runtime
-        if runtime is None:
-            return
+        runtimes = self._runtime_table.marked_runtimes
+        if not runtimes:
+            runtime = self.selected_runtime
+            if runtime is None:
+                return
+            runtimes = [runtime]
 
         # Check if the executable is within the base prefix folder
-        if runtime.paths.get("stdlib") == sysconfig.get_path("stdlib"):
+        pytui_stdlib = sysconfig.get_path("stdlib")
+        if any(runtime.paths.get("stdlib") == pytui_stdlib for runtime in runtimes):
             self.notify(
                 "Can not uninstall the runtime being used to run ducktools-pytui",
                 severity="warning",
             )
-            return
+            runtimes = [r for r in runtimes if r.paths.get("stdlib") != pytui_stdlib]
+            if not runtimes:
+                return
 
-        listing = find_matching_listing(runtime)
-        if listing is None:
-            self.notify(
-                f"{runtime.executable} is not a managed runtime",
-                severity="warning"
-            )
+        loop = asyncio.get_running_loop()
+        errors = []
+        listings = await loop.run_in_executor(
+            None,
+            functools.partial(
+                find_matching_listings,
+                runtimes,
+                on_error=lambda manager, e: errors.append((manager, e)),
+            ),
+        )
+        notify_manager_errors(self, errors)
+
+        # One group of runtimes for each manager, uninstalled with one command if possible
+        groups: dict[RuntimeManager, list[PythonListing]] = {}
+        for runtime, listing in zip(runtimes, listings):
+            if listing is None:
+                self.notify(
+                    f"{runtime.executable} is not a managed runtime",
+                    severity="warning"
+                )
+            else:
+                groups.setdefault(listing.manager, []).append(listing)
+
+        if not groups:
             return
 
-        loop = asyncio.get_running_loop()
         self._runtime_table.loading = True
         try:
-            result = await loop.run_in_executor(None, listing.uninstall)  # noqa
-            # self.notify(result.stderr)
-        except FileNotFoundError as e:
-            self.notify(
-                f"Uninstall Failed: {markup.escape(str(e))}",
-                title="Manager Not Found",
-                severity="error",
+            group_results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(None, manager.uninstall_listings, group)
+                    for manager, group in groups.items()
+                ),
+                return_exceptions=True,
             )
-        else:
-            if result.returncode == 0:
-                self.notify(
-                    f"Runtime {listing.key!r} uninstalled."
-                )
-                self._runtime_table.load_runtimes(clear_first=True)
-            else:
-                for line in result.stderr.split("\n"):
-                    if line:
+
+            # A failed uninstall may still have removed some runtimes
+            batch_ran = False
+            for results in group_results:
+                if isinstance(results, FileNotFoundError):
+                    self.notify(
+                        f"Uninstall Failed: {markup.escape(str(results))}",
+                        title="Manager Not Found",
+                        severity="error",
+                    )
+                    continue
+                elif isinstance(results, BaseException):
+                    self.notify(
+                        f"Uninstall Failed: {markup.escape(str(results))}",
+                        title="Runtime Manager Error",
+                        severity="error",
+                    )
+                    continue
+
+                batch_ran = True
+                for job_listings, result in results:
+                    keys = ", ".join(repr(listing.key) for listing in job_listings)
+                    if result.returncode == 0:
                         self.notify(
-                            markup.escape(line.strip()),
-                            title="Failed Uninstall",
-                            severity="error"
+                            f"Runtime {markup.escape(keys)} uninstalled."
                         )
+                    else:
+                        for line in result.stderr.split("\n"):
+                            if line:
+                                self.notify(
+                                    markup.escape(line.strip()),
+                                    title="Failed Uninstall",
+                                    severity="error"
+                                )
+
+            self._runtime_table.clear_marks()
+            # Reload once for the whole batch
+            if batch_ran:
+                self._runtime_table.load_runtimes(clear_first=True)
+                self.prefetch_downloads()
         finally:
             self._runtime_table.loading = False
             self.set_focus(self._runtime_table)
@@ -0,0 +1,135 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import os
+import os.path
+import subprocess
+from typing import ClassVar
+
+from ducktools.classbuilder.prefab import Prefab
+from ducktools.pythonfinder import PythonInstall
+from ducktools.pythonfinder.venv import PythonVEnv
+
+
+class VEnvBackend(Prefab):
+    registry: ClassVar[dict[str, type[VEnvBackend]]] = {}
+
+    name: ClassVar[str] = ""  # Name used in the config
+    exclude: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not cls.exclude:
+            VEnvBackend.registry[cls.name] = cls
+
+    @classmethod
+    def get(cls) -> VEnvBackend | None:
+        """
+        Get an instance of this backend if it can be used on this system
+
+        :return: instance of the backend or None if it is unavailable
+        """
+        return cls()
+
+    def supports(
+        self,
+        python_runtime: PythonInstall,
+        include_pip: bool = True,
+        latest_pip: bool = True,
+    ) -> bool:
+        """
+        Check if this backend can create a venv for the runtime with these options
+
+        :param python_runtime: Python install the venv is based on
+        :param include_pip: Include pip in the venv
+        :param latest_pip: Upgrade pip to the latest version
+        :return: True if this backend can build the venv
+        """
+        return True
+
+    def get_command(
+        self,
+        python_runtime: PythonInstall,
+        venv_path: str,
+        include_pip: bool = True,
+        latest_pip: bool = True,
+    ) -> list[str]:  # pragma: no cover
+        raise NotImplementedError("get_command must be implemented in subclasses")
+
+    def create(
+        self,
+        python_runtime: PythonInstall,
+        venv_path: str,
+        include_pip: bool = True,
+        latest_pip: bool = True,
+    ) -> PythonVEnv:
+        """
+        Create a venv at venv_path and return it
+
+        :param python_runtime: Python install the venv is based on
+        :param venv_path: Path to the new venv folder
+        :param include_pip: Include pip in the venv
+        :param latest_pip: Upgrade pip to the latest version
+        :return: PythonVEnv for the new environment
+        """
+        venv_cmd = self.get_command(python_runtime, venv_path, include_pip, latest_pip)
+
+        # These tasks run in the background so don't need to block ctrl+c
+        # Capture output to not mess with the textual display
+        subprocess.run(venv_cmd, capture_output=True, check=True)
+
+        config_path = os.path.join(os.path.realpath(venv_path), "pyvenv.cfg")
+        return PythonVEnv.from_cfg(config_path)
+
+
+def get_backend(
+    name: str,
+    python_runtime: PythonInstall,
+    include_pip: bool = True,
+    latest_pip: bool = True,
+) -> VEnvBackend:
+    """
+    Get the backend to use to create a venv for a runtime
+
+    "auto" uses uv if it is available, any backend that is unavailable or
+    can't handle the runtime falls back to the standard library venv module.
+
+    :param name: Backend name from the config - "auto", "venv" or "uv"
+    :param python_runtime: Python install the venv is based on
+    :param include_pip: Include pip in the venv
+    :param latest_pip: Upgrade pip to the latest version
+    :return: VEnvBackend instance
+    """
+    names = ["uv", "venv"] if name == "auto" else [name, "venv"]
+
+    for backend_name in names:
+        backend_type = VEnvBackend.registry.get(backend_name)
+        if backend_type is None:
+            continue
+        backend = backend_type.get()
+        if backend and backend.supports(python_runtime, include_pip, latest_pip):
+            return backend
+
+    # The venv backend is always available
+    return VEnvBackend.registry["venv"]()
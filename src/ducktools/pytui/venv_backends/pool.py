@@ -0,0 +1,308 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Pool of ready-made venvs that can be moved into place instead of being built.
+
+Pools live in POOL_FOLDER with one folder per runtime, backend and pip option
+combination. Each pooled venv has a marker file written once it is complete.
+Taking a venv is an atomic rename followed by rewriting its paths, so two
+processes can never take the same venv.
+
+Only the POOL_MAX_RUNTIMES most recently used combinations are kept.
+"""
+from __future__ import annotations
+
+import json
+import os
+import os.path
+import shutil
+import threading
+import time
+import uuid
+from collections.abc import Callable
+
+from ducktools.pythonfinder import PythonInstall
+from ducktools.pythonfinder.venv import PythonVEnv
+
+from ..platform_paths import PYTUI_FOLDER
+from ._core import VEnvBackend
+from .templates import (
+    TEMPLATE_MAX_AGE,
+    create_from_template,
+    get_template_key,
+    relocate_venv,
+    templates_supported,
+)
+
+
+POOL_FOLDER = os.path.join(PYTUI_FOLDER, "venv_pool")
+POOL_MAX_RUNTIMES = 3
+# Unmarked venvs older than this are left over from an interrupted refill
+STALE_BUILD_AGE = 60 * 60
+
+_refill_lock = threading.Lock()
+
+
+def pool_supported(python_runtime: PythonInstall) -> bool:
+    # Pooled venvs are relocated the same way templates are cloned
+    return templates_supported(python_runtime)
+
+
+def _write_json(path: str, data: dict) -> None:
+    tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _discard(marker_path: str) -> None:
+    # Remove the marker first so no other process tries to take the venv
+    try:
+        os.remove(marker_path)
+    except FileNotFoundError:
+        return
+    shutil.rmtree(marker_path.removesuffix(".json"), ignore_errors=True)
+
+
+def _mark_used(key: str, python_runtime: PythonInstall, pool_folder: str) -> None:
+    _write_json(
+        os.path.join(pool_folder, f"{key}.json"),
+        {
+            "executable": os.path.realpath(python_runtime.executable),
+            "last_used": time.time(),
+        },
+    )
+
+
+def _is_valid(marker_path: str, python_runtime: PythonInstall, latest_pip: bool) -> bool:
+    try:
+        with open(marker_path) as f:
+            metadata = json.load(f)
+        version = list(metadata["version"])
+        age = time.time() - metadata["created"]
+    except (OSError, json.JSONDecodeError, KeyError, TypeError):
+        return False
+
+    if version != list(python_runtime.version):
+        return False
+    if not os.path.isdir(marker_path.removesuffix(".json")):
+        return False
+    if latest_pip and not (0 <= age < TEMPLATE_MAX_AGE):
+        return False
+    return True
+
+
+def take_venv(
+    backend: VEnvBackend,
+    python_runtime: PythonInstall,
+    venv_path: str,
+    include_pip: bool = True,
+    latest_pip: bool = True,
+    pool_folder: str | None = None,
+) -> PythonVEnv | None:
+    """
+    Move a pooled venv to venv_path if one is ready
+
+    :param backend: Backend used to build the pool
+    :param python_runtime: Python install the venv is based on
+    :param venv_path: Path to the new venv folder
+    :param include_pip: Include pip in the venv
+    :param latest_pip: Upgrade pip to the latest version
+    :param pool_folder: Folder holding the pools
+    :return: PythonVEnv for the new environment or None if no venv could be taken
+    """
+    pool_folder = POOL_FOLDER if pool_folder is None else pool_folder
+    key = get_template_key(backend, python_runtime, include_pip, latest_pip)
+    key_folder = os.path.join(pool_folder, key)
+
+    try:
+        markers = sorted(f for f in os.listdir(key_folder) if f.endswith(".json"))
+    except FileNotFoundError:
+        return None
+
+    os.makedirs(os.path.dirname(os.path.abspath(venv_path)), exist_ok=True)
+
+    for marker in markers:
+        marker_path = os.path.join(key_folder, marker)
+        pooled_path = marker_path.removesuffix(".json")
+
+        if not _is_valid(marker_path, python_runtime, latest_pip):
+            _discard(marker_path)
+            continue
+
+        try:
+            os.rename(pooled_path, venv_path)
+        except FileNotFoundError:
+            # Taken by another process
+            continue
+        except OSError:
+            # Most likely venv_path is on a different filesystem
+            return None
+
+        try:
+            os.remove(marker_path)
+        except FileNotFoundError:
+            pass
+
+        try:
+            relocate_venv(pooled_path, venv_path)
+        except OSError:
+            shutil.rmtree(venv_path, ignore_errors=True)
+            return None
+
+        _mark_used(key, python_runtime, pool_folder)
+
+        config_path = os.path.join(os.path.realpath(venv_path), "pyvenv.cfg")
+        return PythonVEnv.from_cfg(config_path)
+
+    return None
+
+
+def prune_pools(keep_key: str, pool_folder: str) -> None:
+    """
+    Remove pools beyond the POOL_MAX_RUNTIMES most recently used
+
+    :param keep_key: Key of a pool that is always kept
+    :param pool_folder: Folder holding the pools
+    """
+    last_used = {}
+    for filename in os.listdir(pool_folder):
+        if not filename.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(pool_folder, filename)) as f:
+                last_used[filename.removesuffix(".json")] = json.load(f)["last_used"]
+        except (OSError, json.JSONDecodeError, KeyError, TypeError):
+            last_used[filename.removesuffix(".json")] = 0.0
+
+    last_used[keep_key] = float("inf")
+    recent = sorted(last_used, key=lambda k: last_used[k], reverse=True)
+
+    for key in recent[POOL_MAX_RUNTIMES:]:
+        try:
+            os.remove(os.path.join(pool_folder, f"{key}.json"))
+        except FileNotFoundError:
+            pass
+        shutil.rmtree(os.path.join(pool_folder, key), ignore_errors=True)
+
+
+def refill(
+    backend: VEnvBackend,
+    python_runtime: PythonInstall,
+    include_pip: bool = True,
+    latest_pip: bool = True,
+    size: int = 1,
+    use_template: bool = False,
+    pool_folder: str | None = None,
+) -> int:
+    """
+    Build venvs until the pool for these options holds `size` ready venvs
+
+    :param backend: Backend used to build the venvs
+    :param python_runtime: Python install the venvs are based on
+    :param include_pip: Include pip in the venvs
+    :param latest_pip: Upgrade pip to the latest version
+    :param size: Number of ready venvs to keep
+    :param use_template: Clone the venvs from a cached template venv
+    :param pool_folder: Folder holding the pools
+    :return: Number of venvs built
+    """
+    pool_folder = POOL_FOLDER if pool_folder is None else pool_folder
+    key = get_template_key(backend, python_runtime, include_pip, latest_pip)
+    key_folder = os.path.join(pool_folder, key)
+
+    with _refill_lock:
+        os.makedirs(key_folder, exist_ok=True)
+
+        ready = 0
+        with os.scandir(key_folder) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json"):
+                    if _is_valid(entry.path, python_runtime, latest_pip):
+                        ready += 1
+                    else:
+                        _discard(entry.path)
+                elif entry.is_dir() and not os.path.exists(f"{entry.path}.json"):
+                    if time.time() - entry.stat().st_mtime > STALE_BUILD_AGE:
+                        shutil.rmtree(entry.path, ignore_errors=True)
+
+        built = 0
+        while ready + built < size:
+            # Unique names mean the name can be replaced in the activation scripts
+            venv_path = os.path.join(key_folder, f"venv-{uuid.uuid4().hex[:12]}")
+            try:
+                if use_template and templates_supported(python_runtime):
+                    create_from_template(
+                        backend, python_runtime, venv_path, include_pip, latest_pip
+                    )
+                else:
+                    backend.create(python_runtime, venv_path, include_pip, latest_pip)
+            except BaseException:
+                shutil.rmtree(venv_path, ignore_errors=True)
+                raise
+
+            _write_json(
+                f"{venv_path}.json",
+                {"version": list(python_runtime.version), "created": time.time()},
+            )
+            built += 1
+
+        _mark_used(key, python_runtime, pool_folder)
+        prune_pools(key, pool_folder)
+
+    return built
+
+
+def start_refill(
+    backend: VEnvBackend,
+    python_runtime: PythonInstall,
+    include_pip: bool = True,
+    latest_pip: bool = True,
+    size: int = 1,
+    use_template: bool = False,
+    on_error: Callable[[Exception], None] | None = None,
+    pool_folder: str | None = None,
+) -> threading.Thread:
+    """
+    Refill the pool on a daemon thread so an interrupted build never blocks exiting
+
+    :param on_error: Called with any exception raised while refilling
+    :return: The started thread
+    """
+    def run_refill():
+        try:
+            refill(
+                backend, python_runtime, include_pip, latest_pip, size, use_template, pool_folder
+            )
+        except Exception as e:
+            if on_error is not None:
+                on_error(e)
+
+    thread = threading.Thread(target=run_refill, name="pytui-venv-pool", daemon=True)
+    thread.start()
+    return thread
+
+
+def clear_pools(pool_folder: str | None = None) -> None:
+    pool_folder = POOL_FOLDER if pool_folder is None else pool_folder
+    shutil.rmtree(pool_folder, ignore_errors=True)
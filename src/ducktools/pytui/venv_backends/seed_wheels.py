@@ -0,0 +1,239 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Local cache of the newest pip (and setuptools where venv installs it) wheels.
+
+Wheels are cached per Python minor version, as newer pip releases drop
+support for older Pythons. Venvs created with the latest pip are seeded
+from the cache without touching the network, and the cache is refreshed
+in the background with the new venv's own pip once it is older than
+SEED_WHEEL_MAX_AGE. If the refresh fails the existing wheels are kept.
+"""
+from __future__ import annotations
+
+import json
+import os
+import os.path
+import shutil
+import subprocess
+import threading
+import time
+import uuid
+
+from ducktools.pythonfinder import PythonInstall
+
+from ..platform_paths import PYTUI_FOLDER
+
+
+SEED_WHEEL_FOLDER = os.path.join(PYTUI_FOLDER, "seed_wheels")
+SEED_WHEEL_MAX_AGE = 24 * 60 * 60
+# Unreferenced download folders older than this are left from an interrupted refresh
+STALE_DOWNLOAD_AGE = 60 * 60
+
+_refresh_lock = threading.Lock()
+
+
+def seed_packages(python_runtime: PythonInstall) -> list[str]:
+    # Python 3.12 stopped installing setuptools into new venvs
+    if python_runtime.version >= (3, 12):
+        return ["pip"]
+    return ["pip", "setuptools"]
+
+
+def seeding_supported(python_runtime: PythonInstall) -> bool:
+    # Matches the runtimes `venv --upgrade-deps` is used for
+    return python_runtime.implementation != "graalpy" and python_runtime.version >= (3, 9)
+
+
+def _metadata_path(python_runtime: PythonInstall, wheel_folder: str) -> str:
+    major, minor = python_runtime.version[:2]
+    return os.path.join(wheel_folder, f"py{major}.{minor}.json")
+
+
+def _load_metadata(python_runtime: PythonInstall, wheel_folder: str) -> dict | None:
+    try:
+        with open(_metadata_path(python_runtime, wheel_folder)) as f:
+            metadata = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    return metadata if isinstance(metadata, dict) else None
+
+
+def get_seed_wheels(
+    python_runtime: PythonInstall,
+    wheel_folder: str | None = None,
+) -> list[str] | None:
+    """
+    Get the cached wheels to seed a venv for this runtime
+
+    :param python_runtime: Python install the venv is based on
+    :param wheel_folder: Folder holding the cached wheels
+    :return: Paths to a wheel for each seed package, or None if any are missing
+    """
+    wheel_folder = SEED_WHEEL_FOLDER if wheel_folder is None else wheel_folder
+    metadata = _load_metadata(python_runtime, wheel_folder)
+    if metadata is None:
+        return None
+
+    try:
+        folder = os.path.join(wheel_folder, metadata["folder"])
+        wheels = [os.path.join(folder, name) for name in metadata["wheels"]]
+    except (KeyError, TypeError):
+        return None
+
+    wheel_names = [os.path.basename(w) for w in wheels]
+    for package in seed_packages(python_runtime):
+        if not any(name.startswith(f"{package}-") for name in wheel_names):
+            return None
+
+    if not all(os.path.isfile(w) for w in wheels):
+        return None
+
+    return wheels
+
+
+def needs_refresh(python_runtime: PythonInstall, wheel_folder: str | None = None) -> bool:
+    wheel_folder = SEED_WHEEL_FOLDER if wheel_folder is None else wheel_folder
+    metadata = _load_metadata(python_runtime, wheel_folder)
+    try:
+        age = time.time() - metadata["updated"]  # type: ignore[index]
+    except (KeyError, TypeError):
+        return True
+    return not (0 <= age < SEED_WHEEL_MAX_AGE)
+
+
+def get_install_command(venv_python: str, wheels: list[str]) -> list[str]:
+    """
+    Get the command to install the seed wheels into a venv without pip
+
+    pip is run from its own wheel, so the venv doesn't need pip already.
+
+    :param venv_python: Path to the venv's Python executable
+    :param wheels: Paths to the wheels to install
+    :return: Command list
+    """
+    pip_wheel = next(w for w in wheels if os.path.basename(w).startswith("pip-"))
+    return [
+        venv_python, os.path.join(pip_wheel, "pip"),
+        "install",
+        "--isolated",
+        "--no-index",
+        "--disable-pip-version-check",
+        "--no-warn-script-location",
+        "--quiet",
+        *wheels,
+    ]
+
+
+def refresh(
+    python_runtime: PythonInstall,
+    pip_python: str,
+    wheel_folder: str | None = None,
+) -> list[str]:
+    """
+    Download the newest seed wheels for this runtime into the cache
+
+    :param python_runtime: Python install the wheels are for
+    :param pip_python: Python with pip installed matching the runtime's version
+    :param wheel_folder: Folder holding the cached wheels
+    :return: Paths to the new wheels
+    """
+    wheel_folder = SEED_WHEEL_FOLDER if wheel_folder is None else wheel_folder
+    major, minor = python_runtime.version[:2]
+
+    with _refresh_lock:
+        os.makedirs(wheel_folder, exist_ok=True)
+
+        old_metadata = _load_metadata(python_runtime, wheel_folder) or {}
+
+        folder = f"py{major}.{minor}-{uuid.uuid4().hex[:8]}"
+        download_path = os.path.join(wheel_folder, folder)
+
+        try:
+            # Uses the user's pip configuration so indexes and proxies still apply
+            subprocess.run(
+                [
+                    pip_python, "-m", "pip",
+                    "download",
+                    "--only-binary=:all:",
+                    "--no-deps",
+                    "--disable-pip-version-check",
+                    "--quiet",
+                    "--dest", download_path,
+                    *seed_packages(python_runtime),
+                ],
+                capture_output=True,
+                check=True,
+            )
+            wheels = sorted(f for f in os.listdir(download_path) if f.endswith(".whl"))
+        except BaseException:
+            shutil.rmtree(download_path, ignore_errors=True)
+            raise
+
+        metadata_path = _metadata_path(python_runtime, wheel_folder)
+        tmp_path = f"{metadata_path}.{folder}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"folder": folder, "wheels": wheels, "updated": time.time()}, f)
+        os.replace(tmp_path, metadata_path)
+
+        old_folder = old_metadata.get("folder")
+        if isinstance(old_folder, str) and old_folder != folder:
+            shutil.rmtree(os.path.join(wheel_folder, old_folder), ignore_errors=True)
+
+        with os.scandir(wheel_folder) as entries:
+            for entry in entries:
+                if (
+                    entry.name.startswith(f"py{major}.{minor}-")
+                    and entry.name != folder
+                    and entry.is_dir()
+                    and time.time() - entry.stat().st_mtime > STALE_DOWNLOAD_AGE
+                ):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+
+    return [os.path.join(download_path, w) for w in wheels]
+
+
+def start_refresh(
+    python_runtime: PythonInstall,
+    pip_python: str,
+    wheel_folder: str | None = None,
+) -> threading.Thread | None:
+    """
+    Refresh the cache on a daemon thread if it is stale or missing
+
+    Failures are ignored, the cache is only an optimisation while online.
+
+    :return: The started thread or None if the cache is up to date
+    """
+    if not needs_refresh(python_runtime, wheel_folder):
+        return None
+
+    def run_refresh():
+        try:
+            refresh(python_runtime, pip_python, wheel_folder)
+        except (OSError, subprocess.CalledProcessError):
+            pass
+
+    thread = threading.Thread(target=run_refresh, name="pytui-seed-wheels", daemon=True)
+    thread.start()
+    return thread
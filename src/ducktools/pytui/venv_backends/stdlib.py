@@ -0,0 +1,97 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Create venvs with the standard library venv module of the runtime.
+
+When the latest pip is requested, venvs are seeded from the local wheel
+cache if it has wheels for the runtime, instead of downloading pip again.
+"""
+from __future__ import annotations
+
+import os.path
+import shutil
+import subprocess
+from typing import ClassVar
+
+from ducktools.pythonfinder import PythonInstall
+from ducktools.pythonfinder.venv import PythonVEnv
+
+from . import seed_wheels
+from ._core import VEnvBackend
+
+
+class StdlibVEnvBackend(VEnvBackend):
+    name: ClassVar[str] = "venv"
+
+    def get_command(
+        self,
+        python_runtime: PythonInstall,
+        venv_path: str,
+        include_pip: bool = True,
+        latest_pip: bool = True,
+    ) -> list[str]:
+        # Unlike the regular venv command defaults this will create an environment
+        # and download the *newest* pip (assuming the parent venv includes pip)
+        venv_cmd = [python_runtime.executable, "-m", "venv", venv_path]
+
+        # Also always include the pip bundled with graalpy and don't update
+        if python_runtime.implementation != "graalpy":
+            if not include_pip:
+                venv_cmd.append("--without-pip")
+            elif latest_pip and python_runtime.version >= (3, 9):
+                venv_cmd.append("--upgrade-deps")
+
+        return venv_cmd
+
+    def create(
+        self,
+        python_runtime: PythonInstall,
+        venv_path: str,
+        include_pip: bool = True,
+        latest_pip: bool = True,
+    ) -> PythonVEnv:
+        use_seed_cache = (
+            include_pip and latest_pip and seed_wheels.seeding_supported(python_runtime)
+        )
+
+        if use_seed_cache and (wheels := seed_wheels.get_seed_wheels(python_runtime)):
+            new_venv = super().create(python_runtime, venv_path, include_pip=False)
+            try:
+                subprocess.run(
+                    seed_wheels.get_install_command(new_venv.executable, wheels),
+                    capture_output=True,
+                    check=True,
+                )
+            except (OSError, subprocess.CalledProcessError):
+                # The cache may have been replaced mid-install, start again from the index
+                shutil.rmtree(os.path.realpath(venv_path), ignore_errors=True)
+            else:
+                seed_wheels.start_refresh(python_runtime, new_venv.executable)
+                return new_venv
+
+        new_venv = super().create(python_runtime, venv_path, include_pip, latest_pip)
+
+        if use_seed_cache:
+            seed_wheels.start_refresh(python_runtime, new_venv.executable)
+
+        return new_venv
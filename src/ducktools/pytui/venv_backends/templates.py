@@ -0,0 +1,417 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Cache of "golden" template venvs that new venvs are cloned from.
+
+One template is kept per runtime, backend and pip option combination.
+Templates are cloned with reflinks where the filesystem supports them,
+falling back to copy_file_range and then regular copies. Paths and the
+prompt of the template are rewritten in pyvenv.cfg and the scripts folder
+so the clone behaves as if it was created in place.
+
+Templates that seed the latest pip are rebuilt after TEMPLATE_MAX_AGE, the
+same age at which the cached seed wheels are refreshed, so "latest pip" means
+the same thing for cloned and directly created venvs.
+
+Templates are built while holding a lock file for their key, so processes
+creating venvs at the same time share one build.
+"""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import os.path
+import shutil
+import sys
+import time
+import uuid
+
+from ducktools.classbuilder.prefab import Prefab
+from ducktools.pythonfinder import PythonInstall
+from ducktools.pythonfinder.venv import PythonVEnv
+
+from ..platform_paths import CACHE_FOLDER
+from ._core import VEnvBackend
+from .seed_wheels import SEED_WHEEL_MAX_AGE
+
+
+TEMPLATE_CACHE_VERSION = 1
+TEMPLATE_FOLDER = os.path.join(CACHE_FOLDER, f"venv_templates_v{TEMPLATE_CACHE_VERSION}")
+TEMPLATE_MAX_AGE = SEED_WHEEL_MAX_AGE
+
+# ioctl request number for FICLONE on Linux
+FICLONE = 0x40049409
+
+
+def templates_supported(python_runtime: PythonInstall) -> bool:
+    """
+    Check if venvs for this runtime can be cloned from a template
+
+    Windows console scripts are launchers with the interpreter path embedded
+    in the binary and GraalPy uses its own launchers, so these are always
+    created directly.
+
+    :param python_runtime: Python install the venv is based on
+    :return: True if templates can be used
+    """
+    return sys.platform != "win32" and python_runtime.implementation != "graalpy"
+
+
+class FileCloner(Prefab):
+    """
+    Copy function for shutil.copytree that clones file data where possible
+
+    Methods that fail are switched off for the rest of the copy.
+    """
+    reflink: bool = sys.platform == "linux"
+    copy_range: bool = hasattr(os, "copy_file_range")
+
+    def _clone(self, src: str, dst: str) -> bool:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            if self.reflink:
+                import fcntl
+                try:
+                    fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                except OSError:
+                    self.reflink = False
+                else:
+                    return True
+
+            if self.copy_range:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                try:
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                except OSError:
+                    self.copy_range = False
+                else:
+                    return remaining == 0
+
+        return False
+
+    def __call__(self, src: str, dst: str) -> str:
+        if not ((self.reflink or self.copy_range) and self._clone(src, dst)):
+            shutil.copyfile(src, dst)
+        # Keep mtimes so the cached bytecode stays valid for the copied sources
+        shutil.copystat(src, dst)
+        return dst
+
+
+def fix_shebang(data: bytes) -> bytes:
+    """
+    Switch a script to a /bin/sh exec shebang if its interpreter can't be used directly
+
+    This matches the shebang installers write for interpreter paths with
+    spaces or that are longer than the kernel allows.
+
+    :param data: Script contents
+    :return: Script contents with a usable shebang
+    """
+    if not data.startswith(b"#!"):
+        return data
+
+    first_line, _, rest = data.partition(b"\n")
+    interpreter = first_line[2:].rstrip(b"\r")
+    if b" " not in interpreter and len(first_line) <= 127:
+        return data
+
+    return (
+        b"#!/bin/sh\n"
+        + b"'''exec' \"" + interpreter + b"\" \"$0\" \"$@\"\n"
+        + b"' '''\n"
+        + rest
+    )
+
+
+def rewrite_file(
+    path: str,
+    replacements: list[tuple[bytes, bytes]],
+    script: bool = False,
+) -> bool:
+    """
+    Replace byte strings in a file, leaving it untouched if nothing matches
+
+    :param path: Path to the file
+    :param replacements: (old, new) pairs applied in order
+    :param script: Check the shebang is still usable after replacing paths
+    :return: True if the file was changed
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    new_data = data
+    for old, new in replacements:
+        new_data = new_data.replace(old, new)
+
+    if script and new_data != data:
+        new_data = fix_shebang(new_data)
+
+    if new_data == data:
+        return False
+
+    with open(path, "wb") as f:
+        f.write(new_data)
+    return True
+
+
+def relocate_venv(old_path: str, venv_path: str) -> None:
+    """
+    Rewrite the paths and prompt of a venv copied or moved from another location
+
+    :param old_path: Path the venv was created at
+    :param venv_path: Current path of the venv
+    """
+    old_abs = os.path.abspath(old_path)
+    venv_abs = os.path.abspath(venv_path)
+
+    old_name = os.fsencode(os.path.basename(old_abs))
+    venv_name = os.fsencode(os.path.basename(venv_abs))
+
+    replacements = []
+    for path in dict.fromkeys([old_abs, os.path.realpath(old_abs)]):
+        replacements.append((os.fsencode(path), os.fsencode(venv_abs)))
+    # Template and pool folder names are unique so are safe to replace anywhere they remain
+    replacements.append((old_name, venv_name))
+
+    rewrite_file(os.path.join(venv_abs, "pyvenv.cfg"), replacements)
+    with os.scandir(os.path.join(venv_abs, "bin")) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                rewrite_file(entry.path, replacements, script=True)
+
+
+def clone_venv(template_path: str, venv_path: str) -> None:
+    """
+    Clone a template venv and rewrite its paths and prompt for the new location
+
+    :param template_path: Path to the template venv
+    :param venv_path: Path to the new venv, must not exist
+    """
+    if os.path.lexists(venv_path):
+        raise FileExistsError(f"VEnv '{venv_path}' already exists.")
+
+    try:
+        shutil.copytree(template_path, venv_path, symlinks=True, copy_function=FileCloner())
+        relocate_venv(template_path, venv_path)
+    except OSError:
+        shutil.rmtree(venv_path, ignore_errors=True)
+        raise
+
+
+@contextlib.contextmanager
+def _template_lock(key: str, template_folder: str):
+    # Exclusive lock shared between processes building the template for a key
+    # Templates are not used on Windows so fcntl is always available here
+    import fcntl
+
+    with open(os.path.join(template_folder, f"{key}.lock"), "w") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        yield
+
+
+def _remove_old_templates(key: str, folder: str, template_folder: str) -> None:
+    # Remove template folders for the key that the metadata no longer refers to,
+    # including those left by builds that were interrupted
+    prefix = f"{key}-"
+    with os.scandir(template_folder) as entries:
+        for entry in entries:
+            if (
+                entry.name.startswith(prefix)
+                and entry.name != folder
+                and entry.is_dir(follow_symlinks=False)
+            ):
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def get_template_key(
+    backend: VEnvBackend,
+    python_runtime: PythonInstall,
+    include_pip: bool,
+    latest_pip: bool,
+) -> str:
+    raw_key = json.dumps(
+        [os.path.realpath(python_runtime.executable), backend.name, include_pip, latest_pip]
+    )
+    return hashlib.sha256(raw_key.encode()).hexdigest()[:16]
+
+
+def load_template(
+    key: str,
+    python_runtime: PythonInstall,
+    latest_pip: bool,
+    template_folder: str,
+) -> str | None:
+    """
+    Get the path to a valid template if one exists
+
+    :return: Path to the template venv or None if missing or stale
+    """
+    try:
+        with open(os.path.join(template_folder, f"{key}.json")) as f:
+            metadata = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    try:
+        template_path = os.path.join(template_folder, metadata["folder"])
+        if list(metadata["version"]) != list(python_runtime.version):
+            return None
+        age = time.time() - metadata["created"]
+    except (KeyError, TypeError):
+        return None
+
+    if latest_pip and not (0 <= age < TEMPLATE_MAX_AGE):
+        return None
+    if not os.path.exists(os.path.join(template_path, "pyvenv.cfg")):
+        return None
+
+    return template_path
+
+
+def build_template(
+    key: str,
+    backend: VEnvBackend,
+    python_runtime: PythonInstall,
+    include_pip: bool,
+    latest_pip: bool,
+    template_folder: str,
+) -> str:
+    """
+    Create a new template venv and record it as the current template for its key
+
+    If another process built a valid template while waiting for the lock
+    that template is used instead. Any template this replaces is removed.
+
+    :return: Path to the template venv
+    """
+    os.makedirs(template_folder, exist_ok=True)
+
+    with _template_lock(key, template_folder):
+        template_path = load_template(key, python_runtime, latest_pip, template_folder)
+        if template_path is not None:
+            return template_path
+
+        # Templates are never moved, a unique folder name means the name can be
+        # safely replaced in the activation scripts of clones
+        folder = f"{key}-{uuid.uuid4().hex[:8]}"
+        template_path = os.path.join(template_folder, folder)
+
+        try:
+            backend.create(python_runtime, template_path, include_pip, latest_pip)
+        except BaseException:
+            shutil.rmtree(template_path, ignore_errors=True)
+            raise
+
+        metadata = {
+            "folder": folder,
+            "executable": os.path.realpath(python_runtime.executable),
+            "version": list(python_runtime.version),
+            "backend": backend.name,
+            "include_pip": include_pip,
+            "latest_pip": latest_pip,
+            "created": time.time(),
+        }
+
+        metadata_path = os.path.join(template_folder, f"{key}.json")
+        tmp_path = f"{metadata_path}.{folder}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(metadata, f)
+        os.replace(tmp_path, metadata_path)
+
+        _remove_old_templates(key, folder, template_folder)
+
+    return template_path
+
+
+def prepare_template(
+    backend: VEnvBackend,
+    python_runtime: PythonInstall,
+    include_pip: bool = True,
+    latest_pip: bool = True,
+    template_folder: str | None = None,
+) -> str:
+    """
+    Get the template for these options, building it if it is missing or stale
+
+    :param backend: Backend used to build the template
+    :param python_runtime: Python install the template is based on
+    :param include_pip: Include pip in the template
+    :param latest_pip: Upgrade pip to the latest version
+    :param template_folder: Folder holding the templates
+    :return: Path to the template venv
+    """
+    template_folder = TEMPLATE_FOLDER if template_folder is None else template_folder
+
+    key = get_template_key(backend, python_runtime, include_pip, latest_pip)
+    template_path = load_template(key, python_runtime, latest_pip, template_folder)
+    if template_path is None:
+        template_path = build_template(
+            key, backend, python_runtime, include_pip, latest_pip, template_folder
+        )
+    return template_path
+
+
+def create_from_template(
+    backend: VEnvBackend,
+    python_runtime: PythonInstall,
+    venv_path: str,
+    include_pip: bool = True,
+    latest_pip: bool = True,
+    template_folder: str | None = None,
+) -> PythonVEnv:
+    """
+    Create a venv by cloning the template for these options, building it if needed
+
+    If the template can't be built or cloned the venv is created directly
+    with the backend instead.
+
+    :param backend: Backend used to build the template
+    :param python_runtime: Python install the venv is based on
+    :param venv_path: Path to the new venv folder
+    :param include_pip: Include pip in the venv
+    :param latest_pip: Upgrade pip to the latest version
+    :param template_folder: Folder holding the templates
+    :return: PythonVEnv for the new environment
+    """
+    try:
+        template_path = prepare_template(
+            backend, python_runtime, include_pip, latest_pip, template_folder
+        )
+    except OSError:
+        # The template cache couldn't be written, the venv can still be created in place
+        return backend.create(python_runtime, venv_path, include_pip, latest_pip)
+
+    try:
+        clone_venv(template_path, venv_path)
+    except FileExistsError:
+        raise
+    except OSError:
+        return backend.create(python_runtime, venv_path, include_pip, latest_pip)
+
+    config_path = os.path.join(os.path.realpath(venv_path), "pyvenv.cfg")
+    return PythonVEnv.from_cfg(config_path)
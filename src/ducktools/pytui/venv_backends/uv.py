@@ -0,0 +1,79 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Create venvs with `uv venv`, seeding pip from uv's cache when requested.
+"""
+from __future__ import annotations
+
+from typing import ClassVar
+
+from ducktools.pythonfinder import PythonInstall
+
+from ._core import VEnvBackend
+
+
+class UVVEnvBackend(VEnvBackend):
+    name: ClassVar[str] = "uv"
+
+    executable: str
+
+    @classmethod
+    def get(cls) -> UVVEnvBackend | None:
+        from ..runtime_installers.uv import UVManager
+
+        exe = UVManager().executable
+        if exe:
+            return cls(exe)
+        return None
+
+    def supports(
+        self,
+        python_runtime: PythonInstall,
+        include_pip: bool = True,
+        latest_pip: bool = True,
+    ) -> bool:
+        # uv always seeds the newest pip it can find, so leave the bundled pip
+        # and graalpy's own pip handling to the venv module
+        if include_pip and not latest_pip:
+            return False
+        if python_runtime.implementation == "graalpy":
+            return False
+        return python_runtime.version >= (3, 8)
+
+    def get_command(
+        self,
+        python_runtime: PythonInstall,
+        venv_path: str,
+        include_pip: bool = True,
+        latest_pip: bool = True,
+    ) -> list[str]:
+        venv_cmd = [
+            self.executable, "venv", venv_path,
+            "--python", python_runtime.executable,
+            "--color", "never",
+            "--quiet",
+        ]
+        if include_pip:
+            venv_cmd.append("--seed")
+
+        return venv_cmd
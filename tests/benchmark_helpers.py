@@ -0,0 +1,89 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Timing helpers shared by the startup benchmarks in the test suite and scripts/bench_startup.py.
+"""
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+import time
+
+
+# Run in a fresh interpreter as the caller will usually have imported
+# ducktools.pytui already.
+IMPORT_TIMER = textwrap.dedent(
+    """
+    import time
+    start = time.perf_counter()
+    import ducktools.pytui.__main__
+    import ducktools.pytui.ui
+    print(time.perf_counter() - start)
+    """
+)
+
+
+def time_import(repeat: int) -> float:
+    """
+    Time importing the entry point and the UI module in a fresh interpreter
+
+    :param repeat: Number of runs, the fastest is kept
+    :return: Fastest import time in seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_TIMER],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        timings.append(float(result.stdout))
+    return min(timings)
+
+
+async def time_to_populated_tables(timeout: float = 30.0) -> float:
+    """
+    Time from creating the app until both tables have rows and are no longer loading
+
+    :param timeout: Seconds to wait before raising TimeoutError
+    :return: Time taken in seconds
+    """
+    from ducktools.pytui.ui import ManagerApp
+
+    start = time.perf_counter()
+    app = ManagerApp()
+    async with app.run_test() as pilot:
+        while True:
+            venv_table, runtime_table = app._venv_table, app._runtime_table
+            if (
+                venv_table.row_count and runtime_table.row_count
+                and not (venv_table.loading or runtime_table.loading)
+            ):
+                return time.perf_counter() - start
+
+            if time.perf_counter() - start > timeout:
+                raise TimeoutError("Tables were not populated before the timeout")
+
+            await pilot.pause(0.001)
@@ -22,12 +22,25 @@
 # SOFTWARE.
 from __future__ import annotations
 
+import json
+import os
+import os.path
 import sys
+from pathlib import Path
+from typing import ClassVar
 from unittest.mock import patch, PropertyMock
 
 import pytest
 
-from ducktools.pytui.runtime_installers import uv
+from ducktools.pythonfinder import PythonInstall
+from ducktools.pythonfinder.venv import PythonVEnv
+
+from ducktools.pytui.discovery import runtime_cache, venv_index
+from ducktools.pytui.runtime_installers import download_cache, uv
+from ducktools.pytui.venv_backends import VEnvBackend, pool, seed_wheels, templates
+
+BENCHMARK_BASELINES = Path(__file__).parent / "benchmark_baselines.json"
+BENCHMARK_SLACK = 0.002  # Absolute allowance in seconds for timer noise on tiny benchmarks
 
 collect_ignore_glob = []
 
@@ -37,6 +50,79 @@ else:
     collect_ignore_glob.append("**/posix/*")
 
 
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path):
+    # Never read or write the real pytui caches during tests
+    cache_folder = tmp_path / "pytui_cache"
+    with (
+        patch.object(runtime_cache, "RUNTIME_CACHE_PATH", str(cache_folder / "runtimes.json")),
+        patch.object(venv_index, "VENV_INDEX_FOLDER", str(cache_folder / "venv_index")),
+        patch.object(download_cache, "DOWNLOAD_CACHE_FOLDER", str(cache_folder / "downloads")),
+        patch.object(templates, "TEMPLATE_FOLDER", str(cache_folder / "venv_templates")),
+        patch.object(pool, "POOL_FOLDER", str(cache_folder / "venv_pool")),
+        patch.object(seed_wheels, "SEED_WHEEL_FOLDER", str(cache_folder / "seed_wheels")),
+    ):
+        yield cache_folder
+
+
+class FakeVEnvBackend(VEnvBackend):
+    """
+    Backend that writes a minimal venv with absolute paths in the usual places
+    """
+    name: ClassVar[str] = "fake"
+    exclude: ClassVar[bool] = True
+
+    created: list
+
+    def create(self, python_runtime, venv_path, include_pip=True, latest_pip=True):
+        venv_path = os.path.abspath(venv_path)
+        self.created.append(venv_path)
+
+        bin_folder = os.path.join(venv_path, "bin")
+        os.makedirs(bin_folder)
+        os.symlink(python_runtime.executable, os.path.join(bin_folder, "python"))
+
+        with open(os.path.join(venv_path, "pyvenv.cfg"), "w") as f:
+            f.write(
+                "home = /usr/bin\n"
+                "version = 3.13.2\n"
+                f"command = /usr/bin/python3 -m venv {venv_path}\n"
+            )
+        with open(os.path.join(bin_folder, "activate"), "w") as f:
+            f.write(
+                f"VIRTUAL_ENV={venv_path}\n"
+                f"VIRTUAL_ENV_PROMPT={os.path.basename(venv_path)}\n"
+            )
+        with open(os.path.join(bin_folder, "pip"), "w") as f:
+            f.write(f"#!{bin_folder}/python\nimport pip\n")
+
+        return PythonVEnv.from_cfg(os.path.join(venv_path, "pyvenv.cfg"))
+
+
+@pytest.fixture
+def fake_venv_backend():
+    return FakeVEnvBackend([])
+
+
+@pytest.fixture
+def make_venv():
+    # Create a minimal venv folder that pythonfinder will recognise
+    def make(folder, version="3.12.1"):
+        folder.mkdir(parents=True)
+        (folder / "pyvenv.cfg").write_text(f"home = /usr/bin\nversion = {version}\n")
+    return make
+
+
+@pytest.fixture
+def fake_venv_runtime():
+    return PythonInstall(
+        version=(3, 13, 2, "final", 0),
+        executable="/usr/bin/python3",
+        architecture="64bit",
+        implementation="cpython",
+    )
+
+
 @pytest.fixture(scope="function")
 def uv_executable():
     with patch.object(uv.UVManager, "executable", new_callable=PropertyMock) as fake_uv:
@@ -54,5 +140,72 @@ def uv_python_dir():
         yield
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run tests marked as benchmarks and compare against stored baselines",
+    )
+    parser.addoption(
+        "--update-benchmark-baselines",
+        action="store_true",
+        default=False,
+        help="Store the measured benchmark timings as the new baselines",
+    )
+    parser.addoption(
+        "--benchmark-tolerance",
+        action="store",
+        type=float,
+        default=1.5,
+        help="Fail benchmarks slower than baseline * tolerance (default: 1.5)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks") or config.getoption("--update-benchmark-baselines"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="Benchmarks only run with --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline(request):
+    """
+    Compare a timing against the stored baseline of the same name.
+
+    With --update-benchmark-baselines the timing is stored instead.
+    """
+    update = request.config.getoption("--update-benchmark-baselines")
+    tolerance = request.config.getoption("--benchmark-tolerance")
+
+    try:
+        baselines = json.loads(BENCHMARK_BASELINES.read_text())
+    except FileNotFoundError:
+        baselines = {}
+
+    def check(name: str, elapsed: float) -> None:
+        if update:
+            baselines[name] = round(elapsed, 6)
+            return
+
+        baseline = baselines.get(name)
+        if baseline is None:
+            pytest.fail(f"No baseline stored for benchmark {name!r}")
+
+        limit = baseline * tolerance + BENCHMARK_SLACK
+        assert elapsed <= limit, (
+            f"{name}: {elapsed:.6f}s exceeds baseline {baseline:.6f}s x {tolerance}"
+        )
+
+    yield check
+
+    if update:
+        BENCHMARK_BASELINES.write_text(json.dumps(baselines, indent=4, sort_keys=True) + "\n")
+
+
 def pytest_report_header():
     return f"virtualenv: {sys.prefix}"
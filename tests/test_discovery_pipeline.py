@@ -0,0 +1,120 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from ducktools.pytui.discovery.pipeline import (
+    DISCOVERY_WORKERS,
+    DiscoveryTimings,
+    get_discovery_executor,
+    run_sources,
+    stream_discovery,
+)
+
+
+def test_executor_is_bounded_and_shared():
+    executor = get_discovery_executor()
+    assert executor is get_discovery_executor()
+    assert executor._max_workers == DISCOVERY_WORKERS
+
+
+def test_run_sources_yields_in_completion_order():
+    release_slow = threading.Event()
+
+    def slow():
+        release_slow.wait(5)
+        return "slow"
+
+    def fast():
+        return "fast"
+
+    async def collect():
+        timings = DiscoveryTimings()
+        results = []
+        async for name, result in run_sources({"slow": slow, "fast": fast}, timings=timings):
+            results.append((name, result))
+            # The slow source can only finish once the fast result has been received
+            release_slow.set()
+        return results, timings
+
+    results, timings = asyncio.run(collect())
+
+    assert results == [("fast", "fast"), ("slow", "slow")]
+    assert set(timings.sources) == {"slow", "fast"}
+
+
+def test_sources_run_concurrently():
+    def sleeper():
+        time.sleep(0.1)
+
+    async def run_all():
+        timings = DiscoveryTimings()
+        async for _ in run_sources({"a": sleeper, "b": sleeper, "c": sleeper}, timings=timings):
+            pass
+        return timings
+
+    timings = asyncio.run(run_all())
+
+    total = sum(end - start for start, end in timings.sources.values())
+    assert timings.wall_clock < total
+    assert "wall clock" in timings.summary()
+
+
+def test_stream_discovery_batches_before_completion():
+    release = threading.Event()
+
+    def generator():
+        yield 1
+        yield 2
+        release.wait(5)
+        yield 3
+
+    async def collect():
+        timings = DiscoveryTimings()
+        batches = []
+        async for batch in stream_discovery(generator, name="numbers", timings=timings, batch_interval=0.01):
+            batches.append(batch)
+            release.set()
+        return batches, timings
+
+    batches, timings = asyncio.run(collect())
+
+    assert batches == [[1, 2], [3]]
+    assert "numbers" in timings.sources
+
+
+def test_stream_discovery_raises_errors():
+    def generator():
+        yield 1
+        raise ValueError("failed")
+
+    async def collect():
+        return [batch async for batch in stream_discovery(generator)]
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect())
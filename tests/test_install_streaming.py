@@ -0,0 +1,193 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import asyncio
+import sys
+
+from unittest.mock import MagicMock
+
+from ducktools.pytui.runtime_installers import stream_batch_install, stream_install
+from ducktools.pytui.runtime_installers.streaming import stream_command
+
+
+SLOW_SCRIPT = """
+import sys, time
+print("downloading", flush=True)
+time.sleep(30)
+print("done", flush=True)
+"""
+
+
+def python_command(script):
+    return [sys.executable, "-c", script]
+
+
+def fake_listing(cmd, installed=False, key="cpython-3.13.1", manager=None):
+    listing = MagicMock()
+    listing.key = key
+    listing.full_key = f"UVPythonListing / {key}"
+    listing.path = None
+    listing.install_command.return_value = cmd
+    if manager is not None:
+        listing.manager = manager
+    else:
+        listing.manager.installed_index.return_value.by_key = {}
+    if installed:
+        listing.manager.installed_index.return_value.by_key[listing.full_key] = listing
+    return listing
+
+
+def fake_manager(batch_cmd=None):
+    manager = MagicMock()
+    manager.batch_install_command.return_value = batch_cmd
+    manager.installed_index.return_value.by_key = {}
+    return manager
+
+
+def test_stream_command_output():
+    lines = []
+    returncode, output, cancelled = asyncio.run(
+        stream_command(
+            python_command("import sys; print('out'); print('err', file=sys.stderr)"),
+            on_output=lines.append,
+        )
+    )
+
+    assert returncode == 0
+    assert not cancelled
+    assert sorted(lines) == ["err", "out"]
+    assert output == lines
+
+
+def test_stream_command_cancel():
+    async def run():
+        cancel_event = asyncio.Event()
+        lines = []
+
+        def on_output(line):
+            lines.append(line)
+            cancel_event.set()
+
+        result = await asyncio.wait_for(
+            stream_command(
+                python_command(SLOW_SCRIPT),
+                on_output=on_output,
+                cancel_event=cancel_event,
+            ),
+            10,
+        )
+        return result, lines
+
+    (returncode, output, cancelled), lines = asyncio.run(run())
+
+    assert cancelled
+    assert returncode != 0
+    assert lines == ["downloading"]
+
+
+def test_stream_install_reports_state():
+    listing = fake_listing(python_command("print('Installed Python 3.13.1')"), installed=True)
+
+    result = asyncio.run(stream_install(listing))
+
+    assert result.success
+    assert result.installed
+    assert result.output == ["Installed Python 3.13.1"]
+    listing.manager.invalidate_installed.assert_called_once()
+
+
+def test_stream_install_cancelled_partial_state():
+    listing = fake_listing(python_command(SLOW_SCRIPT), installed=False)
+
+    async def run():
+        cancel_event = asyncio.Event()
+        return await stream_install(
+            listing,
+            on_output=lambda line: cancel_event.set(),
+            cancel_event=cancel_event,
+        )
+
+    result = asyncio.run(run())
+
+    assert result.cancelled
+    assert not result.success
+    assert not result.installed
+    listing.manager.invalidate_installed.assert_called_once()
+
+
+def test_stream_install_already_installed():
+    listing = fake_listing(None)
+    assert asyncio.run(stream_install(listing)) is None
+
+
+def test_batch_install_single_command():
+    manager = fake_manager(python_command("print('Installed 2 versions')"))
+    listings = [
+        fake_listing(None, key=f"cpython-{v}", manager=manager)
+        for v in ("3.12.8", "3.13.1")
+    ]
+    # Only the first made it
+    manager.installed_index.return_value.by_key[listings[0].full_key] = listings[0]
+
+    results = asyncio.run(stream_batch_install(listings))
+
+    manager.batch_install_command.assert_called_once_with(listings)
+    assert [r.listing for r in results] == listings
+    assert [r.installed for r in results] == [True, False]
+    assert all(r.output == ["Installed 2 versions"] for r in results)
+    manager.invalidate_installed.assert_called_once()
+
+
+def test_batch_install_per_listing_fallback():
+    manager = fake_manager(None)
+    first = fake_listing(python_command("print('first')"), key="first", manager=manager)
+    second = fake_listing(python_command("raise SystemExit(1)"), key="second", manager=manager)
+    manager.installed_index.return_value.by_key[first.full_key] = first
+
+    results = asyncio.run(stream_batch_install([first, second]))
+
+    assert results[0].success and results[0].installed
+    assert results[1].returncode == 1 and not results[1].installed
+    assert manager.invalidate_installed.call_count == 2
+
+
+def test_batch_install_cancel_skips_remaining():
+    manager = fake_manager(None)
+    first = fake_listing(python_command(SLOW_SCRIPT), key="first", manager=manager)
+    second = fake_listing(python_command("print('second')"), key="second", manager=manager)
+
+    async def run():
+        cancel_event = asyncio.Event()
+        return await stream_batch_install(
+            [first, second],
+            on_output=lambda line: cancel_event.set(),
+            cancel_event=cancel_event,
+        )
+
+    results = asyncio.run(run())
+
+    assert all(r.cancelled for r in results)
+    # The second install was never started
+    assert results[1].returncode is None
+    assert results[1].output == []
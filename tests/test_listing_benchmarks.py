@@ -0,0 +1,75 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import json
+import time
+
+from pathlib import Path
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from ducktools.pytui.runtime_installers import uv
+from ducktools.pytui.runtime_installers.uv import UVManager, UVPythonListing
+
+
+EXAMPLE_DOWNLOADS = Path(__file__).parent / "example_data" / "install_managers" / "uv_download_list.json"
+
+
+def synthetic_uv_list(count: int, runtime_folder: str) -> list[dict]:
+    """
+    Build a 'uv python list --all-versions' style output with count entries,
+    one in ten of them installed in runtime_folder
+    """
+    template = json.loads(EXAMPLE_DOWNLOADS.read_text())[0]
+    entries = []
+    for i in range(count):
+        entry = dict(template)
+        version = f"3.{i % 15}.{i}"
+        entry["key"] = f"cpython-{version}-linux-x86_64-gnu"
+        entry["version"] = version
+        entry["version_parts"] = {"major": 3, "minor": i % 15, "patch": i}
+        if i % 10 == 0:
+            entry["path"] = f"{runtime_folder}/{entry['key']}/bin/python3"
+        entries.append(entry)
+    return entries
+
+
+@pytest.mark.benchmark
+def test_bench_uv_listings_10k(benchmark_baseline, tmp_path):
+    runtime_folder = str(tmp_path)
+    entries = synthetic_uv_list(10_000, runtime_folder)
+
+    with patch.object(uv.UVManager, "runtime_folder", new_callable=PropertyMock) as fake_folder:
+        fake_folder.return_value = runtime_folder
+        manager = UVManager()
+
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            listings = UVPythonListing.from_entries(manager, entries)
+            timings.append(time.perf_counter() - start)
+
+    assert len(listings) == 10_000
+    benchmark_baseline("uv_listings_10k", min(timings))
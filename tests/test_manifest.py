@@ -0,0 +1,235 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import os
+import os.path
+import subprocess
+import sys
+import textwrap
+
+from unittest.mock import patch
+
+import pytest
+
+from ducktools.pythonfinder import PythonInstall
+from ducktools.pythonfinder.venv import InvalidVEnvError
+
+from ducktools.pytui.config import Config
+from ducktools.pytui.manifest import (
+    ManifestEntry,
+    ManifestError,
+    create_entry,
+    create_from_manifest,
+    find_runtime,
+    format_summary,
+    load_manifest,
+    prepare_templates,
+)
+
+
+def make_install(version, implementation="cpython", executable="/usr/bin/python3", freethreaded=False):
+    return PythonInstall(
+        version=version,
+        executable=executable,
+        architecture="64bit",
+        implementation=implementation,
+        metadata={"freethreaded": freethreaded},
+    )
+
+
+INSTALLS = [
+    make_install((3, 13, 2, "final", 0), executable="/usr/bin/python3.13t", freethreaded=True),
+    make_install((3, 13, 2, "final", 0), executable="/usr/bin/python3.13"),
+    make_install((3, 12, 8, "final", 0), executable="/usr/bin/python3.12"),
+    make_install((3, 10, 16, "final", 0), implementation="pypy", executable="/usr/bin/pypy3.10"),
+    make_install((3, 4, 0, "final", 0), implementation="micropython", executable="/usr/bin/micropython"),
+]
+
+
+def test_load_manifest(tmp_path):
+    manifest = tmp_path / "envs.toml"
+    manifest.write_text(textwrap.dedent(
+        """
+        [[venv]]
+        name = "tools"
+        runtime = "3.13"
+        global = true
+
+        [[venv]]
+        name = "project/.venv"
+        runtime = "pypy3.10"
+        requirements = "requirements.txt"
+        """
+    ))
+
+    assert load_manifest(str(manifest)) == [
+        ManifestEntry(name="tools", runtime="3.13", global_venv=True),
+        ManifestEntry(name="project/.venv", runtime="pypy3.10", requirements="requirements.txt"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "contents, message",
+    [
+        ("venv = [", "Could not parse"),
+        ("", "has no"),
+        ('[[venv]]\nruntime = "3.12"', "needs a 'name'"),
+        ('[[venv]]\nname = "env"', "needs a 'runtime'"),
+        ('[[venv]]\nname = "env"\nruntime = "3.12"\nglobal = "yes"', "must be true or false"),
+        ('[[venv]]\nname = "env"\nruntime = "3.12"\npython = "3.12"', "unknown keys: python"),
+        ('[[venv]]\nname = "a/env"\nruntime = "3.12"\nglobal = true', "can't contain a path"),
+        ('venv = ["env"]', "must be a table"),
+    ]
+)
+def test_load_manifest_errors(tmp_path, contents, message):
+    manifest = tmp_path / "envs.toml"
+    manifest.write_text(contents)
+
+    with pytest.raises(ManifestError, match=message):
+        load_manifest(str(manifest))
+
+
+@pytest.mark.parametrize(
+    "spec, executable",
+    [
+        ("3", "/usr/bin/python3.13"),
+        ("3.12", "/usr/bin/python3.12"),
+        ("3.12.8", "/usr/bin/python3.12"),
+        ("cpython3.13", "/usr/bin/python3.13"),
+        ("3.13t", "/usr/bin/python3.13t"),
+        ("pypy3.10", "/usr/bin/pypy3.10"),
+        ("3.11", None),
+        ("3.4", None),
+        ("pypy3.12", None),
+    ]
+)
+def test_find_runtime(spec, executable):
+    runtime = find_runtime(spec, INSTALLS)
+    if executable is None:
+        assert runtime is None
+    else:
+        assert runtime.executable == executable
+
+
+def test_find_runtime_invalid():
+    with pytest.raises(ManifestError):
+        find_runtime("latest", INSTALLS)
+
+
+def test_create_from_manifest(tmp_path):
+    runtime = make_install(tuple(sys.version_info), executable=sys.executable)
+    config = Config(
+        config_file=str(tmp_path / "config.json"),
+        include_pip=False,
+        venv_templates=False,
+        global_venv_folder=str(tmp_path / "global"),
+    )
+    entries = [
+        ManifestEntry(name="tools", runtime=sys.executable, global_venv=True),
+        ManifestEntry(name="project/.venv", runtime=sys.executable),
+        ManifestEntry(name="missing", runtime="2.7"),
+    ]
+
+    results = create_from_manifest(entries, [runtime], config, str(tmp_path), max_workers=2)
+
+    assert [result.name for result in results] == ["tools", "project/.venv", "missing"]
+    assert [result.success for result in results] == [True, True, False]
+    assert os.path.exists(tmp_path / "global" / "tools" / "pyvenv.cfg")
+    assert os.path.exists(tmp_path / "project" / ".venv" / "pyvenv.cfg")
+    assert results[2].error == "No runtime found matching '2.7'"
+
+    summary = format_summary(results, 1.0)
+    assert summary.startswith("Created 2 of 3 venvs in 1.00s")
+
+
+def test_duplicate_venv_paths_rejected(tmp_path):
+    runtime = make_install(tuple(sys.version_info), executable=sys.executable)
+    config = Config(config_file=str(tmp_path / "config.json"), global_venv_folder=str(tmp_path))
+    entries = [
+        ManifestEntry(name="env", runtime="2.7"),
+        ManifestEntry(name="./env", runtime=sys.executable),
+        ManifestEntry(name="env", runtime=sys.executable, global_venv=True),
+    ]
+
+    results = create_from_manifest(entries, [runtime], config, str(tmp_path))
+
+    assert results[0].error == "No runtime found matching '2.7'"
+    assert results[1].error == "Same venv path as entry 'env'"
+    assert results[2].error == "Same venv path as entry 'env'"
+    assert not os.path.exists(tmp_path / "env")
+
+
+def test_create_entry_reports_any_error(tmp_path):
+    runtime = make_install(tuple(sys.version_info), executable=sys.executable)
+    config = Config(config_file=str(tmp_path / "config.json"))
+
+    with patch("ducktools.pytui.manifest.create_venv", side_effect=InvalidVEnvError("bad cfg")):
+        result = create_entry("env", runtime, str(tmp_path / "env"), None, config)
+
+    assert result.error == "bad cfg"
+
+
+def test_templates_prepared_once_per_runtime(tmp_path):
+    runtimes = [
+        make_install((3, 13, 2, "final", 0), executable="/usr/bin/python3.13"),
+        make_install((3, 13, 2, "final", 0), executable="/usr/bin/python3.13"),
+        make_install((3, 12, 8, "final", 0), executable="/usr/bin/python3.12"),
+    ]
+    config = Config(config_file=str(tmp_path / "config.json"))
+
+    with patch("ducktools.pytui.manifest.prepare_template") as fake_prepare:
+        prepare_templates(runtimes, config)
+
+    assert [c.args[1].executable for c in fake_prepare.call_args_list] == [
+        "/usr/bin/python3.13", "/usr/bin/python3.12"
+    ]
+
+
+def test_create_subcommand_without_tty(tmp_path):
+    manifest = tmp_path / "envs.toml"
+    manifest.write_text('[[venv]]\nname = "env"\nruntime = "2.0"\n')
+
+    script = textwrap.dedent(
+        f"""
+        import sys
+        sys.argv = ["pytui", "create", "--manifest", {str(manifest)!r}]
+        from ducktools.pytui.__main__ import main
+        code = main()
+        print("textual imported:", "textual" in sys.modules)
+        sys.exit(code)
+        """
+    )
+    env = {**os.environ, "HOME": str(tmp_path), "LOCALAPPDATA": str(tmp_path)}
+
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+        env=env,
+    )
+
+    assert result.returncode == 1, result.stderr
+    assert "No runtime found matching '2.0'" in result.stdout
+    assert "textual imported: False" in result.stdout
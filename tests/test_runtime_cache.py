@@ -0,0 +1,89 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from ducktools.pythonfinder import PythonInstall
+
+from ducktools.pytui.discovery import runtime_cache
+from ducktools.pytui.discovery.runtime_cache import (
+    get_runtime_cache_key,
+    load_cached_installs,
+    save_cached_installs,
+)
+
+DATA_FOLDER = Path(__file__).parent / "example_data" / "pythonfinder"
+
+
+def example_runtimes() -> list[PythonInstall]:
+    raw_installs = json.loads((DATA_FOLDER / "runtimes_data.json").read_text())
+    return [PythonInstall.from_json(**inst) for inst in raw_installs]
+
+
+def test_cache_roundtrip(tmp_path):
+    cache_path = str(tmp_path / "runtimes.json")
+    key = {"path": "/usr/bin", "uv_python_dir": None, "folder_mtimes": {"/usr/bin": 1}}
+
+    installs = example_runtimes()
+    installs[0].shadowed = True
+
+    save_cached_installs(installs, key, cache_path=cache_path)
+    loaded = load_cached_installs(key, cache_path=cache_path)
+
+    assert loaded == installs
+    assert [i.shadowed for i in loaded] == [i.shadowed for i in installs]
+
+
+def test_cache_key_mismatch(tmp_path):
+    cache_path = str(tmp_path / "runtimes.json")
+    key = {"path": "/usr/bin", "uv_python_dir": None, "folder_mtimes": {"/usr/bin": 1}}
+    new_key = {"path": "/usr/bin", "uv_python_dir": None, "folder_mtimes": {"/usr/bin": 2}}
+
+    save_cached_installs(example_runtimes(), key, cache_path=cache_path)
+
+    assert load_cached_installs(new_key, cache_path=cache_path) is None
+
+
+def test_cache_missing_or_corrupt(tmp_path):
+    cache_path = tmp_path / "runtimes.json"
+    assert load_cached_installs({}, cache_path=str(cache_path)) is None
+
+    cache_path.write_text("{not json")
+    assert load_cached_installs({}, cache_path=str(cache_path)) is None
+
+
+def test_cache_key_tracks_folder_mtimes(tmp_path, monkeypatch):
+    folder = tmp_path / "bin"
+    folder.mkdir()
+    monkeypatch.setenv("PATH", str(folder))
+    monkeypatch.setattr(runtime_cache, "get_uv_python_path", lambda: None)
+    monkeypatch.setattr(runtime_cache, "get_pyenv_root", lambda: None)
+
+    key = get_runtime_cache_key()
+    assert key["path"] == str(folder)
+    assert key["folder_mtimes"] == {str(folder): folder.stat().st_mtime_ns}
+
+    (folder / "python3").touch()
+    assert get_runtime_cache_key() != key
@@ -22,3 +22,142 @@
 # SOFTWARE.
 from __future__ import annotations
 
+import subprocess
+import sys
+import threading
+import time
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ducktools.pytui import runtime_installers
+from ducktools.pytui.runtime_installers import ManagerTimeoutError, uv
+
+
+def fake_manager(organisation, downloads=(), error=None, delay=0.0, timeout=30.0):
+    manager = MagicMock()
+    manager.organisation = organisation
+    manager.query_timeout = timeout
+
+    def fetch_downloads(all_versions=False, refresh=False, cache_ttl=None):
+        time.sleep(delay)
+        if error:
+            raise error
+        return list(downloads)
+
+    manager.fetch_downloads.side_effect = fetch_downloads
+    return manager
+
+
+@pytest.fixture
+def patch_managers():
+    with patch.object(runtime_installers, "get_managers") as get_managers:
+        yield get_managers
+
+
+def test_fetch_downloads_concurrent(patch_managers):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait_for_other(*args, **kwargs):
+        barrier.wait()
+        return ["listing"]
+
+    managers = [fake_manager("first"), fake_manager("second")]
+    for m in managers:
+        m.fetch_downloads.side_effect = wait_for_other
+    patch_managers.return_value = managers
+
+    # Would raise BrokenBarrierError if the managers were queried sequentially
+    assert runtime_installers.fetch_downloads() == ["listing", "listing"]
+
+
+def test_fetch_downloads_reports_errors(patch_managers):
+    broken = fake_manager("broken", error=OSError("no uv"))
+    working = fake_manager("working", downloads=["a", "b"])
+    patch_managers.return_value = [broken, working]
+
+    errors = []
+    result = runtime_installers.fetch_downloads(
+        on_error=lambda manager, e: errors.append((manager, e))
+    )
+
+    assert result == ["a", "b"]
+    assert len(errors) == 1
+    assert errors[0][0] is broken
+    assert isinstance(errors[0][1], OSError)
+
+    with pytest.raises(OSError):
+        runtime_installers.fetch_downloads()
+
+
+def test_fetch_downloads_timeout(patch_managers):
+    slow = fake_manager("slow", downloads=["slow"], delay=2.0, timeout=0.1)
+    fast = fake_manager("fast", downloads=["fast"])
+    patch_managers.return_value = [slow, fast]
+
+    errors = []
+    start = time.monotonic()
+    result = runtime_installers.fetch_downloads(
+        on_error=lambda manager, e: errors.append((manager, e))
+    )
+
+    assert time.monotonic() - start < 1.0
+    assert result == ["fast"]
+    assert errors[0][0] is slow
+    assert isinstance(errors[0][1], ManagerTimeoutError)
+
+
+def test_timed_out_manager_command_is_killed(uv_executable, uv_python_dir):
+    manager = uv.UVManager()
+    manager.query_timeout = 0.2
+
+    start = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        manager._run_query([sys.executable, "-c", "import time; time.sleep(10)"])
+    assert time.monotonic() - start < 5.0
+
+
+def test_manager_command_timeout_is_reported(patch_managers):
+    hung = fake_manager("hung", error=subprocess.TimeoutExpired(["uv"], 0.1), timeout=0.1)
+    patch_managers.return_value = [hung]
+
+    errors = []
+    runtime_installers.fetch_downloads(on_error=lambda manager, e: errors.append((manager, e)))
+
+    assert isinstance(errors[0][1], ManagerTimeoutError)
+
+
+def test_find_matching_listing_skips_errors(patch_managers):
+    broken = fake_manager("broken")
+    broken.find_matching_listing.side_effect = OSError("no uv")
+    other = fake_manager("other")
+    other.find_matching_listing.return_value = None
+    matching = fake_manager("matching")
+    matching.find_matching_listing.return_value = "listing"
+    patch_managers.return_value = [broken, other, matching]
+
+    errors = []
+    listing = runtime_installers.find_matching_listing(
+        MagicMock(),
+        on_error=lambda manager, e: errors.append((manager, e)),
+    )
+
+    assert listing == "listing"
+    assert [m for m, _ in errors] == [broken]
+
+
+def test_find_matching_listings_queries_managers_once(patch_managers):
+    installs = [MagicMock(), MagicMock(), MagicMock()]
+    first = fake_manager("first")
+    first.find_matching_listing.side_effect = lambda i: "first" if i is installs[0] else None
+    second = fake_manager("second")
+    second.find_matching_listing.side_effect = lambda i: "second" if i is not installs[2] else None
+    patch_managers.return_value = [first, second]
+
+    listings = runtime_installers.find_matching_listings(installs)
+
+    # Earlier managers take priority
+    assert listings == ["first", "second", None]
+    assert first.find_matching_listing.call_count == 3
+    assert second.find_matching_listing.call_count == 3
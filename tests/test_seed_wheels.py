@@ -0,0 +1,177 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import json
+import os
+import os.path
+import subprocess
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ducktools.pythonfinder import PythonInstall
+
+from ducktools.pytui.venv_backends import seed_wheels
+from ducktools.pytui.venv_backends.stdlib import StdlibVEnvBackend
+
+
+def make_runtime(version=(3, 11, 9, "final", 0)):
+    return PythonInstall(
+        version=version,
+        executable="/usr/bin/python3",
+        architecture="64bit",
+        implementation="cpython",
+    )
+
+
+def fake_download(cmd, **kwargs):
+    dest = cmd[cmd.index("--dest") + 1]
+    os.makedirs(dest)
+    for package in cmd[cmd.index(dest) + 1:]:
+        with open(os.path.join(dest, f"{package}-99.0-py3-none-any.whl"), "w") as f:
+            f.write("wheel")
+    return subprocess.CompletedProcess(cmd, 0)
+
+
+@pytest.fixture
+def wheel_folder(tmp_path):
+    return str(tmp_path / "wheels")
+
+
+def test_seed_packages():
+    assert seed_wheels.seed_packages(make_runtime()) == ["pip", "setuptools"]
+    assert seed_wheels.seed_packages(make_runtime((3, 13, 2, "final", 0))) == ["pip"]
+
+
+def test_empty_cache(wheel_folder):
+    runtime = make_runtime()
+    assert seed_wheels.get_seed_wheels(runtime, wheel_folder) is None
+    assert seed_wheels.needs_refresh(runtime, wheel_folder)
+
+
+def test_refresh(wheel_folder):
+    runtime = make_runtime()
+
+    with patch("subprocess.run", side_effect=fake_download) as run_mock:
+        first = seed_wheels.refresh(runtime, "/venv/bin/python", wheel_folder)
+
+    download_cmd = run_mock.call_args.args[0]
+    assert download_cmd[:4] == ["/venv/bin/python", "-m", "pip", "download"]
+    assert download_cmd[-2:] == ["pip", "setuptools"]
+
+    assert seed_wheels.get_seed_wheels(runtime, wheel_folder) == first
+    assert not seed_wheels.needs_refresh(runtime, wheel_folder)
+
+    # Other minor versions have their own wheels
+    assert seed_wheels.get_seed_wheels(make_runtime((3, 12, 1, "final", 0)), wheel_folder) is None
+
+    # A new refresh replaces the old wheels
+    with patch("subprocess.run", side_effect=fake_download):
+        second = seed_wheels.refresh(runtime, "/venv/bin/python", wheel_folder)
+
+    assert seed_wheels.get_seed_wheels(runtime, wheel_folder) == second
+    assert not os.path.exists(os.path.dirname(first[0]))
+
+
+def test_failed_refresh_keeps_wheels(wheel_folder):
+    runtime = make_runtime()
+    with patch("subprocess.run", side_effect=fake_download):
+        wheels = seed_wheels.refresh(runtime, "/venv/bin/python", wheel_folder)
+
+    error = subprocess.CalledProcessError(1, "pip")
+    with patch("subprocess.run", side_effect=error):
+        with pytest.raises(subprocess.CalledProcessError):
+            seed_wheels.refresh(runtime, "/venv/bin/python", wheel_folder)
+
+    assert seed_wheels.get_seed_wheels(runtime, wheel_folder) == wheels
+    assert len(os.listdir(wheel_folder)) == 2  # Metadata and the wheel folder
+
+
+def test_stale_cache_still_used(wheel_folder):
+    runtime = make_runtime()
+    with patch("subprocess.run", side_effect=fake_download):
+        wheels = seed_wheels.refresh(runtime, "/venv/bin/python", wheel_folder)
+
+    metadata_path = os.path.join(wheel_folder, "py3.11.json")
+    with open(metadata_path) as f:
+        metadata = json.load(f)
+    metadata["updated"] = time.time() - seed_wheels.SEED_WHEEL_MAX_AGE - 1
+    with open(metadata_path, "w") as f:
+        json.dump(metadata, f)
+
+    assert seed_wheels.needs_refresh(runtime, wheel_folder)
+    assert seed_wheels.get_seed_wheels(runtime, wheel_folder) == wheels
+
+
+def test_stdlib_backend_seeds_from_cache(tmp_path):
+    runtime = make_runtime()
+    with patch("subprocess.run", side_effect=fake_download):
+        wheels = seed_wheels.refresh(runtime, "/venv/bin/python")
+
+    venv_path = str(tmp_path / "env")
+    commands = []
+
+    def fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        if "venv" in cmd:
+            os.makedirs(venv_path)
+            with open(os.path.join(venv_path, "pyvenv.cfg"), "w") as f:
+                f.write("home = /usr/bin\nversion = 3.11.9\n")
+        return subprocess.CompletedProcess(cmd, 0)
+
+    with (
+        patch("subprocess.run", side_effect=fake_run),
+        patch.object(seed_wheels, "start_refresh") as refresh_mock,
+    ):
+        new_venv = StdlibVEnvBackend().create(runtime, venv_path)
+
+    assert commands == [
+        ["/usr/bin/python3", "-m", "venv", venv_path, "--without-pip"],
+        seed_wheels.get_install_command(new_venv.executable, wheels),
+    ]
+    assert "--no-index" in commands[1]
+    assert commands[1][1] == os.path.join(wheels[0], "pip")
+    refresh_mock.assert_called_once_with(runtime, new_venv.executable)
+
+
+def test_stdlib_backend_without_cache_uses_index(tmp_path):
+    runtime = make_runtime()
+    venv_path = str(tmp_path / "env")
+
+    def fake_run(cmd, **kwargs):
+        os.makedirs(venv_path)
+        with open(os.path.join(venv_path, "pyvenv.cfg"), "w") as f:
+            f.write("home = /usr/bin\nversion = 3.11.9\n")
+        return subprocess.CompletedProcess(cmd, 0)
+
+    with (
+        patch("subprocess.run", side_effect=fake_run) as run_mock,
+        patch.object(seed_wheels, "start_refresh") as refresh_mock,
+    ):
+        new_venv = StdlibVEnvBackend().create(runtime, venv_path)
+
+    run_mock.assert_called_once()
+    assert run_mock.call_args.args[0][-1] == "--upgrade-deps"
+    refresh_mock.assert_called_once_with(runtime, new_venv.executable)
@@ -0,0 +1,103 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from ducktools.pytui.config import Config
+
+from benchmark_helpers import time_import
+
+
+IMPORT_CHECK = textwrap.dedent(
+    """
+    import os
+    import shutil
+    import sys
+
+    BLOCKED_EVENTS = {
+        "subprocess.Popen",
+        "os.system",
+        "os.posix_spawn",
+        "os.spawn",
+        "os.exec",
+        "os.startfile",
+    }
+
+    def audit_hook(event, args):
+        if event in BLOCKED_EVENTS:
+            raise RuntimeError(f"{event} called during import: {args!r}")
+
+    def blocked_path_search(*args, **kwargs):
+        raise RuntimeError(f"PATH searched during import: {args!r}")
+
+    shutil.which = blocked_path_search
+    os.get_exec_path = blocked_path_search
+    sys.addaudithook(audit_hook)
+
+    import MODULE
+    """
+)
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "ducktools.pytui.__main__",
+        "ducktools.pytui.config",
+        "ducktools.pytui.manifest",
+        "ducktools.pytui.runtime_installers",
+        "ducktools.pytui.ui",
+    ],
+)
+def test_import_has_no_subprocess_or_path_search(module):
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_CHECK.replace("MODULE", module)],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.benchmark
+def test_bench_import_time(benchmark_baseline):
+    benchmark_baseline("import_ui", time_import(5))
+
+
+@pytest.mark.benchmark
+def test_bench_config_from_file(benchmark_baseline, tmp_path):
+    config_file = str(tmp_path / "config.json")
+    Config(config_file=config_file).write_config()
+
+    timings = []
+    for _ in range(20):
+        start = time.perf_counter()
+        Config.from_file(config_file)
+        timings.append(time.perf_counter() - start)
+
+    benchmark_baseline("config_from_file", min(timings))
@@ -24,16 +24,19 @@ from __future__ import annotations
 
 import functools
 import json
+import os
 import sys
 import subprocess
+import time
 
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, PropertyMock
 
 import pytest
 
 from ducktools.pythonfinder import PythonInstall
-from ducktools.pytui.runtime_installers import uv
+from ducktools.pytui.runtime_installers import ListingIndex, uv
+from ducktools.pytui.runtime_installers.download_cache import get_cache_path, save_download_cache
 from ducktools.pytui.runtime_installers.uv import UVPythonListing, UVManager
 
 if sys.platform == "win32":
@@ -146,6 +149,7 @@ def test_fetch_installed(uv_executable, uv_python_dir):
             capture_output=True,
             text=True,
             check=True,
+            timeout=UVManager.query_timeout,
         )
 
     if sys.platform == "win32":
@@ -207,6 +211,7 @@ def test_fetch_downloads(uv_executable, uv_python_dir, uv_installed_pythons):
             capture_output=True,
             text=True,
             check=True,
+            timeout=UVManager.query_timeout,
         )
 
     if sys.platform == "win32":
@@ -434,3 +439,264 @@ def test_uninstall(uv_executable, uv_python_dir):
         )
 
         assert output == fake_out
+
+
+def _list_output():
+    cmd_output = MagicMock()
+    cmd_output.stdout = uv_download_json()
+    return cmd_output
+
+
+def test_download_cache_persists_between_managers(uv_executable, uv_python_dir):
+    with (
+        patch("subprocess.run", return_value=_list_output()) as fake_process,
+        patch.object(UVManager, "version", new_callable=PropertyMock, return_value="uv 0.6.0"),
+    ):
+        first = UVManager()._get_download_cache(cache_ttl=3600)
+        assert fake_process.call_count == 1
+
+        # A new process would have a new manager, the listing comes from disk
+        second = UVManager()._get_download_cache(cache_ttl=3600)
+        assert fake_process.call_count == 1
+        assert [v.key for v in second] == [v.key for v in first]
+
+        # The in memory cache is used by the same manager
+        manager = UVManager()
+        manager._get_download_cache(cache_ttl=3600)
+        manager._get_download_cache(cache_ttl=3600)
+        assert fake_process.call_count == 1
+
+        # Refresh ignores both caches
+        manager._get_download_cache(cache_ttl=3600, refresh=True)
+        assert fake_process.call_count == 2
+
+
+def test_download_cache_invalidation(uv_executable, uv_python_dir):
+    with (
+        patch("subprocess.run", return_value=_list_output()) as fake_process,
+        patch.object(UVManager, "version", new_callable=PropertyMock) as fake_version,
+    ):
+        fake_version.return_value = "uv 0.6.0"
+        UVManager()._get_download_cache(cache_ttl=3600)
+        assert fake_process.call_count == 1
+
+        # A different uv version doesn't use the cached listing
+        fake_version.return_value = "uv 0.7.0"
+        UVManager()._get_download_cache(cache_ttl=3600)
+        assert fake_process.call_count == 2
+
+        # Expired entries are not used
+        with patch("time.time", return_value=time.time() + 7200):
+            UVManager()._get_download_cache(cache_ttl=3600)
+        assert fake_process.call_count == 3
+
+        # Without a TTL the disk cache isn't used at all
+        UVManager()._get_download_cache()
+        assert fake_process.call_count == 4
+
+
+def _installed_queries(fake_process) -> int:
+    return sum("--only-installed" in c.args[0] for c in fake_process.call_args_list)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Non-windows version of test")
+def test_installed_snapshot_subprocess_count(uv_executable, uv_python_dir):
+    def fake_run(cmd, **kwargs):
+        output = MagicMock()
+        output.returncode = 0
+        output.stdout = uv_install_json() if "--only-installed" in cmd else uv_download_json()
+        return output
+
+    inst_313 = PythonInstall(
+        version=(3, 13, 2, "final", 0),
+        executable="/home/david/.local/share/uv/python/cpython-3.13.2-linux-x86_64-gnu/bin/python",
+        architecture="64bit",
+        implementation="cpython",
+        managed_by="Astral uv",
+        metadata={"freethreaded": False},
+        shadowed=False,
+    )
+
+    with (
+        patch("subprocess.run", side_effect=fake_run) as fake_process,
+        patch.object(UVManager, "_get_runtime_folder_mtime", return_value=1) as fake_mtime,
+    ):
+        manager = UVManager()
+
+        manager.fetch_installed()
+        manager.fetch_installed()
+        downloads = manager.fetch_downloads()
+        manager.find_matching_listing(inst_313)
+        assert _installed_queries(fake_process) == 1
+
+        # Installing invalidates the snapshot
+        downloads[0].install()
+        manager.fetch_downloads()
+        manager.fetch_installed()
+        assert _installed_queries(fake_process) == 2
+
+        # A change to the runtime folder made outside pytui also invalidates it
+        fake_mtime.return_value = 2
+        manager.fetch_installed()
+        manager.fetch_installed()
+        assert _installed_queries(fake_process) == 3
+
+        manager.fetch_installed(refresh=True)
+        assert _installed_queries(fake_process) == 4
+
+
+def test_installed_index(uv_installed_pythons):
+    with patch.object(UVManager, "fetch_installed") as fake_installed:
+        fake_installed.return_value = uv_installed_pythons
+
+        manager = UVManager()
+        index = manager.installed_index()
+
+        # Reused until the installed list changes
+        assert manager.installed_index() is index
+
+        listing = uv_installed_pythons[0]
+        assert index.get(listing.full_key) is listing
+        assert index.by_install_dir[listing.install_dir] is listing
+        assert listing in index.find_spec(*listing.spec_key)
+        assert index.find_spec("cpython", (1, 0, 0, "final", 0), "default", "x86_64") == []
+
+        fake_installed.return_value = uv_installed_pythons[1:]
+        new_index = manager.installed_index()
+        assert new_index is not index
+        assert new_index.get(listing.full_key) is None
+
+
+def test_batch_install_command(uv_executable, uv_python_dir):
+    manager = UVManager()
+    listings = [
+        UVPythonListing(
+            manager=manager,
+            key=f"cpython-{version}-linux-x86_64-gnu",
+            version=version,
+            version_parts={},
+            path=None,
+            symlink=None,
+            url=None,
+            os="linux",
+            variant="default",
+            implementation="cpython",
+            arch="x86_64",
+            libc="gnu",
+        )
+        for version in ("3.12.8", "3.13.1")
+    ]
+
+    assert manager.batch_install_command(listings) == [
+        "uv", "python", "install",
+        "cpython-3.12.8-linux-x86_64-gnu",
+        "cpython-3.13.1-linux-x86_64-gnu",
+        "--color", "never",
+        "--no-progress",
+    ]
+
+
+def test_uninstall_listings_batched(uv_executable, uv_installed_pythons):
+    manager = UVManager()
+    listings = uv_installed_pythons[:2]
+    for listing in listings:
+        listing.manager = manager
+
+    with (
+        patch("os.path.exists", return_value=True),
+        patch("subprocess.run") as fake_process,
+    ):
+        results = manager.uninstall_listings(listings)
+
+    fake_process.assert_called_once_with(
+        [
+            "uv", "python", "uninstall",
+            *(listing.key for listing in listings),
+            "--color", "never",
+            "--no-progress",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert results == [(listings, fake_process.return_value)]
+
+
+def test_listings_from_entries(uv_python_dir):
+    entries = json.loads((example_folder / "uv_install_list.json").read_text())
+    manager = UVManager()
+
+    listings = UVPythonListing.from_entries(manager, entries)
+
+    assert listings == [UVPythonListing.from_dict(manager, e) for e in entries]
+    # Compact slotted listings
+    assert not hasattr(listings[0], "__dict__")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Symlinks need extra privileges on Windows")
+def test_listing_key_from_resolved_path(tmp_path):
+    real_folder = tmp_path / "real"
+    runtime = real_folder / "cpython-3.13.1-linux-x86_64-gnu" / "bin"
+    runtime.mkdir(parents=True)
+    linked_folder = tmp_path / "linked"
+    linked_folder.symlink_to(real_folder, target_is_directory=True)
+
+    with patch.object(UVManager, "runtime_folder", new_callable=PropertyMock) as fake_folder:
+        fake_folder.return_value = str(linked_folder)
+        manager = UVManager()
+
+        listing = UVPythonListing.from_dict(
+            manager,
+            {
+                # Mismatched metadata key, the folder name is used
+                "key": "cpython-3.13.0-linux-x86_64-gnu",
+                "version": "3.13.1",
+                "version_parts": {},
+                "path": str(linked_folder / "cpython-3.13.1-linux-x86_64-gnu" / "bin" / "python"),
+                "symlink": None,
+                "url": None,
+                "os": "linux",
+                "variant": "default",
+                "implementation": "cpython",
+                "arch": "x86_64",
+                "libc": "gnu",
+                "extra_key": "ignored",
+            },
+        )
+
+    assert listing.key == "cpython-3.13.1-linux-x86_64-gnu"
+    assert listing.path == str(runtime / "python")
+
+
+def test_listing_index_filter(uv_python_dir):
+    entries = json.loads((example_folder / "uv_download_list.json").read_text())
+    listings = UVPythonListing.from_entries(UVManager(), entries)
+    index = ListingIndex(listings)
+
+    assert index.facet_values("implementation") == ["cpython", "pypy"]
+    assert index.facet_values("variant") == ["default", "freethreaded"]
+
+    assert index.filter() == listings
+    assert [v.version for v in index.filter(version_prefix="3.1", implementation="pypy")] == [
+        "3.11.11", "3.10.19"
+    ]
+    assert [v.version for v in index.filter(variant="freethreaded")] == ["3.14.0a5", "3.13.2"]
+    assert index.filter(version_prefix="3.13", variant="freethreaded", arch="aarch64") == []
+
+
+@pytest.mark.parametrize("corruption", ["not_json", "not_text", "bad_entries"])
+def test_corrupt_download_cache_is_a_miss(uv_executable, uv_python_dir, corruption):
+    with (
+        patch("subprocess.run", return_value=_list_output()) as fake_process,
+        patch.object(UVManager, "version", new_callable=PropertyMock, return_value="uv 0.6.0"),
+    ):
+        manager = UVManager()
+        if corruption == "bad_entries":
+            save_download_cache("uv", manager.executable, "uv 0.6.0", [1, 2])
+        else:
+            os.makedirs(os.path.dirname(get_cache_path("uv")), exist_ok=True)
+            with open(get_cache_path("uv"), "wb") as f:
+                f.write(b"{not json" if corruption == "not_json" else b"\xff\xfe\x00")
+
+        downloads = manager._get_download_cache(cache_ttl=3600)
+        assert fake_process.call_count == 1
+        assert downloads
@@ -0,0 +1,165 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import os.path
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from ducktools.pythonfinder import PythonInstall
+
+from ducktools.pytui.commands import create_venv
+from ducktools.pytui.runtime_installers.uv import UVManager
+from ducktools.pytui.venv_backends import get_backend
+from ducktools.pytui.venv_backends.stdlib import StdlibVEnvBackend
+from ducktools.pytui.venv_backends.uv import UVVEnvBackend
+
+
+def make_runtime(implementation="cpython", version=(3, 13, 2, "final", 0)):
+    return PythonInstall(
+        version=version,
+        executable="/usr/bin/python3",
+        architecture="64bit",
+        implementation=implementation,
+    )
+
+
+@pytest.fixture
+def uv_available():
+    with patch.object(UVManager, "executable", "/usr/bin/uv"):
+        yield
+
+
+@pytest.fixture
+def uv_missing():
+    with patch.object(UVManager, "executable", None):
+        yield
+
+
+def test_default_backend_is_venv(uv_available):
+    backend = get_backend("venv", make_runtime())
+    assert isinstance(backend, StdlibVEnvBackend)
+
+
+def test_auto_backend(uv_available):
+    backend = get_backend("auto", make_runtime())
+    assert backend == UVVEnvBackend("/usr/bin/uv")
+
+
+@pytest.mark.parametrize("name", ["auto", "uv"])
+def test_uv_backend_fallback_without_uv(uv_missing, name):
+    backend = get_backend(name, make_runtime())
+    assert isinstance(backend, StdlibVEnvBackend)
+
+
+@pytest.mark.parametrize(
+    "runtime, include_pip, latest_pip",
+    [
+        (make_runtime(implementation="graalpy"), True, True),
+        (make_runtime(version=(3, 7, 17, "final", 0)), False, True),
+        (make_runtime(), True, False),
+    ]
+)
+def test_uv_backend_unsupported_falls_back(uv_available, runtime, include_pip, latest_pip):
+    backend = get_backend("uv", runtime, include_pip, latest_pip)
+    assert isinstance(backend, StdlibVEnvBackend)
+
+
+def test_stdlib_commands():
+    backend = StdlibVEnvBackend()
+    runtime = make_runtime()
+
+    assert backend.get_command(runtime, ".venv") == [
+        "/usr/bin/python3", "-m", "venv", ".venv", "--upgrade-deps"
+    ]
+    assert backend.get_command(runtime, ".venv", include_pip=False) == [
+        "/usr/bin/python3", "-m", "venv", ".venv", "--without-pip"
+    ]
+    assert backend.get_command(runtime, ".venv", latest_pip=False) == [
+        "/usr/bin/python3", "-m", "venv", ".venv"
+    ]
+
+    graalpy = make_runtime(implementation="graalpy")
+    assert backend.get_command(graalpy, ".venv", include_pip=False) == [
+        "/usr/bin/python3", "-m", "venv", ".venv"
+    ]
+
+
+def test_uv_commands():
+    backend = UVVEnvBackend("/usr/bin/uv")
+    runtime = make_runtime()
+
+    base_cmd = [
+        "/usr/bin/uv", "venv", ".venv",
+        "--python", "/usr/bin/python3",
+        "--color", "never",
+        "--quiet",
+    ]
+
+    assert backend.get_command(runtime, ".venv") == [*base_cmd, "--seed"]
+    assert backend.get_command(runtime, ".venv", include_pip=False) == base_cmd
+
+
+def test_create_venv_uses_backend(tmp_path, uv_available):
+    venv_path = str(tmp_path / ".venv")
+
+    with (
+        patch("subprocess.run") as run_mock,
+        patch("ducktools.pythonfinder.venv.PythonVEnv.from_cfg") as from_cfg_mock,
+    ):
+        result = create_venv(make_runtime(), venv_path, backend="uv")
+
+    run_mock.assert_called_once_with(
+        UVVEnvBackend("/usr/bin/uv").get_command(make_runtime(), venv_path),
+        capture_output=True,
+        check=True,
+    )
+    from_cfg_mock.assert_called_once_with(
+        os.path.join(os.path.realpath(venv_path), "pyvenv.cfg")
+    )
+    assert result is from_cfg_mock.return_value
+
+
+def test_create_venv_existing_folder(tmp_path):
+    with pytest.raises(FileExistsError):
+        create_venv(make_runtime(), str(tmp_path))
+
+
+def test_create_venv_stdlib(tmp_path):
+    runtime = make_runtime(version=sys.version_info)
+    runtime.executable = sys.executable
+    venv_path = str(tmp_path / "env")
+
+    venv = create_venv(runtime, venv_path, include_pip=False)
+
+    assert os.path.realpath(venv.folder) == os.path.realpath(venv_path)
+    assert venv.version[:2] == sys.version_info[:2]
+
+
+def test_create_venv_process_error(tmp_path):
+    with patch("subprocess.run", side_effect=subprocess.CalledProcessError(1, "venv")):
+        with pytest.raises(subprocess.CalledProcessError):
+            create_venv(make_runtime(), str(tmp_path / "env"))
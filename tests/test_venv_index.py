@@ -0,0 +1,228 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import itertools
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ducktools.pythonfinder.venv import PythonVEnv, list_python_venvs
+
+from ducktools.pytui.discovery import venv_index
+from ducktools.pytui.discovery.venv_index import (
+    ScanLimits,
+    VEnvIndex,
+    load_cached_venvs,
+    scan_venvs,
+)
+
+
+@pytest.fixture
+def venv_tree(tmp_path, make_venv):
+    base = tmp_path / "root" / "project"
+    make_venv(base / ".venv")
+    make_venv(base / "sub" / "env")
+    make_venv(base / "sub" / "deeper" / "nested" / "env2", version="3.13.0")
+    make_venv(tmp_path / "root" / "sibling_env")
+    (base / "sub" / "not_a_venv").mkdir()
+    (base / "broken").mkdir()
+    (base / "broken" / "pyvenv.cfg").write_text("invalid = config\n")
+    return base
+
+
+def folders(venvs):
+    return sorted(v.folder for v in venvs)
+
+
+@pytest.mark.parametrize(
+    "recursive, search_parent_folders",
+    [(False, False), (False, True), (True, False), (True, True)],
+)
+def test_scan_matches_pythonfinder(venv_tree, recursive, search_parent_folders):
+    expected = list_python_venvs(
+        base_dir=venv_tree,
+        recursive=recursive,
+        search_parent_folders=search_parent_folders,
+    )
+    result = scan_venvs(
+        str(venv_tree),
+        recursive=recursive,
+        search_parent_folders=search_parent_folders,
+    )
+    assert folders(result) == folders(expected)
+    assert sorted(result, key=lambda v: v.folder) == sorted(expected, key=lambda v: v.folder)
+
+
+def test_cached_venvs(venv_tree):
+    assert load_cached_venvs(str(venv_tree), recursive=True) == []
+
+    venvs = scan_venvs(str(venv_tree), recursive=True)
+    assert folders(load_cached_venvs(str(venv_tree), recursive=True)) == folders(venvs)
+
+    # Each search mode has its own index
+    assert load_cached_venvs(str(venv_tree), recursive=False) == []
+
+
+def test_unchanged_rescan_reuses_index(venv_tree):
+    first = scan_venvs(str(venv_tree), recursive=True)
+
+    with (
+        patch.object(venv_index.os, "scandir", wraps=os.scandir) as fake_scandir,
+        patch.object(PythonVEnv, "from_cfg") as fake_from_cfg,
+    ):
+        second = scan_venvs(str(venv_tree), recursive=True)
+
+        fake_scandir.assert_not_called()
+        fake_from_cfg.assert_not_called()
+
+    assert folders(second) == folders(first)
+
+
+def test_rescan_detects_changes(venv_tree):
+    scan_venvs(str(venv_tree), recursive=True)
+
+    # New venv in a folder that already existed
+    (venv_tree / "sub" / "not_a_venv" / "pyvenv.cfg").write_text(
+        "home = /usr/bin\nversion = 3.11.2\n"
+    )
+    # Changed config in an existing venv
+    cfg = venv_tree / ".venv" / "pyvenv.cfg"
+    cfg.write_text("home = /usr/bin\nversion = 3.14.0\n")
+    stat = cfg.stat()
+    os.utime(cfg, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    # Removed venv
+    (venv_tree / "sub" / "env" / "pyvenv.cfg").unlink()
+
+    venvs = {v.folder: v for v in scan_venvs(str(venv_tree), recursive=True)}
+
+    assert str(venv_tree / "sub" / "not_a_venv") in venvs
+    assert str(venv_tree / "sub" / "env") not in venvs
+    assert venvs[str(venv_tree / ".venv")].version[:2] == (3, 14)
+
+
+def test_index_ignores_mismatched_base(venv_tree, tmp_path):
+    index = VEnvIndex.from_file(str(venv_tree), recursive=True)
+    list(index.scan())
+    index.save()
+    assert VEnvIndex.from_file(str(venv_tree), recursive=True).venvs
+
+    # Simulate a hash collision with another folder
+    with patch.object(venv_index, "get_index_path", return_value=index.index_path):
+        collided = VEnvIndex.from_file(str(tmp_path), recursive=True)
+    assert collided.venvs == {}
+
+
+@pytest.mark.parametrize(
+    "max_depth, expected",
+    [
+        (1, [".venv"]),
+        (2, [".venv", "sub/env"]),
+        (None, [".venv", "sub/deeper/nested/env2", "sub/env"]),
+    ],
+)
+def test_scan_max_depth(venv_tree, max_depth, expected):
+    limits = ScanLimits(max_depth=max_depth)
+    venvs = scan_venvs(str(venv_tree), recursive=True, limits=limits)
+
+    assert folders(venvs) == [str(venv_tree / p) for p in expected]
+    assert not limits.incomplete
+
+
+def test_cancelled_scan_is_incomplete(venv_tree):
+    scan_venvs(str(venv_tree), recursive=True)
+
+    limits = ScanLimits()
+    limits.cancel()
+    assert scan_venvs(str(venv_tree), recursive=True, limits=limits) == []
+    assert limits.incomplete
+
+    # Entries the cancelled scan didn't reach are kept in the index
+    assert len(load_cached_venvs(str(venv_tree), recursive=True)) == 3
+
+
+def test_scan_time_limit(venv_tree):
+    limits = ScanLimits(time_limit=10.0)
+    # The deadline is set at the start of the scan, and then has passed
+    with patch.object(venv_index.time, "monotonic", side_effect=itertools.chain([0.0], itertools.repeat(20.0))):
+        venvs = scan_venvs(str(venv_tree), recursive=True, limits=limits)
+
+    assert venvs == []
+    assert limits.incomplete
+
+
+def test_excluded_folders_are_not_descended(venv_tree, make_venv):
+    make_venv(venv_tree / "node_modules" / "pkg" / "env")
+    # A venv matching an exclude pattern is still found
+    make_venv(venv_tree / "build")
+
+    limits = ScanLimits(exclude=["node_modules", "build", "deep*"])
+    venvs = scan_venvs(str(venv_tree), recursive=True, limits=limits)
+
+    assert folders(venvs) == [str(venv_tree / p) for p in [".venv", "build", "sub/env"]]
+
+
+def test_gitignore_folders_are_not_descended(venv_tree, make_venv):
+    (venv_tree / ".gitignore").write_text("# comment\nnot_a_venv/\n/sub/deeper\n!keep\n")
+    make_venv(venv_tree / "sub" / "not_a_venv" / "env")
+
+    with_gitignore = scan_venvs(str(venv_tree), recursive=True, limits=ScanLimits(use_gitignore=True))
+    assert folders(with_gitignore) == [str(venv_tree / p) for p in [".venv", "sub/env"]]
+
+    without_gitignore = scan_venvs(str(venv_tree), recursive=True)
+    assert str(venv_tree / "sub" / "not_a_venv" / "env") in folders(without_gitignore)
+
+
+def test_gitignore_wildcards_stay_in_one_folder(venv_tree, make_venv):
+    # "sub/*" only covers direct children, "**/nested" matches at any depth
+    (venv_tree / ".gitignore").write_text("sub/*/x\n**/nested\n")
+    make_venv(venv_tree / "sub" / "deeper" / "x" / "env")
+    make_venv(venv_tree / "sub" / "deeper" / "other" / "x" / "env")
+
+    venvs = scan_venvs(str(venv_tree), recursive=True, limits=ScanLimits(use_gitignore=True))
+    found = folders(venvs)
+
+    assert str(venv_tree / "sub" / "deeper" / "x" / "env") not in found
+    assert str(venv_tree / "sub" / "deeper" / "other" / "x" / "env") in found
+    assert str(venv_tree / "sub" / "deeper" / "nested" / "env2") not in found
+
+
+def test_venv_contents_are_not_searched(venv_tree, make_venv):
+    make_venv(venv_tree / ".venv" / "lib" / "inner_env")
+
+    venvs = scan_venvs(str(venv_tree), recursive=True)
+    assert str(venv_tree / ".venv" / "lib" / "inner_env") not in folders(venvs)
+
+
+def test_parallel_matches_serial(venv_tree, make_venv):
+    for i in range(20):
+        make_venv(venv_tree / f"group_{i % 4}" / f"project_{i}" / ".venv")
+
+    serial = scan_venvs(str(venv_tree), recursive=True, limits=ScanLimits(workers=1))
+    parallel = scan_venvs(str(venv_tree), recursive=True, search_parent_folders=True, limits=ScanLimits(workers=4))
+
+    assert len(serial) == 23
+    assert set(folders(serial)) <= set(folders(parallel))
+    # Parent folders are still searched after the parallel search
+    assert str(venv_tree.parent / "sibling_env") in folders(parallel)
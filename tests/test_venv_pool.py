@@ -0,0 +1,152 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import json
+import os
+import os.path
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from ducktools.pytui.venv_backends import pool, templates
+
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="The pool is not used on Windows")
+
+
+@pytest.fixture
+def pool_folder(tmp_path):
+    return str(tmp_path / "pool")
+
+
+def pool_key(backend, runtime):
+    return templates.get_template_key(backend, runtime, True, True)
+
+
+def test_take_from_empty_pool(tmp_path, pool_folder, fake_venv_runtime, fake_venv_backend):
+    venv = pool.take_venv(
+        fake_venv_backend, fake_venv_runtime, str(tmp_path / "env"), pool_folder=pool_folder
+    )
+    assert venv is None
+    assert not os.path.exists(tmp_path / "env")
+
+
+def test_refill_and_take(tmp_path, pool_folder, fake_venv_runtime, fake_venv_backend):
+    built = pool.refill(fake_venv_backend, fake_venv_runtime, size=2, pool_folder=pool_folder)
+    assert built == 2
+
+    # Already full
+    assert pool.refill(fake_venv_backend, fake_venv_runtime, size=2, pool_folder=pool_folder) == 0
+
+    venv_path = str(tmp_path / "venvs" / "my_env")
+    venv = pool.take_venv(
+        fake_venv_backend, fake_venv_runtime, venv_path, pool_folder=pool_folder
+    )
+
+    assert venv.folder == venv_path
+    assert venv.version == (3, 13, 2, "final", 0)
+
+    # One pooled venv was moved into place
+    assert sum(os.path.exists(p) for p in fake_venv_backend.created) == 1
+
+    with open(os.path.join(venv_path, "bin", "activate")) as f:
+        assert f.read() == f"VIRTUAL_ENV={venv_path}\nVIRTUAL_ENV_PROMPT=my_env\n"
+    with open(os.path.join(venv_path, "pyvenv.cfg")) as f:
+        assert f"-m venv {venv_path}\n" in f.read()
+
+    # One left and the refill only builds one more
+    assert pool.refill(fake_venv_backend, fake_venv_runtime, size=2, pool_folder=pool_folder) == 1
+
+
+def test_stale_venvs_discarded(tmp_path, pool_folder, fake_venv_runtime, fake_venv_backend):
+    pool.refill(fake_venv_backend, fake_venv_runtime, size=1, pool_folder=pool_folder)
+    pooled_path = fake_venv_backend.created[0]
+
+    with open(f"{pooled_path}.json", "w") as f:
+        json.dump({"version": [3, 12, 0, "final", 0], "created": 0}, f)
+
+    venv = pool.take_venv(
+        fake_venv_backend, fake_venv_runtime, str(tmp_path / "env"), pool_folder=pool_folder
+    )
+
+    assert venv is None
+    assert not os.path.exists(pooled_path)
+
+
+def test_take_falls_back_across_filesystems(tmp_path, pool_folder, fake_venv_runtime, fake_venv_backend):
+    pool.refill(fake_venv_backend, fake_venv_runtime, size=1, pool_folder=pool_folder)
+
+    with patch("os.rename", side_effect=OSError(18, "Invalid cross-device link")):
+        venv = pool.take_venv(
+            fake_venv_backend, fake_venv_runtime, str(tmp_path / "env"), pool_folder=pool_folder
+        )
+
+    assert venv is None
+    # The pooled venv is still available
+    assert os.path.exists(fake_venv_backend.created[0])
+
+
+def test_refill_failure_cleans_up(pool_folder, fake_venv_runtime, fake_venv_backend):
+    def failing_create(python_runtime, venv_path, include_pip=True, latest_pip=True):
+        os.makedirs(venv_path)
+        raise OSError("Build failed")
+
+    with patch.object(type(fake_venv_backend), "create", side_effect=failing_create):
+        with pytest.raises(OSError):
+            pool.refill(fake_venv_backend, fake_venv_runtime, size=1, pool_folder=pool_folder)
+
+    key_folder = os.path.join(pool_folder, pool_key(fake_venv_backend, fake_venv_runtime))
+    assert os.listdir(key_folder) == []
+
+
+def test_prune_old_pools(pool_folder, fake_venv_runtime, fake_venv_backend):
+    keys = []
+    for i in range(pool.POOL_MAX_RUNTIMES + 1):
+        fake_venv_runtime.executable = f"/usr/bin/python3.{i}"
+        keys.append(pool_key(fake_venv_backend, fake_venv_runtime))
+        pool.refill(fake_venv_backend, fake_venv_runtime, size=1, pool_folder=pool_folder)
+
+    assert not os.path.exists(os.path.join(pool_folder, keys[0]))
+    for key in keys[1:]:
+        assert os.path.exists(os.path.join(pool_folder, key))
+
+
+def test_create_venv_uses_pool(tmp_path, fake_venv_runtime, fake_venv_backend):
+    from ducktools.pytui.commands import create_venv
+
+    pool.refill(fake_venv_backend, fake_venv_runtime, size=1)
+    venv_path = str(tmp_path / "env")
+
+    with (
+        patch("ducktools.pytui.commands.get_backend", return_value=fake_venv_backend),
+        patch("ducktools.pytui.commands.start_refill") as refill_mock,
+    ):
+        venv = create_venv(fake_venv_runtime, venv_path, pool_size=1)
+
+    assert venv.folder == venv_path
+    assert len(fake_venv_backend.created) == 1
+    refill_mock.assert_called_once_with(
+        fake_venv_backend, fake_venv_runtime, True, True, 1, False
+    )
@@ -0,0 +1,232 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import json
+import os
+import os.path
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from ducktools.pytui.venv_backends import templates
+
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Templates are not used on Windows")
+
+
+def test_clone_rewrites_paths(tmp_path, fake_venv_runtime, fake_venv_backend):
+    template_path = str(tmp_path / "template-1234")
+    fake_venv_backend.create(fake_venv_runtime, template_path)
+
+    venv_path = str(tmp_path / "project" / ".venv")
+    os.makedirs(os.path.dirname(venv_path))
+    templates.clone_venv(template_path, venv_path)
+
+    with open(os.path.join(venv_path, "pyvenv.cfg")) as f:
+        assert f"-m venv {venv_path}\n" in f.read()
+
+    with open(os.path.join(venv_path, "bin", "activate")) as f:
+        assert f.read() == f"VIRTUAL_ENV={venv_path}\nVIRTUAL_ENV_PROMPT=.venv\n"
+
+    with open(os.path.join(venv_path, "bin", "pip")) as f:
+        assert f.readline() == f"#!{venv_path}/bin/python\n"
+
+    assert os.readlink(os.path.join(venv_path, "bin", "python")) == "/usr/bin/python3"
+
+    # The template itself is untouched
+    with open(os.path.join(template_path, "bin", "activate")) as f:
+        assert template_path in f.read()
+
+
+def test_clone_fixes_shebang_with_spaces(tmp_path, fake_venv_runtime, fake_venv_backend):
+    template_path = str(tmp_path / "template-1234")
+    fake_venv_backend.create(fake_venv_runtime, template_path)
+
+    venv_path = str(tmp_path / "my env")
+    templates.clone_venv(template_path, venv_path)
+
+    with open(os.path.join(venv_path, "bin", "pip")) as f:
+        assert f.read() == (
+            "#!/bin/sh\n"
+            f"'''exec' \"{venv_path}/bin/python\" \"$0\" \"$@\"\n"
+            "' '''\n"
+            "import pip\n"
+        )
+
+
+def test_fix_shebang_long_path():
+    interpreter = b"/" + b"x" * 130 + b"/bin/python"
+    script = b"#!" + interpreter + b"\nimport pip\n"
+
+    assert templates.fix_shebang(script).startswith(b"#!/bin/sh\n'''exec' \"" + interpreter)
+    assert templates.fix_shebang(b"#!/usr/bin/python\n") == b"#!/usr/bin/python\n"
+
+
+def test_file_cloner_fallback(tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_text("data")
+    os.utime(src, (1_000_000, 1_000_000))
+
+    cloner = templates.FileCloner(reflink=False, copy_range=False)
+    cloner(str(src), str(tmp_path / "dst.txt"))
+
+    assert (tmp_path / "dst.txt").read_text() == "data"
+    assert os.stat(tmp_path / "dst.txt").st_mtime == 1_000_000
+
+
+def test_template_reused(tmp_path, fake_venv_runtime, fake_venv_backend):
+    template_folder = str(tmp_path / "templates")
+
+    first = templates.create_from_template(
+        fake_venv_backend, fake_venv_runtime, str(tmp_path / "a"), template_folder=template_folder
+    )
+    second = templates.create_from_template(
+        fake_venv_backend, fake_venv_runtime, str(tmp_path / "b"), template_folder=template_folder
+    )
+
+    assert len(fake_venv_backend.created) == 1
+    assert os.path.dirname(fake_venv_backend.created[0]) == template_folder
+    assert first.folder == str(tmp_path / "a")
+    assert second.folder == str(tmp_path / "b")
+    assert second.version == (3, 13, 2, "final", 0)
+
+
+def test_template_rebuilt_when_stale(tmp_path, fake_venv_runtime, fake_venv_backend):
+    template_folder = str(tmp_path / "templates")
+    templates.create_from_template(
+        fake_venv_backend, fake_venv_runtime, str(tmp_path / "a"), template_folder=template_folder
+    )
+    old_template = fake_venv_backend.created[0]
+
+    key = templates.get_template_key(fake_venv_backend, fake_venv_runtime, True, True)
+    metadata_path = os.path.join(template_folder, f"{key}.json")
+    with open(metadata_path) as f:
+        metadata = json.load(f)
+    metadata["created"] -= templates.TEMPLATE_MAX_AGE + 1
+    with open(metadata_path, "w") as f:
+        json.dump(metadata, f)
+
+    templates.create_from_template(
+        fake_venv_backend, fake_venv_runtime, str(tmp_path / "b"), template_folder=template_folder
+    )
+
+    assert len(fake_venv_backend.created) == 2
+    assert not os.path.exists(old_template)
+    assert os.path.exists(fake_venv_backend.created[1])
+
+
+def test_bundled_pip_template_does_not_expire(tmp_path, fake_venv_runtime, fake_venv_backend):
+    template_folder = str(tmp_path / "templates")
+
+    with patch.object(templates, "TEMPLATE_MAX_AGE", -1):
+        for name in ["a", "b"]:
+            templates.create_from_template(
+                fake_venv_backend, fake_venv_runtime, str(tmp_path / name),
+                latest_pip=False, template_folder=template_folder,
+            )
+
+    assert len(fake_venv_backend.created) == 1
+
+
+def test_concurrent_builds_share_one_template(tmp_path, fake_venv_runtime, fake_venv_backend):
+    template_folder = str(tmp_path / "templates")
+    original_create = fake_venv_backend.create
+
+    def slow_create(*args, **kwargs):
+        time.sleep(0.1)
+        return original_create(*args, **kwargs)
+
+    with (
+        patch.object(type(fake_venv_backend), "create", side_effect=slow_create),
+        ThreadPoolExecutor(max_workers=4) as executor,
+    ):
+        paths = list(executor.map(
+            lambda _: templates.prepare_template(
+                fake_venv_backend, fake_venv_runtime, template_folder=template_folder
+            ),
+            range(4),
+        ))
+
+    assert len(fake_venv_backend.created) == 1
+    assert set(paths) == {fake_venv_backend.created[0]}
+
+
+def test_build_removes_orphaned_templates(tmp_path, fake_venv_runtime, fake_venv_backend):
+    template_folder = tmp_path / "templates"
+    key = templates.get_template_key(fake_venv_backend, fake_venv_runtime, True, True)
+    # Left behind by an interrupted build
+    (template_folder / f"{key}-deadbeef").mkdir(parents=True)
+    (template_folder / "otherkey-deadbeef").mkdir()
+
+    template_path = templates.prepare_template(
+        fake_venv_backend, fake_venv_runtime, template_folder=str(template_folder)
+    )
+
+    assert sorted(p.name for p in template_folder.iterdir() if p.is_dir()) == sorted(
+        [os.path.basename(template_path), "otherkey-deadbeef"]
+    )
+
+
+def test_clone_failure_creates_directly(tmp_path, fake_venv_runtime, fake_venv_backend):
+    template_folder = str(tmp_path / "templates")
+    venv_path = str(tmp_path / "a")
+
+    with patch.object(templates, "clone_venv", side_effect=OSError):
+        templates.create_from_template(
+            fake_venv_backend, fake_venv_runtime, venv_path, template_folder=template_folder
+        )
+
+    assert fake_venv_backend.created[-1] == venv_path
+
+
+def test_template_build_failure_creates_directly(tmp_path, fake_venv_runtime, fake_venv_backend):
+    # The template folder can't be created under a file
+    (tmp_path / "templates").write_text("")
+    template_folder = str(tmp_path / "templates" / "inner")
+    venv_path = str(tmp_path / "a")
+
+    venv = templates.create_from_template(
+        fake_venv_backend, fake_venv_runtime, venv_path, template_folder=template_folder
+    )
+
+    assert fake_venv_backend.created == [venv_path]
+    assert venv.folder == venv_path
+
+
+def test_clone_existing_folder_untouched(tmp_path, fake_venv_runtime, fake_venv_backend):
+    template_path = str(tmp_path / "template-1234")
+    fake_venv_backend.create(fake_venv_runtime, template_path)
+
+    existing = tmp_path / "existing"
+    existing.mkdir()
+    (existing / "keep.txt").write_text("data")
+
+    with pytest.raises(FileExistsError):
+        templates.clone_venv(template_path, str(existing))
+
+    assert (existing / "keep.txt").read_text() == "data"
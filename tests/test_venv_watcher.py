@@ -0,0 +1,107 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import queue
+import shutil
+import sys
+
+import pytest
+
+from ducktools.pytui.discovery.watcher import VEnvWatcher, watched_parent_folders
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(False, marks=pytest.mark.skipif(sys.platform != "linux", reason="inotify is Linux only")),
+        True,
+    ],
+    ids=["inotify", "polling"],
+)
+def watcher_changes(request, tmp_path, make_venv):
+    make_venv(tmp_path / "existing_env")
+    (tmp_path / "not_a_venv").mkdir()
+
+    changes = queue.Queue()
+    watcher = VEnvWatcher(
+        [str(tmp_path)],
+        lambda folder, venv: changes.put((folder, venv)),
+        use_polling=request.param,
+        poll_interval=0.05,
+    )
+    watcher.start()
+    yield changes
+    watcher.stop()
+
+
+def test_watcher_sees_new_venv(tmp_path, watcher_changes, make_venv):
+    make_venv(tmp_path / "new_env", version="3.13.1")
+
+    folder, venv = watcher_changes.get(timeout=5)
+    assert folder == str(tmp_path / "new_env")
+    assert venv.version[:2] == (3, 13)
+
+
+def test_watcher_sees_venv_in_existing_folder(tmp_path, watcher_changes):
+    (tmp_path / "not_a_venv" / "pyvenv.cfg").write_text("home = /usr/bin\nversion = 3.11.1\n")
+
+    folder, venv = watcher_changes.get(timeout=5)
+    assert folder == str(tmp_path / "not_a_venv")
+    assert venv is not None
+
+
+def test_watcher_sees_removed_venv(tmp_path, watcher_changes):
+    shutil.rmtree(tmp_path / "existing_env")
+
+    folder, venv = watcher_changes.get(timeout=5)
+    assert folder == str(tmp_path / "existing_env")
+    assert venv is None
+
+    # Only the venv change is reported
+    with pytest.raises(queue.Empty):
+        watcher_changes.get(timeout=0.5)
+
+
+def test_large_folders_only_watch_venvs(tmp_path, make_venv):
+    make_venv(tmp_path / "existing_env")
+    for i in range(3):
+        (tmp_path / f"folder_{i}").mkdir()
+
+    watcher = VEnvWatcher([str(tmp_path)], lambda folder, venv: None, use_polling=True, max_subfolders=2)
+    watcher.start()
+    try:
+        watched = set(watcher._backend.mtimes)
+    finally:
+        watcher.stop()
+
+    assert watched == {str(tmp_path), str(tmp_path / "existing_env")}
+
+
+def test_watched_parents_skip_root_and_above_home(tmp_path, monkeypatch):
+    home = tmp_path / "home" / "user"
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+
+    parents = watched_parent_folders(str(home / "dev" / "project"))
+
+    assert parents == [str(home / "dev"), str(home)]
@@ -0,0 +1,91 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import importlib.util
+import os
+import py_compile
+import zipfile
+
+from ducktools.pytui import _zipapp
+
+
+def make_archive(tmp_path):
+    src = tmp_path / "src"
+    (src / "pkg").mkdir(parents=True)
+    module = src / "pkg" / "mod.py"
+    module.write_text("VALUE = 42\n")
+    py_compile.compile(
+        str(module),
+        cfile=str(module) + "c",
+        invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+    )
+
+    archive_path = tmp_path / "app.pyz"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.write(module, "pkg/mod.py")
+        archive.write(str(module) + "c", "pkg/mod.pyc")
+    return str(archive_path)
+
+
+def test_extract_enabled(monkeypatch):
+    monkeypatch.delenv(_zipapp.EXTRACT_ENV_VAR, raising=False)
+    assert _zipapp.extract_enabled() is False
+    assert _zipapp.extract_enabled(default=True) is True
+
+    monkeypatch.setenv(_zipapp.EXTRACT_ENV_VAR, "0")
+    assert _zipapp.extract_enabled(default=True) is False
+
+    monkeypatch.setenv(_zipapp.EXTRACT_ENV_VAR, "1")
+    assert _zipapp.extract_enabled() is True
+
+
+def test_extract_archive(tmp_path):
+    archive_path = make_archive(tmp_path)
+    cache_folder = str(tmp_path / "cache")
+
+    dest = _zipapp.get_extract_folder(archive_path, base_folder=cache_folder)
+    assert _zipapp.extract_archive(archive_path, dest) == dest
+
+    source = os.path.join(dest, "pkg", "mod.py")
+    assert os.path.exists(source)
+    assert os.path.exists(os.path.join(dest, _zipapp.COMPLETE_MARKER))
+
+    # The legacy pyc is moved into __pycache__ for this interpreter
+    assert not os.path.exists(source + "c")
+    assert os.path.exists(importlib.util.cache_from_source(source))
+
+    # A second extraction reuses the existing folder
+    os.remove(source)
+    _zipapp.extract_archive(archive_path, dest)
+    assert not os.path.exists(source)
+
+
+def test_extract_folder_changes_with_archive(tmp_path):
+    archive_path = make_archive(tmp_path)
+    first = _zipapp.get_extract_folder(archive_path, base_folder=str(tmp_path))
+
+    with zipfile.ZipFile(archive_path, "a") as archive:
+        archive.writestr("pkg/extra.py", "")
+
+    assert _zipapp.get_extract_folder(archive_path, base_folder=str(tmp_path)) != first
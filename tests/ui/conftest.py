@@ -65,6 +65,13 @@ async def global_venvs() -> list[PythonVEnv]:
     return venvs
 
 
+@fixture(autouse=True)
+async def patch_runtime_cache_key():
+    with patch("ducktools.pytui.ui.get_runtime_cache_key") as mock_key:
+        mock_key.return_value = {"path": "", "uv_python_dir": None, "folder_mtimes": {}}
+        yield mock_key
+
+
 @fixture(autouse=True)
 async def patch_list_installs(runtimes):
     with patch("ducktools.pytui.ui.list_installs_deduped") as mock_deduped:
@@ -74,13 +81,21 @@ async def patch_list_installs(runtimes):
 
 @fixture(autouse=True)
 async def patch_list_venvs(local_venvs, global_venvs, patched_config):
-    def get_venv(base_dir=None, recursive=False, search_parent_folders=False):
+    def get_venv(base_dir=None, recursive=False, search_parent_folders=False, limits=None):
         if base_dir == patched_config.global_venv_folder:
             return global_venvs
         else:
             return local_venvs
 
 
-    with patch("ducktools.pytui.ui.list_python_venvs") as venv_mock:
+    with patch("ducktools.pytui.ui.iter_venvs") as venv_mock:
         venv_mock.side_effect = get_venv
         yield venv_mock
+
+
+@fixture(autouse=True)
+async def patch_fetch_downloads():
+    # Don't query real runtime managers from the install screen or prefetch
+    with patch("ducktools.pytui.ui.fetch_downloads") as mock_downloads:
+        mock_downloads.return_value = []
+        yield mock_downloads
@@ -34,3 +34,30 @@ async def test_runtime_table(runtimes, patch_list_installs):
         ]
         expected.sort(key=itemgetter(3))
         assert row_data == expected
+
+
+@patch("ducktools.pytui.ui.HOME", "/home/ducksual")
+async def test_runtime_table_from_cache(runtimes, patch_list_installs, patch_runtime_cache_key):
+    # Cache holds an outdated list, one runtime is missing and there is an extra removed runtime
+    removed = ui.PythonInstall.from_json(
+        version=[3, 9, 0, "final", 0],
+        executable="/home/ducksual/.pyenv/versions/3.9.0/bin/python",
+        architecture="64bit",
+        implementation="cpython",
+        metadata={},
+    )
+    cached = [*runtimes[1:], removed]
+    ui.save_cached_installs(cached, patch_runtime_cache_key.return_value)
+
+    app = ManagerApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+
+        table = app._runtime_table
+        rows = [table.get_row_at(i) for i in range(table.row_count)]
+
+        # Table matches discovery order after revalidating
+        assert rows == [list(table._runtime_row(py)) for py in runtimes]
+
+    # Cache updated with the fresh results
+    assert ui.load_cached_installs(patch_runtime_cache_key.return_value) == runtimes
@@ -0,0 +1,151 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import subprocess
+
+from unittest.mock import MagicMock, patch
+
+from ducktools.pytui.ui import ManagerApp, RuntimeTable
+
+
+async def test_uninstall_marked_runtimes(runtimes, patch_list_installs):
+    manager = MagicMock()
+
+    def fake_listing(install):
+        listing = MagicMock()
+        listing.key = install.executable
+        listing.manager = manager
+        return listing
+
+    def uninstall_listings(listings):
+        return [(listings, subprocess.CompletedProcess([], returncode=0, stdout="", stderr=""))]
+
+    manager.uninstall_listings.side_effect = uninstall_listings
+
+    with (
+        patch("ducktools.pytui.ui.get_managers", return_value=[manager]),
+        patch("ducktools.pytui.ui.find_matching_listings") as fake_find,
+    ):
+        fake_find.side_effect = lambda installs, on_error=None: [fake_listing(i) for i in installs]
+
+        app = ManagerApp()
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            table = app._runtime_table
+            app.set_focus(table)
+            table.move_cursor(row=0)
+            await pilot.pause()
+
+            await pilot.press("space", "space")
+            assert len(table.marked) == 2
+            assert table.get_row_at(0)[0].startswith(table.MARK)
+
+            marked = table.marked_runtimes
+            reloads = patch_list_installs.call_count
+            await pilot.press("delete")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            # Both runtimes are found together and uninstalled with one manager call
+            fake_find.assert_called_once()
+            assert fake_find.call_args.args[0] == marked
+            manager.uninstall_listings.assert_called_once()
+            assert len(manager.uninstall_listings.call_args.args[0]) == 2
+
+            # A single reload for the batch
+            assert patch_list_installs.call_count == reloads + 1
+            assert not table.marked
+
+
+async def test_marks_kept_when_rows_update(runtimes, patch_list_installs):
+    with patch("ducktools.pytui.ui.get_managers", return_value=[MagicMock()]):
+        app = ManagerApp()
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            table = app._runtime_table
+            app.set_focus(table)
+            table.move_cursor(row=0)
+            await pilot.pause()
+
+            await pilot.press("space")
+            key = next(iter(table.marked))
+
+            # A changed version string is written to the cell that holds the mark
+            original_row = RuntimeTable._runtime_row
+            with patch.object(
+                RuntimeTable,
+                "_runtime_row",
+                staticmethod(lambda install: ("9.9.9", *original_row(install)[1:])),
+            ):
+                table.apply_runtimes(list(table._runtime_catalogue.values()))
+            await pilot.pause()
+
+            assert table.get_row(key)[0] == f"{table.MARK} 9.9.9"
+
+
+async def test_failed_uninstall_reloads_and_reports(runtimes, patch_list_installs):
+    failing = MagicMock()
+    failing.uninstall_listings.return_value = [
+        ([MagicMock(key="a")], subprocess.CompletedProcess([], returncode=1, stdout="", stderr="partial failure"))
+    ]
+    broken = MagicMock()
+    broken.uninstall_listings.side_effect = subprocess.CalledProcessError(1, ["uv"])
+
+    def fake_listing(install, manager):
+        listing = MagicMock()
+        listing.key = install.executable
+        listing.manager = manager
+        return listing
+
+    with (
+        patch("ducktools.pytui.ui.get_managers", return_value=[failing, broken]),
+        patch("ducktools.pytui.ui.find_matching_listings") as fake_find,
+    ):
+        fake_find.side_effect = lambda installs, on_error=None: [
+            fake_listing(inst, manager) for inst, manager in zip(installs, [failing, broken])
+        ]
+
+        app = ManagerApp()
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            table = app._runtime_table
+            app.set_focus(table)
+            table.move_cursor(row=0)
+            await pilot.pause()
+
+            await pilot.press("space", "space")
+            reloads = patch_list_installs.call_count
+            await pilot.press("delete")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            # The app keeps running and reloads after a batch that ran but failed
+            assert app.is_running
+            assert patch_list_installs.call_count == reloads + 1
+            titles = [n.title for n in app._notifications]
+            assert "Failed Uninstall" in titles
+            assert "Runtime Manager Error" in titles
@@ -0,0 +1,235 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import sys
+import threading
+import time
+
+from unittest.mock import MagicMock, patch
+
+from ducktools.pytui.ui import ManagerApp, RuntimeInstallScreen
+
+
+def fake_listing(version):
+    listing = MagicMock()
+    listing.version = version
+    listing.manager.organisation = "Astral"
+    listing.implementation = "cpython"
+    listing.variant = "default"
+    listing.arch = "x86_64"
+    listing.full_key = f"UVPythonListing / cpython-{version}"
+    return listing
+
+
+async def wait_for(pilot, condition, timeout=5):
+    start = time.perf_counter()
+    while not condition():
+        assert time.perf_counter() - start < timeout, "Timed out"
+        await pilot.pause(0.01)
+
+
+async def test_install_screen_loads_in_background(patch_fetch_downloads):
+    release = threading.Event()
+    listings = [fake_listing("3.13.1"), fake_listing("3.12.8")]
+
+    def slow_downloads(refresh=False, cache_ttl=None, on_error=None, all_versions=False):
+        release.wait(5)
+        return listings
+
+    patch_fetch_downloads.side_effect = slow_downloads
+
+    app = ManagerApp()
+    async with app.run_test() as pilot:
+        screen = RuntimeInstallScreen()
+        app.push_screen(screen)
+        await pilot.pause()
+
+        # The screen is shown and the UI keeps running while the list loads
+        assert app.screen is screen
+        assert screen.install_table.loading
+
+        release.set()
+        await wait_for(pilot, lambda: not screen.install_table.loading)
+        assert screen.install_table.row_count == 2
+        assert screen.runtimes_by_key[listings[0].full_key] is listings[0]
+
+
+async def test_downloads_prefetched_after_mount(patch_fetch_downloads):
+    listings = [fake_listing("3.13.1")]
+    patch_fetch_downloads.return_value = listings
+
+    with (
+        patch("ducktools.pytui.ui.get_managers", return_value=[MagicMock()]),
+        patch.object(ManagerApp, "DOWNLOAD_PREFETCH_DELAY", 0.01),
+    ):
+        app = ManagerApp()
+        async with app.run_test() as pilot:
+            await wait_for(pilot, lambda: app._prefetched_downloads is not None)
+            assert app._prefetched_downloads == listings
+
+            screen = RuntimeInstallScreen(runtimes=app._prefetched_downloads)
+            app.push_screen(screen)
+            await pilot.pause()
+
+            # Populated from the prefetch before the screen's own load completes
+            assert screen.install_table.row_count == 1
+
+
+async def test_install_screen_reports_failed_manager(patch_fetch_downloads):
+    listings = [fake_listing("3.13.1")]
+    broken = MagicMock()
+    broken.organisation = "Broken"
+
+    def partial_downloads(refresh=False, cache_ttl=None, on_error=None, all_versions=False):
+        on_error(broken, OSError("manager unavailable"))
+        return listings
+
+    patch_fetch_downloads.side_effect = partial_downloads
+
+    app = ManagerApp()
+    async with app.run_test() as pilot:
+        screen = RuntimeInstallScreen()
+        app.push_screen(screen)
+        await wait_for(pilot, lambda: not screen.install_table.loading)
+        await pilot.pause()
+
+        # Listings from the working manager are still shown
+        assert screen.install_table.row_count == 1
+        messages = [n.message for n in app._notifications]
+        assert any("Broken" in m and "manager unavailable" in m for m in messages)
+
+
+async def test_install_progress_cancel():
+    from ducktools.pytui.ui import InstallProgressScreen
+
+    listing = fake_listing("3.13.1")
+    listing.key = "cpython-3.13.1"
+    listing.install_command.return_value = [
+        sys.executable, "-c", "import time; print('downloading', flush=True); time.sleep(30)"
+    ]
+    listing.path = None
+    listing.manager.installed_index.return_value.by_key = {}
+
+    app = ManagerApp()
+    async with app.run_test() as pilot:
+        results = []
+        screen = InstallProgressScreen([listing])
+        app.push_screen(screen, callback=results.append)
+
+        await wait_for(pilot, lambda: any("downloading" in line for line in screen.output_log.lines))
+        await pilot.press("escape")
+        await wait_for(pilot, lambda: screen.finished, timeout=10)
+
+        # Output and the partial state stay visible until closed
+        [result] = screen.results
+        assert result.cancelled
+        assert not result.installed
+        assert "was not installed" in screen.output_log.lines[-1]
+
+        await pilot.press("enter")
+        await pilot.pause()
+        assert results == [screen.results]
+
+
+async def test_install_screen_marks_runtimes(patch_fetch_downloads):
+    listings = [fake_listing(v) for v in ("3.13.1", "3.12.8", "3.11.11")]
+    patch_fetch_downloads.return_value = listings
+
+    app = ManagerApp()
+    async with app.run_test() as pilot:
+        results = []
+        screen = RuntimeInstallScreen(runtimes=listings)
+        app.push_screen(screen, callback=results.append)
+        await pilot.pause()
+        screen.set_focus(screen.install_table)
+
+        # Mark the first and third runtimes
+        await pilot.press("space", "down", "space")
+        await pilot.pause()
+        assert screen.install_table.marked_runtimes == [listings[0], listings[2]]
+        assert screen.box.border_subtitle == "2 marked"
+
+        await pilot.press("enter")
+        await pilot.pause()
+        assert results == [[listings[0], listings[2]]]
+
+
+async def test_install_screen_filters_and_all_versions(patch_fetch_downloads):
+    def make_listing(version, implementation):
+        listing = fake_listing(version)
+        listing.implementation = implementation
+        listing.full_key = f"UVPythonListing / {implementation}-{version}"
+        listing.path = None
+        return listing
+
+    latest = [make_listing("3.13.1", "cpython"), make_listing("3.12.8", "cpython")]
+    every = [
+        *latest,
+        make_listing("3.13.0", "cpython"),
+        make_listing("3.12.7", "cpython"),
+        make_listing("3.10.16", "pypy"),
+    ]
+
+    def downloads(refresh=False, cache_ttl=None, on_error=None, all_versions=False):
+        return every if all_versions else latest
+
+    patch_fetch_downloads.side_effect = downloads
+
+    app = ManagerApp()
+    async with app.run_test() as pilot:
+        screen = RuntimeInstallScreen()
+        app.push_screen(screen)
+        await wait_for(pilot, lambda: screen.install_table.row_count == 2)
+
+        await pilot.press("ctrl+t")
+        await wait_for(pilot, lambda: screen.install_table.row_count == 5)
+        assert patch_fetch_downloads.call_args.kwargs["all_versions"] is True
+
+        # Only the matching rows are put in the table
+        await pilot.press("ctrl+f", "3", ".", "1", "3")
+        await wait_for(pilot, lambda: screen.install_table.row_count == 2)
+        assert [r.version for r in screen.install_table.runtimes] == ["3.13.1", "3.13.0"]
+
+        await pilot.press("backspace", "backspace", "backspace")
+        screen.facet_filters["implementation"].value = "pypy"
+        await wait_for(pilot, lambda: screen.install_table.row_count == 1)
+
+        # Enter in the filter bar moves back to the table rather than installing
+        await pilot.press("ctrl+f", "enter")
+        await pilot.pause()
+        assert app.screen is screen
+        assert screen.focused is screen.install_table
+
+
+async def test_install_screen_limits_rows(patch_fetch_downloads):
+    listings = [fake_listing(f"3.{i // 100}.{i % 100}") for i in range(30)]
+    patch_fetch_downloads.return_value = listings
+
+    app = ManagerApp()
+    with patch.object(RuntimeInstallScreen, "MAX_ROWS", 10):
+        async with app.run_test() as pilot:
+            screen = RuntimeInstallScreen()
+            app.push_screen(screen)
+            await wait_for(pilot, lambda: screen.install_table.row_count == 10)
+            assert screen.box.border_subtitle == "showing 10 of 30, filter to see more"
@@ -0,0 +1,61 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from ducktools.pytui.ui import ManagerApp
+
+
+def _bound_actions(app):
+    return {b.binding.action for b in app.screen.active_bindings.values()}
+
+
+async def test_manager_bindings_hidden_without_managers():
+    with patch("ducktools.pytui.ui.get_managers") as fake_managers:
+        fake_managers.return_value = []
+
+        app = ManagerApp()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            app.set_focus(app._runtime_table)
+            await pilot.pause()
+
+            fake_managers.assert_called_once()
+            assert "app.install_runtime" not in _bound_actions(app)
+            assert "app.uninstall_runtime" not in _bound_actions(app)
+
+
+async def test_manager_bindings_added_after_detection():
+    with patch("ducktools.pytui.ui.get_managers") as fake_managers:
+        fake_managers.return_value = [MagicMock()]
+
+        app = ManagerApp()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            app.set_focus(app._runtime_table)
+            await pilot.pause()
+
+            fake_managers.assert_called_once()
+            assert "app.install_runtime" in _bound_actions(app)
+            assert "app.uninstall_runtime" in _bound_actions(app)
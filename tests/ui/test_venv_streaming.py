@@ -0,0 +1,140 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import threading
+import time
+
+from unittest.mock import patch
+
+from ducktools.pytui.ui import ManagerApp
+
+
+async def test_venv_rows_shown_before_scan_completes(local_venvs, patched_config):
+    release = threading.Event()
+
+    def slow_venvs(base_dir=None, recursive=False, search_parent_folders=False, limits=None):
+        if base_dir == patched_config.global_venv_folder:
+            return
+        first, *rest = local_venvs
+        yield first
+        release.wait(5)
+        yield from rest
+
+    with patch("ducktools.pytui.ui.iter_venvs", side_effect=slow_venvs):
+        app = ManagerApp()
+        async with app.run_test() as pilot:
+            table = app._venv_table
+
+            start = time.perf_counter()
+            while table.row_count == 0 and time.perf_counter() - start < 5:
+                await pilot.pause(0.01)
+
+            # The first venv is shown while the scan is still running
+            assert table.row_count == 1
+            assert not table.loading
+
+            release.set()
+            start = time.perf_counter()
+            while table.row_count < len(local_venvs) and time.perf_counter() - start < 5:
+                await pilot.pause(0.01)
+
+            await app.workers.wait_for_complete()
+            assert table.row_count == len(local_venvs)
+
+
+async def test_escape_cancels_scan(local_venvs, patched_config):
+    def cancellable_venvs(base_dir=None, recursive=False, search_parent_folders=False, limits=None):
+        if base_dir == patched_config.global_venv_folder:
+            return
+        yield local_venvs[0]
+        if limits.cancel_event.wait(5):
+            limits.incomplete = True
+            return
+        yield from local_venvs[1:]
+
+    with patch("ducktools.pytui.ui.iter_venvs", side_effect=cancellable_venvs):
+        app = ManagerApp()
+        async with app.run_test() as pilot:
+            table = app._venv_table
+
+            start = time.perf_counter()
+            while table.row_count == 0 and time.perf_counter() - start < 5:
+                await pilot.pause(0.01)
+
+            table.focus()
+            await pilot.press("escape")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            # Rows found before cancelling are kept and marked as incomplete
+            assert table.row_count == 1
+            assert table.border_subtitle == "Incomplete scan"
+            assert not table.check_action("cancel_scan", ())
+
+
+async def test_new_scan_keeps_loading_state(local_venvs, patched_config):
+    release = threading.Event()
+    calls = []
+
+    def blocking_venvs(base_dir=None, recursive=False, search_parent_folders=False, limits=None):
+        if base_dir == patched_config.global_venv_folder:
+            return
+        calls.append(limits)
+        # Stop when cancelled, or once released for the second scan
+        while not (limits.cancel_event.is_set() or release.is_set()):
+            time.sleep(0.01)
+        if limits.cancel_event.is_set():
+            limits.incomplete = True
+            return
+        yield from local_venvs
+
+    with patch("ducktools.pytui.ui.iter_venvs", side_effect=blocking_venvs):
+        app = ManagerApp()
+        async with app.run_test() as pilot:
+            table = app._venv_table
+
+            start = time.perf_counter()
+            while not calls and time.perf_counter() - start < 5:
+                await pilot.pause(0.01)
+
+            # A second scan cancels the first one
+            table.load_venvs(full_search=True, clear_first=True)
+
+            start = time.perf_counter()
+            while len(calls) < 2 and time.perf_counter() - start < 5:
+                await pilot.pause(0.01)
+            await pilot.pause(0.05)
+
+            # The cancelled scan must not reset the state of the running one
+            assert table.loading
+            assert table.border_subtitle is None
+            assert table.check_action("cancel_scan", ())
+
+            release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert not table.loading
+            assert table.row_count == len(local_venvs)
+            assert not table.check_action("cancel_scan", ())
@@ -0,0 +1,49 @@
+# ducktools-pytui
+# MIT License
+#
+# Copyright (c) 2025 David C Ellis
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+from ducktools.pytui.ui import ManagerApp
+
+
+async def test_watched_changes_update_single_rows(local_venvs):
+    app = ManagerApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await app.workers.wait_for_complete()
+        table = app._venv_table
+        row_count = table.row_count
+
+        removed = local_venvs[0]
+        table.apply_watched_change(removed.folder, None)
+        await pilot.pause()
+        assert table.row_count == row_count - 1
+        assert removed.folder not in table._venv_catalogue
+
+        table.apply_watched_change(removed.folder, removed)
+        await pilot.pause()
+        assert table.row_count == row_count
+        assert table.venv_from_key(removed.folder) == removed
+
+        # Unchanged venvs are ignored
+        table.apply_watched_change(removed.folder, removed)
+        assert table.row_count == row_count
@@ -93,6 +93,7 @@ def test_fetch_installed(pymanager_executable):
             capture_output=True,
             text=True,
             check=True,
+            timeout=PythonCoreManager.query_timeout,
         )
 
         expected = [
@@ -129,6 +130,7 @@ def test_fetch_downloads(pymanager_executable, pymanager_installed_pythons):
             capture_output=True,
             text=True,
             check=True,
+            timeout=PythonCoreManager.query_timeout,
         )
 
         # Check values have been filtered
@@ -184,3 +186,48 @@ def test_install(pymanager_executable):
             capture_output=True,
             text=True,
         )
+
+
+def test_will_overwrite_uses_installed_snapshot(pymanager_executable):
+    with patch("subprocess.run") as fake_process:
+        cmd_output = MagicMock()
+        cmd_output.stdout = pymanager_download_json()
+        fake_process.return_value = cmd_output
+
+        manager = PythonCoreManager()
+        downloads = manager._get_download_cache()
+
+        cmd_output.stdout = pymanager_install_json()
+        fake_process.reset_mock()
+
+        # Checking every listing only queries the installed runtimes once
+        for listing in downloads:
+            listing.will_overwrite
+        manager.fetch_downloads()
+        fake_process.assert_called_once()
+
+        manager.invalidate_installed()
+        downloads[0].will_overwrite
+        assert fake_process.call_count == 2
+
+
+def test_installed_list_invalidated_by_runtime_folder(pymanager_executable, tmp_path, monkeypatch):
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+    (tmp_path / "Python").mkdir()
+
+    with patch("subprocess.run") as fake_process:
+        cmd_output = MagicMock()
+        cmd_output.stdout = pymanager_install_json()
+        fake_process.return_value = cmd_output
+
+        manager = PythonCoreManager()
+        assert manager.runtime_folder == str(tmp_path / "Python")
+
+        manager.fetch_installed()
+        manager.fetch_installed()
+        assert fake_process.call_count == 1
+
+        # A runtime installed outside of pytui changes the folder mtime
+        (tmp_path / "Python" / "pythoncore-3.14-64").mkdir()
+        manager.fetch_installed()
+        assert fake_process.call_count == 2